@@ -0,0 +1,133 @@
+"""Report queries and rows read to list trainings, by page size.
+
+Run with: python -m benchmarks.queries
+"""
+from typing import Callable, List, Tuple
+
+from sqlalchemy import Engine, create_engine, event
+from sqlalchemy.orm import Session, immediateload, joinedload
+
+from trainings.database.data import (
+    get_exercises, get_training_difficulties, get_training_types
+)
+from trainings.database.loaders import TRAINING_DETAIL
+from trainings.database.models import (
+    Base,
+    Exercise,
+    Training,
+    TrainingExercise,
+    UserRatesTraining,
+)
+from trainings.trainings.dto import TrainingFilters
+from trainings.trainings.non_bread_queries import search
+
+TRAININGS = 200
+EXERCISES_PER_TRAINING = 6
+RATINGS_PER_TRAINING = 5
+PAGE_SIZES = (10, 50, 100)
+
+
+def create_session() -> Session:
+    """Return a session to an in memory database with trainings."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = Session(bind=engine)
+    session.add_all(
+        get_training_types() + get_training_difficulties() + get_exercises()
+    )
+    for training_id in range(1, TRAININGS + 1):
+        session.add(
+            Training(
+                id=training_id,
+                trainer_id="trainer",
+                title=f"Training {training_id}",
+                description="Description",
+                type_id=1,
+                difficulty_id=1,
+            )
+        )
+        session.add_all(
+            TrainingExercise(
+                training_id=training_id,
+                exercise_id=number + 1,
+                count=10,
+                series=1,
+            )
+            for number in range(EXERCISES_PER_TRAINING)
+        )
+        session.add_all(
+            UserRatesTraining(user_id=user_id, training_id=training_id)
+            for user_id in range(RATINGS_PER_TRAINING)
+        )
+    session.commit()
+    session.expunge_all()
+    return session
+
+
+def measure(engine: Engine, run: Callable[[], object]) -> Tuple[int, int]:
+    """Return how many queries run executed and how many rows they read."""
+    statements: List[Tuple[str, object]] = []
+
+    def before_cursor_execute(*args):
+        statements.append((args[2], args[3]))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        run()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    connection = engine.raw_connection()
+    try:
+        rows = sum(
+            connection.cursor().execute(
+                f"SELECT count(*) FROM ({statement})", parameters
+            ).fetchone()[0]
+            for statement, parameters in statements
+        )
+    finally:
+        connection.close()
+    return len(statements), rows
+
+
+def model_joined(session: Session, limit: int) -> Callable[[], object]:
+    """List like model level joined relationships with immediate ratings."""
+    return lambda: session.query(Training).options(
+        joinedload(Training.type),
+        joinedload(Training.difficulty),
+        joinedload(Training.exercises)
+        .joinedload(TrainingExercise.exercise)
+        .joinedload(Exercise.type),
+        immediateload(Training.ratings),
+    ).order_by(Training.id).limit(limit).all()
+
+
+def detail_options(session: Session, limit: int) -> Callable[[], object]:
+    """List with the per query loader options of a training detail."""
+    return lambda: session.query(Training).options(*TRAINING_DETAIL)\
+        .order_by(Training.id).limit(limit).all()
+
+
+def columns(session: Session, limit: int) -> Callable[[], object]:
+    """List with the column projection read model, as GET /trainings."""
+    return lambda: search(session, TrainingFilters(offset=0, limit=limit))
+
+
+def main() -> None:
+    """Print queries and rows of each strategy for each page size."""
+    session = create_session()
+    engine = session.get_bind()
+    strategies = (
+        ("joined, immediate ratings", model_joined),
+        ("per query options", detail_options),
+        ("column projection", columns),
+    )
+    print(f"{'strategy':<26} {'page':>5} {'queries':>8} {'rows':>6}")  # noqa
+    for name, strategy in strategies:
+        for limit in PAGE_SIZES:
+            session.expunge_all()
+            queries, rows = measure(engine, strategy(session, limit))
+            print(f"{name:<26} {limit:>5} {queries:>8} {rows:>6}")  # noqa
+
+
+if __name__ == "__main__":
+    main()
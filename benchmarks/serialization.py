@@ -0,0 +1,105 @@
+"""Compare CPU time to serialize a page of 50 trainings.
+
+Run with: python -m benchmarks.serialization
+"""
+import asyncio
+import time
+from typing import Callable, List
+
+from fastapi.routing import serialize_response
+from fastapi.utils import create_response_field
+
+from trainings.serialization import dump_fast, dump_model, orjson
+from trainings.trainings.cache import serialize_page
+from trainings.trainings.dto import (
+    Exercise,
+    TrainingOut,
+    TrainingsWithPagination,
+)
+
+PAGE_SIZE = 50
+ROUNDS = 200
+LOOP = asyncio.new_event_loop()
+FIELD = create_response_field(name="response", type_=TrainingsWithPagination)
+
+
+def get_page() -> List[TrainingOut]:
+    """Return a page of trainings with exercises and some media."""
+    return [
+        TrainingOut(
+            id=training_id,
+            trainer_id="Ju6JXm1S8rVQfyC18mqL418JdgE2",
+            title=f"Training {training_id}",
+            description="Warm up, run and stretch. " * 4,
+            type="Cardio",
+            difficulty="Easy",
+            media="https://tenor.com/bhDEJ.gif",
+            rating=4,
+            blocked=False,
+            exercises=[
+                Exercise(
+                    name="Run",
+                    type="Cardio",
+                    unit="second" if number % 2 else None,
+                    count=60,
+                    series=number % 3 or None,
+                )
+                for number in range(8)
+            ],
+        )
+        for training_id in range(PAGE_SIZE)
+    ]
+
+
+def response_model(trainings: List[TrainingOut]) -> bytes:
+    """Validate and encode again through response_model, then render."""
+    content = LOOP.run_until_complete(
+        serialize_response(
+            field=FIELD,
+            response_content=TrainingsWithPagination(
+                items=trainings, offset=0, limit=PAGE_SIZE, count=PAGE_SIZE
+            ),
+            exclude_none=True,
+        )
+    )
+    return TrainingsWithPagination.__config__.json_dumps(content).encode()
+
+
+def once(encode: Callable) -> Callable[[List[TrainingOut]], bytes]:
+    """Serialize each training once with encode and join them."""
+    return lambda trainings: serialize_page(
+        [encode(training) for training in trainings],
+        0,
+        PAGE_SIZE,
+        PAGE_SIZE,
+        None,
+    )
+
+
+def measure(serialize: Callable[[List[TrainingOut]], bytes]) -> float:
+    """Return CPU milliseconds to serialize a page."""
+    trainings = get_page()
+    serialize(trainings)
+    start = time.process_time()
+    for _ in range(ROUNDS):
+        serialize(trainings)
+    return (time.process_time() - start) * 1000 / ROUNDS
+
+
+def main() -> None:
+    """Print CPU time per page of each path."""
+    baseline = measure(response_model)
+    print(f"response_model: {baseline:.2f} ms per page")  # noqa: T201
+    encoders = [("pydantic json", dump_model)]
+    if orjson is not None:
+        encoders.append(("orjson", dump_fast))
+    for name, encode in encoders:
+        elapsed = measure(once(encode))
+        print(  # noqa: T201
+            f"{name}: {elapsed:.2f} ms per page, "
+            f"{baseline - elapsed:.2f} ms saved"
+        )
+
+
+if __name__ == "__main__":
+    main()
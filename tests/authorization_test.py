@@ -1,12 +1,54 @@
 # pylint: disable= missing-module-docstring, missing-function-docstring
-from unittest.mock import MagicMock
+import asyncio
+import json
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
 from fastapi import HTTPException
+from httpx import ConnectTimeout
+from jwt.algorithms import RSAAlgorithm
 from pytest import raises
 
 from trainings.authorization import (
-    assert_can_create_training, get_permissions
+    CredentialsCache,
+    TokenVerifier,
+    assert_can_create_training,
+    create_async_http_client,
+    create_http_client,
+    get_permissions,
+    get_permissions_async,
+    verify_permissions,
 )
 
+PRIVATE_KEY = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+OTHER_PRIVATE_KEY = rsa.generate_private_key(
+    public_exponent=65537, key_size=2048
+)
+PUBLIC_KEY = PRIVATE_KEY.public_key().public_bytes(
+    serialization.Encoding.PEM,
+    serialization.PublicFormat.SubjectPublicKeyInfo,
+).decode("utf-8")
+
+
+def get_token_config_stub(**auth):
+    config_stub = MagicMock()
+    config_stub.auth.algorithms = "RS256"
+    config_stub.auth.audience = ""
+    config_stub.auth.issuer = ""
+    config_stub.auth.role_claim = "role"
+    config_stub.auth.public_key = PUBLIC_KEY
+    config_stub.auth.jwks = ""
+    config_stub.auth.jwks_ttl = 300
+    for name, value in auth.items():
+        setattr(config_stub.auth, name, value)
+    return config_stub
+
+
+def sign(claims, key=PRIVATE_KEY, headers=None):
+    return "Bearer " + jwt.encode(claims, key, "RS256", headers=headers)
+
 
 def test_when_external_auth_service_returns_credentials_expect_them():
     # Setup data and expectations
@@ -63,6 +105,205 @@ def test_when_response_raises_expect_error():
         get_permissions(MagicMock(), client_spy, MagicMock())
 
 
+def test_when_external_auth_service_times_out_expect_503():
+    client_spy = MagicMock()
+    client_spy.get = MagicMock(side_effect=ConnectTimeout("Boom!"))
+    # Exercise
+    with raises(HTTPException) as error:
+        get_permissions(MagicMock(), client_spy, MagicMock())
+    assert error.value.status_code == 503
+
+
+def test_when_getting_permissions_async_expect_credentials():
+    expected_credentials = {"role": "admin"}
+    response = MagicMock()
+    response.status_code = 200
+    response.json = MagicMock(return_value={"data": expected_credentials})
+    headers_stub = MagicMock(**{"get.return_value": "banana"})
+    config_stub = MagicMock(**{"auth.host": "auth"})
+    client_spy = MagicMock()
+    client_spy.get = AsyncMock(return_value=response)
+    # Exercise
+    permissions = asyncio.run(
+        get_permissions_async(headers_stub, client_spy, config_stub)
+    )
+    # Assert
+    assert permissions == expected_credentials
+    client_spy.get.assert_awaited_once_with(
+        "http://auth/auth/credentials", headers={"Authorization": "banana"}
+    )
+
+
+def test_when_creating_http_clients_expect_config_timeouts():
+    config_stub = MagicMock(**{
+        "auth.pool_size": 3,
+        "auth.connect_timeout": 0.5,
+        "auth.read_timeout": 2.0,
+    })
+    with create_http_client(config_stub) as client:
+        assert client.timeout.connect == 0.5
+        assert client.timeout.read == 2.0
+    async_client = create_async_http_client(config_stub)
+    assert async_client.timeout.connect == 0.5
+    asyncio.run(async_client.aclose())
+
+
+def get_client_spy(status_code: int) -> MagicMock:
+    response = MagicMock()
+    response.status_code = status_code
+    response.json = MagicMock(return_value={"data": {"role": "user"}})
+    return MagicMock(**{"get.return_value": response})
+
+
+def test_when_credentials_are_cached_expect_one_auth_service_call():
+    cache = CredentialsCache(max_size=10, ttl=60, negative_ttl=5)
+    headers_stub = MagicMock(**{"get.return_value": "banana"})
+    client_spy = get_client_spy(200)
+    # Exercise
+    first = get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    second = get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    # Assert
+    assert first == second == {"role": "user"}
+    client_spy.get.assert_called_once()
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_when_credentials_are_for_other_token_expect_auth_service_call():
+    cache = CredentialsCache(max_size=10, ttl=60, negative_ttl=5)
+    client_spy = get_client_spy(200)
+    for token in ["banana", "apple"]:
+        headers_stub = MagicMock(**{"get.return_value": token})
+        get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    assert client_spy.get.call_count == 2
+
+
+@patch("trainings.cache.time.monotonic")
+def test_when_credentials_are_rejected_expect_error_cached_shortly(
+    monotonic_stub: MagicMock,
+):
+    monotonic_stub.return_value = 100
+    cache = CredentialsCache(max_size=10, ttl=60, negative_ttl=5)
+    headers_stub = MagicMock(**{"get.return_value": "banana"})
+    client_spy = get_client_spy(401)
+    for _ in range(2):
+        with raises(HTTPException) as error:
+            get_permissions(headers_stub, client_spy, MagicMock(), cache)
+        assert error.value.status_code == 401
+    client_spy.get.assert_called_once()
+    monotonic_stub.return_value = 105
+    with raises(HTTPException):
+        get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    assert client_spy.get.call_count == 2
+
+
+def test_when_negative_ttl_is_zero_expect_rejection_not_cached():
+    cache = CredentialsCache(max_size=10, ttl=60, negative_ttl=0)
+    headers_stub = MagicMock(**{"get.return_value": "banana"})
+    client_spy = get_client_spy(401)
+    for _ in range(3):
+        with raises(HTTPException):
+            get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    assert client_spy.get.call_count == 3
+    assert cache.stats()["entries"] == 0
+
+
+def test_when_auth_service_is_unavailable_expect_error_not_cached():
+    cache = CredentialsCache(max_size=10, ttl=60, negative_ttl=5)
+    headers_stub = MagicMock(**{"get.return_value": "banana"})
+    client_spy = MagicMock(**{"get.side_effect": ConnectTimeout("Boom!")})
+    for _ in range(2):
+        with raises(HTTPException):
+            get_permissions(headers_stub, client_spy, MagicMock(), cache)
+    assert client_spy.get.call_count == 2
+
+
+def test_when_token_is_signed_with_public_key_pair_expect_claims():
+    verifier = TokenVerifier(get_token_config_stub())
+    claims = verifier.verify(sign({"id": 1, "role": "user"}))
+    assert claims == {"id": 1, "role": "user"}
+
+
+def test_when_public_key_has_escaped_new_lines_expect_claims():
+    config_stub = get_token_config_stub(
+        public_key=PUBLIC_KEY.replace("\n", r"\n")
+    )
+    verifier = TokenVerifier(config_stub)
+    assert verifier.verify(sign({"role": "user"}))["role"] == "user"
+
+
+def test_when_token_is_signed_with_another_key_expect_error():
+    verifier = TokenVerifier(get_token_config_stub())
+    with raises(HTTPException) as error:
+        verifier.verify(sign({"role": "user"}, OTHER_PRIVATE_KEY))
+    assert error.value.status_code == 403
+
+
+def test_when_token_is_expired_expect_error():
+    verifier = TokenVerifier(get_token_config_stub())
+    with raises(HTTPException) as error:
+        verifier.verify(sign({"role": "user", "exp": int(time.time()) - 60}))
+    assert error.value.status_code == 403
+
+
+def test_when_token_has_no_role_expect_error():
+    verifier = TokenVerifier(get_token_config_stub())
+    with raises(HTTPException) as error:
+        verifier.verify(sign({"id": 1}))
+    assert error.value.status_code == 403
+
+
+def test_when_role_claim_is_configured_expect_role_from_it():
+    verifier = TokenVerifier(get_token_config_stub(role_claim="fiufit_role"))
+    claims = verifier.verify(sign({"fiufit_role": "user"}))
+    assert claims["role"] == "user"
+
+
+def test_when_audience_does_not_match_expect_error():
+    verifier = TokenVerifier(get_token_config_stub(audience="trainings"))
+    with raises(HTTPException):
+        verifier.verify(sign({"role": "user", "aud": "users"}))
+    claims = verifier.verify(sign({"role": "user", "aud": "trainings"}))
+    assert claims["role"] == "user"
+
+
+def test_when_token_key_is_in_jwks_file_expect_claims(tmp_path):
+    jwks_path = tmp_path / "jwks.json"
+    keys = []
+    for key_id, key in (("one", OTHER_PRIVATE_KEY), ("two", PRIVATE_KEY)):
+        jwk = json.loads(RSAAlgorithm.to_jwk(key.public_key()))
+        keys.append(jwk | {"kid": key_id, "alg": "RS256", "use": "sig"})
+    jwks_path.write_text(json.dumps({"keys": keys}), encoding="utf-8")
+    verifier = TokenVerifier(
+        get_token_config_stub(public_key="", jwks=str(jwks_path))
+    )
+    token = sign({"role": "user"}, headers={"kid": "two"})
+    assert verifier.verify(token)["role"] == "user"
+    with raises(HTTPException):
+        verifier.verify(sign({"role": "user"}, headers={"kid": "three"}))
+
+
+def test_when_jwks_url_is_unreachable_expect_service_unavailable():
+    verifier = TokenVerifier(
+        get_token_config_stub(jwks="http://auth-service/jwks.json")
+    )
+    client_stub = MagicMock()
+    client_stub.get_signing_key_from_jwt.side_effect =\
+        jwt.PyJWKClientConnectionError("Boom!")
+    verifier.jwks_client = client_stub
+    with raises(HTTPException) as error:
+        verifier.verify(sign({"role": "user"}))
+    assert error.value.status_code == 503
+
+
+def test_when_verifying_permissions_without_header_expect_error():
+    verifier = TokenVerifier(get_token_config_stub())
+    headers_stub = MagicMock(**{"get.return_value": None})
+    with raises(HTTPException) as error:
+        verify_permissions(headers_stub, verifier)
+    assert error.value.status_code == 403
+
+
 def test_when_admin_creates_training_expect_error():
     with raises(HTTPException):
         assert_can_create_training({"role": "admin"})
@@ -0,0 +1,169 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from unittest.mock import MagicMock, patch
+from pytest import raises
+
+from tests.util.fake_redis import FakeRedis
+
+from trainings.cache import (
+    LRUCache, LocalBackend, RedisBackend, create_backend
+)
+
+
+def test_when_getting_missing_key_expect_default_and_miss():
+    cache = LRUCache(max_size=2)
+    assert cache.get("a") is None
+    assert cache.get("a", "default") == "default"
+    assert cache.stats()["misses"] == 2
+
+
+def test_when_getting_cached_key_expect_value_and_hit():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    assert cache.get("a") == 1
+    assert cache.stats()["hits"] == 1
+
+
+def test_when_cache_is_full_expect_least_recently_used_evicted():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.stats()["evictions"] == 1
+
+
+def test_when_cache_is_bounded_by_size_expect_size_respected():
+    cache = LRUCache(max_size=10, sizeof=len)
+    cache.set("a", "12345")
+    cache.set("b", "12345")
+    cache.set("c", "123")
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 8
+    assert len(cache) == 2
+
+
+def test_when_value_is_bigger_than_cache_expect_not_cached():
+    cache = LRUCache(max_size=4, sizeof=len)
+    cache.set("a", "12345")
+    assert cache.get("a") is None
+    assert cache.stats()["size"] == 0
+
+
+def test_when_replacing_value_expect_size_updated():
+    cache = LRUCache(max_size=10, sizeof=len)
+    cache.set("a", "12345")
+    cache.set("a", "12")
+    assert cache.get("a") == "12"
+    assert cache.stats()["size"] == 2
+
+
+@patch("trainings.cache.time.monotonic")
+def test_when_entry_expires_expect_miss(monotonic_stub):
+    monotonic_stub.return_value = 100
+    cache = LRUCache(max_size=2, ttl=10)
+    cache.set("a", 1)
+    monotonic_stub.return_value = 109
+    assert cache.get("a") == 1
+    monotonic_stub.return_value = 110
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+def test_when_invalidating_key_expect_it_removed():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    assert cache.invalidate("a")
+    assert not cache.invalidate("a")
+    assert cache.get("a") is None
+
+
+def test_when_clearing_expect_empty_cache():
+    cache = LRUCache(max_size=2)
+    cache.set("a", 1)
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.stats()["size"] == 0
+
+
+@patch("trainings.cache.time.monotonic")
+def test_when_entry_has_own_ttl_expect_it_to_override_cache_ttl(
+    monotonic_stub
+):
+    monotonic_stub.return_value = 100
+    cache = LRUCache(max_size=2, ttl=10)
+    cache.set("a", 1, ttl=1)
+    cache.set("b", 2)
+    monotonic_stub.return_value = 101
+    assert cache.get("a") is None
+    assert cache.get("b") == 2
+
+
+def test_when_local_backend_stores_bytes_expect_them():
+    backend = LocalBackend(max_size=10)
+    backend.set("a", b"12345", ttl=None)
+    assert backend.get("a") == b"12345"
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_when_local_backend_is_full_expect_bytes_bounded():
+    backend = LocalBackend(max_size=10)
+    backend.set("a", b"123456", ttl=None)
+    backend.set("b", b"123456", ttl=None)
+    assert backend.get("a") is None
+    assert backend.get("b") == b"123456"
+
+
+def test_when_redis_backend_stores_bytes_expect_prefixed_key_and_ttl():
+    client = FakeRedis()
+    backend = RedisBackend(client, prefix="test:")
+    backend.set("a", b"12345", ttl=30)
+    assert client.values == {"test:a": b"12345"}
+    assert client.expirations == {"test:a": 30}
+    assert backend.get("a") == b"12345"
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_when_redis_backend_has_no_ttl_expect_no_expiration():
+    client = FakeRedis()
+    RedisBackend(client).set("a", b"12345", ttl=None)
+    assert client.expirations == {"trainings:a": None}
+
+
+def test_when_redis_fails_expect_miss():
+    client = MagicMock()
+    client.get.side_effect = ConnectionError("Boom!")
+    client.set.side_effect = ConnectionError("Boom!")
+    client.delete.side_effect = ConnectionError("Boom!")
+    backend = RedisBackend(client)
+    backend.set("a", b"12345", ttl=None)
+    backend.delete("a")
+    assert backend.get("a") is None
+
+
+def test_when_backend_is_not_configured_expect_local_backend():
+    config_stub = MagicMock()
+    config_stub.cache.backend = "local"
+    assert isinstance(create_backend(config_stub, 10), LocalBackend)
+
+
+@patch("trainings.cache.redis", None)
+def test_when_redis_backend_is_configured_without_redis_expect_error():
+    config_stub = MagicMock()
+    config_stub.cache.backend = "redis"
+    with raises(RuntimeError):
+        create_backend(config_stub, 10)
+
+
+@patch("trainings.cache.redis")
+def test_when_redis_backend_is_configured_expect_redis_backend(redis_mock):
+    config_stub = MagicMock()
+    config_stub.cache.backend = "redis"
+    config_stub.cache.redis_url = "redis://cache:6379/0"
+    backend = create_backend(config_stub, 10)
+    assert isinstance(backend, RedisBackend)
+    redis_mock.Redis.from_url.assert_called_once_with("redis://cache:6379/0")
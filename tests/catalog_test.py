@@ -0,0 +1,24 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from unittest.mock import MagicMock
+
+from trainings.catalog import Catalog
+from trainings.database.reference import ReferenceData
+
+
+def get_data(version: str) -> ReferenceData:
+    return ReferenceData(version, {"Cardio": 1}, {}, {}, [])
+
+
+def test_when_getting_same_version_expect_serialized_once():
+    serialize = MagicMock(return_value=b"[]")
+    catalog = Catalog(serialize)
+    assert catalog.get(get_data("1")) == b"[]"
+    assert catalog.get(get_data("1")) == b"[]"
+    serialize.assert_called_once()
+
+
+def test_when_version_changes_expect_serialized_again():
+    serialize = MagicMock(side_effect=[b"[1]", b"[2]"])
+    catalog = Catalog(serialize)
+    assert catalog.get(get_data("1")) == b"[1]"
+    assert catalog.get(get_data("2")) == b"[2]"
@@ -248,3 +248,177 @@ def test_when_firebase_storagebucket_is_empty_expect_url():
 def test_when_firebase_storagebucket_has_url_expect_bucket_com():
     cnf = to_config(AppConfig)
     assert cnf.firebase.storage_bucket == "bucket.com"
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_firebase_media_workers_is_empty_expect_8():
+    cnf = to_config(AppConfig)
+    assert cnf.firebase.media_workers == 8
+
+
+@patch.dict(environ, {"TRAININGS_FIREBASE_MEDIA_WORKERS": "2"}, clear=True)
+def test_when_firebase_media_workers_is_2_expect_2():
+    cnf = to_config(AppConfig)
+    assert cnf.firebase.media_workers == 2
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_firebase_media_cache_is_empty_expect_64_mib_without_ttl():
+    cnf = to_config(AppConfig)
+    assert cnf.firebase.media_cache_size == 64 * 1024 * 1024
+    assert cnf.firebase.media_cache_ttl == 0
+
+
+@patch.dict(
+    environ,
+    {
+        "TRAININGS_FIREBASE_MEDIA_CACHE_SIZE": "1024",
+        "TRAININGS_FIREBASE_MEDIA_CACHE_TTL": "60",
+    },
+    clear=True
+)
+def test_when_firebase_media_cache_is_set_expect_values():
+    cnf = to_config(AppConfig)
+    assert cnf.firebase.media_cache_size == 1024
+    assert cnf.firebase.media_cache_ttl == 60
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_request_threads_is_empty_expect_40():
+    cnf = to_config(AppConfig)
+    assert cnf.request_threads == 40
+
+
+@patch.dict(environ, {"TRAININGS_REQUEST_THREADS": "8"}, clear=True)
+def test_when_request_threads_is_8_expect_8():
+    cnf = to_config(AppConfig)
+    assert cnf.request_threads == 8
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_db_pool_is_empty_expect_20_plus_20_overflow():
+    cnf = to_config(AppConfig)
+    assert cnf.db.pool_size == 20
+    assert cnf.db.max_overflow == 20
+
+
+@patch.dict(
+    environ,
+    {"TRAININGS_DB_POOL_SIZE": "5", "TRAININGS_DB_MAX_OVERFLOW": "0"},
+    clear=True
+)
+def test_when_db_pool_is_set_expect_values():
+    cnf = to_config(AppConfig)
+    assert cnf.db.pool_size == 5
+    assert cnf.db.max_overflow == 0
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_auth_client_is_not_configured_expect_defaults():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.pool_size == 10
+    assert cnf.auth.connect_timeout == 1.0
+    assert cnf.auth.read_timeout == 5.0
+
+
+@patch.dict(
+    environ,
+    {
+        "TRAININGS_AUTH_POOL_SIZE": "2",
+        "TRAININGS_AUTH_CONNECT_TIMEOUT": "0.5",
+        "TRAININGS_AUTH_READ_TIMEOUT": "3",
+    },
+    clear=True
+)
+def test_when_auth_client_is_configured_expect_values():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.pool_size == 2
+    assert cnf.auth.connect_timeout == 0.5
+    assert cnf.auth.read_timeout == 3.0
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_auth_cache_is_not_configured_expect_defaults():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.cache_ttl == 30
+    assert cnf.auth.cache_negative_ttl == 5
+    assert cnf.auth.cache_size == 1000
+
+
+@patch.dict(environ, {"TRAININGS_AUTH_CACHE_TTL": "0"}, clear=True)
+def test_when_auth_cache_ttl_is_0_expect_0():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.cache_ttl == 0
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_auth_mode_is_not_configured_expect_remote():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.mode == "remote"
+    assert cnf.auth.algorithms == "RS256"
+    assert cnf.auth.role_claim == "role"
+    assert cnf.auth.jwks_ttl == 300
+
+
+@patch.dict(
+    environ,
+    {
+        "TRAININGS_AUTH_MODE": "local",
+        "TRAININGS_AUTH_JWKS": "/etc/fiufit/jwks.json",
+        "TRAININGS_AUTH_AUDIENCE": "trainings",
+    },
+    clear=True
+)
+def test_when_auth_mode_is_local_expect_local():
+    cnf = to_config(AppConfig)
+    assert cnf.auth.mode == "local"
+    assert cnf.auth.jwks == "/etc/fiufit/jwks.json"
+    assert cnf.auth.audience == "trainings"
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_cache_is_not_configured_expect_local_backend():
+    cnf = to_config(AppConfig)
+    assert cnf.cache.backend == "local"
+    assert cnf.cache.training_size == 64 * 1024 * 1024
+    assert cnf.cache.training_ttl == 300
+
+
+@patch.dict(
+    environ,
+    {
+        "TRAININGS_CACHE_BACKEND": "redis",
+        "TRAININGS_CACHE_REDIS_URL": "redis://cache:6379/1",
+    },
+    clear=True
+)
+def test_when_cache_backend_is_redis_expect_redis_url():
+    cnf = to_config(AppConfig)
+    assert cnf.cache.backend == "redis"
+    assert cnf.cache.redis_url == "redis://cache:6379/1"
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_search_cache_is_not_configured_expect_defaults():
+    cnf = to_config(AppConfig)
+    assert cnf.cache.search_size == 4 * 1024 * 1024
+    assert cnf.cache.search_ttl == 30
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_coalescing_timeout_is_not_configured_expect_5():
+    cnf = to_config(AppConfig)
+    assert cnf.coalescing_timeout == 5.0
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_catalog_ages_are_not_configured_expect_300():
+    cnf = to_config(AppConfig)
+    assert cnf.reference_max_age == 300
+    assert cnf.catalog_max_age == 300
+
+
+@patch.dict(environ, {}, clear=True)
+def test_when_fast_json_is_not_configured_expect_false():
+    cnf = to_config(AppConfig)
+    assert not cnf.fast_json
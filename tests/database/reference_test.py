@@ -0,0 +1,142 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event, Lock
+from unittest.mock import MagicMock, patch
+
+from tests.util.data import get_session, init_reference_data
+from trainings.database.models import Exercise
+from trainings.database.reference import (
+    ReferenceData,
+    ReferenceDataRegistry,
+    load,
+)
+
+DATA = ReferenceData("version", {}, {}, {}, [])
+
+
+class CountingLock:
+    """Lock counting threads that tried to take it."""
+
+    def __init__(self):
+        self.lock = Lock()
+        self.attempts = 0
+
+    def __enter__(self):
+        self.attempts += 1
+        self.lock.acquire()
+
+    def __exit__(self, *_):
+        self.lock.release()
+
+
+def test_when_loading_reference_data_expect_names_mapped_to_ids():
+    with get_session(init_reference_data) as session:
+        data = load(session)
+    assert data.types["Arm"] == 3
+    assert data.difficulties["Hard"] == 3
+    assert data.exercises[("Run", "second")] == 4
+    assert data.exercises[("Plank", None)] == 82
+    assert list(data.types)[:3] == ["Cardio", "Leg", "Arm"]
+    assert data.exercise_rows[3] == ("Run", "Cardio", "second")
+
+
+def test_when_loading_same_data_twice_expect_same_version():
+    with get_session(init_reference_data) as session:
+        assert load(session).version == load(session).version
+
+
+def test_when_exercises_change_expect_different_version():
+    with get_session(init_reference_data) as session:
+        version = load(session).version
+        session.add(Exercise(id=90, name="Swim", type_id=1, unit="metre"))
+        session.commit()
+        assert load(session).version != version
+
+
+@patch("trainings.database.reference.load", wraps=load)
+def test_when_looking_up_names_expect_one_load(load_spy: MagicMock):
+    registry = ReferenceDataRegistry()
+    with get_session(init_reference_data) as session:
+        assert registry.type_id(session, "Cardio") == 1
+        assert registry.difficulty_id(session, "Medium") == 2
+        assert registry.exercise_id(session, "Walk", "metre") == 1
+    load_spy.assert_called_once()
+
+
+@patch("trainings.database.reference.load", wraps=load)
+def test_when_name_is_unknown_and_data_is_recent_expect_no_reload(
+    load_spy: MagicMock,
+):
+    registry = ReferenceDataRegistry(refresh_interval=60)
+    with get_session(init_reference_data) as session:
+        assert registry.type_id(session, "Finger") is None
+        assert registry.type_id(session, "Finger") is None
+    load_spy.assert_called_once()
+
+
+def test_when_name_is_unknown_and_data_is_old_expect_reload():
+    registry = ReferenceDataRegistry(refresh_interval=0)
+    with get_session(init_reference_data) as session:
+        assert registry.exercise_id(session, "Swim", "metre") is None
+        session.add(Exercise(id=90, name="Swim", type_id=1, unit="metre"))
+        session.commit()
+        assert registry.exercise_id(session, "Swim", "metre") == 90
+
+
+@patch("trainings.database.reference.load", wraps=load)
+def test_when_looking_up_many_exercises_expect_ids_in_order_and_one_load(
+    load_spy: MagicMock,
+):
+    registry = ReferenceDataRegistry(refresh_interval=0)
+    with get_session(init_reference_data) as session:
+        assert registry.exercise_ids(
+            session, [("Walk", "metre"), ("Swim", "metre"), ("Walk", "metre")]
+        ) == [1, None, 1]
+    assert load_spy.call_count == 2
+
+
+@patch("trainings.database.reference.load", wraps=load)
+def test_when_invalidating_expect_reload(load_spy: MagicMock):
+    registry = ReferenceDataRegistry()
+    with get_session(init_reference_data) as session:
+        registry.get(session)
+        registry.invalidate()
+        registry.get(session)
+    assert load_spy.call_count == 2
+
+
+@patch("trainings.database.reference.time.monotonic")
+def test_when_data_is_older_than_max_age_expect_reload(monotonic_stub):
+    registry = ReferenceDataRegistry(max_age=300)
+    monotonic_stub.return_value = 1000
+    with get_session(init_reference_data) as session:
+        version = registry.get(session).version
+        session.add(Exercise(id=90, name="Swim", type_id=1, unit="metre"))
+        session.commit()
+        monotonic_stub.return_value = 1200
+        assert registry.get(session).version == version
+        monotonic_stub.return_value = 1301
+        assert registry.get(session).version != version
+
+
+@patch("trainings.database.reference.time.monotonic", return_value=1000)
+@patch("trainings.database.reference.load", return_value=DATA)
+def test_when_data_gets_stale_for_many_requests_expect_one_reload(
+    load_spy: MagicMock, monotonic_stub: MagicMock
+):
+    registry = ReferenceDataRegistry(max_age=300)
+    registry.get(MagicMock())
+    registry._lock = lock = CountingLock()  # pylint: disable=protected-access
+    release = Event()
+    load_spy.side_effect = lambda _: release.wait(5) and DATA
+    monotonic_stub.return_value = 1301
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(registry.get, MagicMock()) for _ in range(3)
+        ]
+        while lock.attempts < 3:
+            time.sleep(0.001)
+        release.set()
+        assert [future.result() for future in futures] == [DATA] * 3
+    assert load_spy.call_count == 2
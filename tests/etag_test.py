@@ -0,0 +1,35 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from trainings.etag import make_etag, matches, not_modified
+
+
+def test_when_making_etag_expect_quoted_parts():
+    assert make_etag(1, 2) == '"1-2"'
+
+
+def test_when_if_none_match_is_missing_expect_no_match():
+    assert not matches(None, '"1-2"')
+    assert not matches("", '"1-2"')
+
+
+def test_when_if_none_match_has_etag_expect_match():
+    assert matches('"1-2"', '"1-2"')
+    assert matches('"1-1", "1-2"', '"1-2"')
+
+
+def test_when_if_none_match_has_weak_etag_expect_match():
+    assert matches('W/"1-2"', '"1-2"')
+
+
+def test_when_if_none_match_is_star_expect_match():
+    assert matches("*", '"1-2"')
+
+
+def test_when_if_none_match_has_other_etag_expect_no_match():
+    assert not matches('"1-1"', '"1-2"')
+
+
+def test_when_not_modified_expect_304_with_etag_and_no_body():
+    response = not_modified('"1-2"')
+    assert response.status_code == 304
+    assert response.headers["ETag"] == '"1-2"'
+    assert response.body == b""
@@ -5,12 +5,15 @@ from unittest.mock import MagicMock, patch, sentinel
 from hamcrest import assert_that, matches_regexp
 from google.cloud.exceptions import NotFound
 
+from trainings.cache import LRUCache
 from trainings.firebase import (
     get_certificate,
     get_file_name,
     initialize,
     read,
+    read_many,
     save,
+    save_many,
 )
 
 
@@ -122,6 +125,66 @@ def test_when_media_not_found_expect_none(
     spy_with_error.download_as_text.assert_called_once()
 
 
+@patch("trainings.firebase.initialize")
+@patch("trainings.firebase.read", side_effect=lambda name, _: name + "-blob")
+def test_when_reading_many_medias_expect_each_unique_name_read_once(
+    read_spy: MagicMock,
+    initialize_spy: MagicMock,
+):
+    config_stub = MagicMock(**{"firebase.media_workers": 2})
+    # Exercise
+    medias = read_many(["a", "b", "a", "c"], config_stub)
+    # Assert data
+    assert medias == {"a": "a-blob", "b": "b-blob", "c": "c-blob"}
+    # Assert expectations
+    initialize_spy.assert_called_once_with(config_stub)
+    assert read_spy.call_count == 3
+
+
+@patch("trainings.firebase.initialize")
+@patch("trainings.firebase.read")
+def test_when_reading_no_medias_expect_no_download(
+    read_spy: MagicMock,
+    initialize_spy: MagicMock,
+):
+    assert not read_many([], MagicMock())
+    initialize_spy.assert_not_called()
+    read_spy.assert_not_called()
+
+
+@patch("trainings.firebase.initialize")
+@patch("trainings.firebase.read", side_effect=lambda name, _: name + "-blob")
+def test_when_reading_many_medias_with_cache_expect_only_misses_read(
+    read_spy: MagicMock,
+    initialize_spy: MagicMock,
+):
+    cache = LRUCache(max_size=100, sizeof=len)
+    cache.set("a", "cached blob")
+    config_stub = MagicMock(**{"firebase.media_workers": 2})
+    # Exercise
+    medias = read_many(["a", "b"], config_stub, cache)
+    # Assert data
+    assert medias == {"a": "cached blob", "b": "b-blob"}
+    assert cache.get("b") == "b-blob"
+    # Assert expectations
+    initialize_spy.assert_called_once_with(config_stub)
+    read_spy.assert_called_once_with("b", config_stub)
+
+
+@patch("trainings.firebase.initialize")
+@patch("trainings.firebase.read", return_value=None)
+def test_when_media_is_not_found_expect_it_not_cached(
+    read_spy: MagicMock,
+    initialize_spy: MagicMock,
+):
+    cache = LRUCache(max_size=100, sizeof=len)
+    config_stub = MagicMock(**{"firebase.media_workers": 2})
+    assert read_many(["a"], config_stub, cache) == {"a": None}
+    assert len(cache) == 0
+    initialize_spy.assert_called_once()
+    read_spy.assert_called_once()
+
+
 def test_that_file_name_is_random():
     first = get_file_name("some_trainer_id")
     assert_that(first, matches_regexp("some_trainer_id-([A-z0-9]{32})"))
@@ -156,3 +219,28 @@ def test_when_getting_certificate_data_is_from_config():
         "auth_provider_x509_cert_url": "auth_provider_x509_cert_url",
         "client_x509_cert_url": "client_x509_cert_url",
     }
+
+
+@patch("trainings.firebase.initialize")
+@patch(
+    "trainings.firebase.save",
+    side_effect=[RuntimeError("Upload failed."), "id-b"],
+)
+def test_when_saving_many_medias_expect_ids_in_order_and_none_for_errors(
+    save_spy: MagicMock,
+    initialize_spy: MagicMock,
+):
+    config_stub = MagicMock(**{"firebase.media_workers": 1})
+    # Exercise
+    media_ids = save_many([("a", "trainer"), ("b", "trainer")], config_stub)
+    # Assert data
+    assert media_ids == [None, "id-b"]
+    # Assert expectations
+    initialize_spy.assert_called_once_with(config_stub)
+    save_spy.assert_any_call("b", "trainer", config_stub)
+
+
+@patch("trainings.firebase.initialize")
+def test_when_saving_no_medias_expect_no_upload(initialize_spy: MagicMock):
+    assert not save_many([], MagicMock())
+    initialize_spy.assert_not_called()
@@ -1,16 +1,39 @@
 # pylint: disable= missing-module-docstring, missing-function-docstring
+# pylint: disable= too-many-lines
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from inspect import iscoroutinefunction
+from threading import Event
 from unittest.mock import ANY, MagicMock, patch
+from fastapi import HTTPException
+from fastapi.routing import APIRoute
 from fastapi.testclient import TestClient
 from hamcrest import assert_that, greater_than
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
 
 import tests.util.constants as c
 from tests.util.assert_helpers import are_equal
 from tests.util.data import init_test_db
-
-from trainings.main import EXERCISES_URI, TYPES_URI, app, get_db, BASE_URI
+from tests.util.query_counter import count_queries
+
+from trainings.main import (
+    BULK_URI,
+    EXERCISES_URI,
+    EXPORT_URI,
+    MEDIA_CACHE,
+    READS,
+    SEARCH_CACHE,
+    SUGGEST_URI,
+    TRAINING_CACHE,
+    TYPES_URI,
+    app,
+    get_db,
+    BASE_URI,
+)
 from trainings.database.models import Base
+from trainings.request.helper import read_training
 
 GET_PERMISSIONS_MOCK = MagicMock(return_value={"a": "b"})
 
@@ -22,6 +45,13 @@ SQLALCHEMY_DATABASE_URL = "sqlite:///./tests/test.db"
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
+
+
+@event.listens_for(engine, "connect")
+def enable_foreign_keys(dbapi_connection, _):
+    dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+
 TestingSessionLocal = sessionmaker(
     autocommit=False, autoflush=False, bind=engine
 )
@@ -67,6 +97,100 @@ def test_get_all_trainings_with_pagination():
     assert response.json()["limit"] == 30
 
 
+def test_when_paging_trainings_with_cursor_expect_every_training_once():
+    first_response = client.get(BASE_URI, params={"limit": 3})
+    assert first_response.status_code == 200
+    first_page = first_response.json()
+    assert [item["id"] for item in first_page["items"]] == [1, 2, 3]
+    assert first_page["count"] == 4
+    second_response = client.get(
+        BASE_URI, params={"limit": 3, "cursor": first_page["next_cursor"]}
+    )
+    assert second_response.status_code == 200
+    second_page = second_response.json()
+    assert [item["id"] for item in second_page["items"]] == [4]
+    assert second_page["count"] == 4
+    assert "next_cursor" not in second_page
+
+
+def test_when_paging_trainings_with_invalid_cursor_expect_error():
+    response = client.get(BASE_URI, params={"cursor": "banana"})
+    assert response.status_code == 400
+    assert response.json() == {"detail": "Invalid cursor."}
+
+
+def test_when_searching_trainings_expect_page_and_count_in_one_query():
+    filters = {"training_type": "Arm", "difficulty": "Hard", "limit": 1}
+    client.get(BASE_URI, params=filters)
+    SEARCH_CACHE.bump()
+    with count_queries(engine) as statements:
+        response = client.get(BASE_URI, params=filters)
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [3]
+    assert response.json()["count"] == 2
+    assert len(statements) == 1
+
+
+def test_when_listing_pages_of_any_size_expect_one_query():
+    queries = []
+    for limit in (1, 2, 4):
+        SEARCH_CACHE.bump()
+        for training_id in range(1, 5):
+            TRAINING_CACHE.invalidate(training_id)
+        with count_queries(engine) as statements:
+            response = client.get(BASE_URI, params={"limit": limit})
+        assert len(response.json()["items"]) == limit
+        queries.append(len(statements))
+    assert queries == [1, 1, 1]
+
+
+def test_when_reading_trainings_with_many_or_few_exercises_expect_2_queries():
+    queries = []
+    for training_id in (1, 2):
+        TRAINING_CACHE.invalidate(training_id)
+        with count_queries(engine) as statements:
+            response = client.get(BASE_URI + f"/{training_id}")
+        assert response.status_code == 201
+        queries.append(len(statements))
+    assert queries == [2, 2]
+
+
+def test_when_repeating_search_expect_no_queries():
+    filters = {"training_type": "Arm", "limit": 2}
+    expected = client.get(BASE_URI, params=filters).json()
+    with count_queries(engine) as statements:
+        response = client.get(BASE_URI, params=filters)
+    assert response.status_code == 200
+    assert response.json() == expected
+    assert not statements
+
+
+def test_when_cached_search_has_trainings_not_cached_expect_them_loaded():
+    filters = {"training_type": "Arm", "limit": 2}
+    expected = client.get(BASE_URI, params=filters).json()
+    TRAINING_CACHE.invalidate(expected["items"][0]["id"])
+    with count_queries(engine) as statements:
+        response = client.get(BASE_URI, params=filters)
+    assert response.json() == expected
+    assert len(statements) == 1
+
+
+def test_when_searching_trainings_without_count_expect_no_count():
+    response = client.get(
+        BASE_URI, params={"trainer_id": "tomato", "include_count": False}
+    )
+    assert response.status_code == 200
+    assert [item["id"] for item in response.json()["items"]] == [2]
+    assert "count" not in response.json()
+
+
+def test_when_searching_trainings_past_last_page_expect_count():
+    response = client.get(BASE_URI, params={"offset": 10})
+    assert response.status_code == 200
+    assert response.json()["items"] == []
+    assert response.json()["count"] == 4
+
+
 def test_when_filtering_by_trainer_id_tomato_returns_tomato_training():
     response = client.get(BASE_URI, params={"trainer_id": "tomato"})
     assert response.status_code == 200
@@ -155,8 +279,14 @@ def test_when_filtering_by_title_the_tomato_returns_tomato_training():
 @patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
 @patch("trainings.main.assert_can_create_training")
 def test_post_training(assert_can_create_training_mock):
-    response = client.post(BASE_URI, json=c.TRAINING_TO_BE_CREATED)
+    with count_queries(engine) as statements:
+        response = client.post(BASE_URI, json=c.TRAINING_TO_BE_CREATED)
     assert response.status_code == 200
+    exercise_inserts = [
+        statement for statement in statements
+        if statement.startswith("INSERT INTO training_exercise")
+    ]
+    assert len(exercise_inserts) == 1
     values_to_override = {
         "rating": 0,
         "blocked": False,
@@ -309,6 +439,25 @@ def test_when_creating_training_with_exercise_unit_watt_expect_error():
     }
 
 
+@patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
+@patch("trainings.main.assert_can_create_training", MagicMock())
+def test_when_creating_training_with_many_unknown_exercises_expect_all():
+    unknown_exercises = [
+        {"name": "Jump", "type": "Cardio", "count": 15, "series": 3},
+        {"name": "Run", "unit": "watt", "type": "Cardio", "count": 1},
+        {"name": "Jump", "type": "Cardio", "count": 5, "series": 1},
+    ]
+    response = client.post(
+        BASE_URI,
+        json=c.TRAINING_TO_BE_CREATED | {"exercises": unknown_exercises}
+    )
+    assert response.status_code == 404
+    assert response.json() == {
+        "detail":
+            "Could not save training. Exercises Jump None, Run watt not found."
+    }
+
+
 @patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
 @patch("trainings.main.assert_can_create_training", MagicMock())
 def test_when_creating_training_with_type_awesome_expect_error():
@@ -341,6 +490,77 @@ def test_get_training_by_id():
     assert are_equal(response.json(), c.FIRST_TRAINING, {})
 
 
+def test_when_getting_training_twice_expect_second_from_cache():
+    TRAINING_CACHE.invalidate(1)
+    client.get(BASE_URI + "/1")
+    with count_queries(engine) as statements:
+        response = client.get(BASE_URI + "/1")
+    assert response.status_code == 201
+    assert are_equal(response.json(), c.FIRST_TRAINING, {})
+    assert not statements
+
+
+def test_when_getting_training_expect_etag_with_version():
+    response = client.get(BASE_URI + "/1")
+    assert response.status_code == 201
+    assert response.headers["ETag"].startswith('"1-')
+
+
+def test_when_training_is_cached_and_not_modified_expect_304_no_queries():
+    etag = client.get(BASE_URI + "/1").headers["ETag"]
+    with count_queries(engine) as statements:
+        response = client.get(BASE_URI + "/1", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert not response.content
+    assert not statements
+
+
+def test_when_training_is_not_cached_and_not_modified_expect_304():
+    etag = client.get(BASE_URI + "/1").headers["ETag"]
+    TRAINING_CACHE.invalidate(1)
+    with patch("trainings.main.hydrate_page") as hydrate_page_mock:
+        with count_queries(engine) as statements:
+            response = client.get(
+                BASE_URI + "/1", headers={"If-None-Match": etag}
+            )
+    assert response.status_code == 304
+    assert len(statements) == 1
+    hydrate_page_mock.assert_not_called()
+
+
+def test_when_training_etag_is_old_expect_training():
+    TRAINING_CACHE.invalidate(1)
+    response = client.get(BASE_URI + "/1", headers={"If-None-Match": '"1-0"'})
+    assert response.status_code == 201
+    assert response.headers["ETag"] != '"1-0"'
+    assert are_equal(response.json(), c.FIRST_TRAINING, {})
+
+
+def test_when_getting_same_training_concurrently_expect_one_read():
+    TRAINING_CACHE.invalidate(1)
+    coalesced = READS.coalesced
+    release = Event()
+
+    def slow_read(session, training_id):
+        release.wait(5)
+        return read_training(session, training_id)
+
+    with patch(
+        "trainings.main.read_training", side_effect=slow_read
+    ) as read_spy, ThreadPoolExecutor(max_workers=3) as executor:
+        futures = [
+            executor.submit(client.get, BASE_URI + "/1") for _ in range(3)
+        ]
+        while READS.coalesced < coalesced + 2:
+            time.sleep(0.001)
+        release.set()
+        responses = [future.result() for future in futures]
+    assert [response.status_code for response in responses] == [201] * 3
+    assert are_equal(responses[2].json(), c.FIRST_TRAINING, {})
+    read_spy.assert_called_once()
+
+
 def test_when_getting_training_of_id_999_expect_error():
     response = client.get(BASE_URI + "/999")
     assert response.status_code == 404
@@ -353,6 +573,33 @@ def test_when_getting_training_types_expect_list():
     assert are_equal(response.json(), c.EXPECTED_TRAINING_TYPES, {})
 
 
+def test_when_training_types_did_not_change_expect_304():
+    etag = client.get(TYPES_URI).headers["ETag"]
+    response = client.get(TYPES_URI, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+
+
+def test_when_getting_catalogs_expect_no_queries_and_cache_control():
+    client.get(TYPES_URI)
+    with count_queries(engine) as statements:
+        types_response = client.get(TYPES_URI)
+        exercises_response = client.get(EXERCISES_URI)
+    assert not statements
+    assert types_response.headers["Cache-Control"] == "public, max-age=300"
+    assert exercises_response.headers["Cache-Control"] ==\
+        "public, max-age=300"
+
+
+def test_when_exercises_did_not_change_expect_304():
+    etag = client.get(EXERCISES_URI).headers["ETag"]
+    response = client.get(EXERCISES_URI, headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    response = client.get(EXERCISES_URI, headers={"If-None-Match": '"old"'})
+    assert response.status_code == 200
+    assert response.headers["ETag"] == etag
+
+
 def test_when_getting_exercises_expect_list():
     response = client.get(EXERCISES_URI)
     assert response.status_code == 200, response.json()
@@ -400,14 +647,20 @@ def test_when_editing_training_4_title_expect_new_title(
     response = client.get(url)
     assert response.status_code == 201
     assert response.json()["title"] == original_title
+    etag = response.headers["ETag"]
+    response = client.get(BASE_URI, params={"title": "Trainer has"})
+    assert response.json()["items"] == []
     # Edit it
     response = client.patch(url, json=edited_title)
     assert response.status_code == 204, response.json()
     save_mock.assert_not_called()
     # Assert it has new title
-    response = client.get(url)
+    response = client.get(url, headers={"If-None-Match": etag})
     assert response.status_code == 201
     assert response.json()["title"] == "Trainer has decided."
+    assert response.headers["ETag"] != etag
+    response = client.get(BASE_URI, params={"title": "Trainer has"})
+    assert [item["id"] for item in response.json()["items"]] == [4]
 
 
 @patch("trainings.main.save")
@@ -441,6 +694,21 @@ def test_when_editing_training_4_media_expect_new_media(
     save_mock.assert_called_once_with("MyNewMedia", "indecisive_trainer", ANY)
 
 
+@patch("trainings.main.save", return_value="new_filename")
+def test_when_replacing_training_4_media_expect_old_media_not_cached(
+    save_mock: MagicMock
+):
+    MEDIA_CACHE.set("filename", "MyNewMedia")
+    url = BASE_URI + "/4"
+    response = client.patch(url, json={"media": "MyNewerMedia"})
+    assert response.status_code == 204, response.json()
+    save_mock.assert_called_once_with(
+        "MyNewerMedia", "indecisive_trainer", ANY
+    )
+    assert MEDIA_CACHE.get("filename") is None
+    assert TRAINING_CACHE.get(4) is None
+
+
 def test_when_blocking_training_of_id_9999_expect_error():
     response = client.patch(
         BASE_URI + "/999", json={"blocked": True}
@@ -483,6 +751,33 @@ def test_when_getting_trainings_for_a_user_expect_first_and_tomato():
     )
 
 
+def test_when_paging_trainings_for_a_user_with_cursor_expect_one_by_one():
+    first_response = client.get("/users/2/trainings", params={"limit": 1})
+    assert first_response.status_code == 200, first_response.json()
+    first_page = first_response.json()
+    assert [item["id"] for item in first_page["items"]] == [1]
+    assert first_page["count"] == 2
+    second_response = client.get(
+        "/users/2/trainings",
+        params={"limit": 1, "cursor": first_page["next_cursor"]},
+    )
+    assert second_response.status_code == 200, second_response.json()
+    second_page = second_response.json()
+    assert [item["id"] for item in second_page["items"]] == [2]
+    assert "next_cursor" not in second_page
+
+
+def test_when_paging_trainings_for_a_user_with_offset_expect_second():
+    params = {"offset": 1, "limit": 1}
+    with count_queries(engine) as statements:
+        response = client.get("/users/2/trainings", params=params)
+    assert response.status_code == 200, response.json()
+    assert [item["id"] for item in response.json()["items"]] == [2]
+    assert response.json()["count"] == 2
+    assert len(statements) == 2
+    assert "user_training" not in statements[0]
+
+
 def test_when_getting_trainings_for_a_user_without_favourites_expect_empty():
     response = client.get("/users/3/trainings")
     assert response.status_code == 200, response.json()
@@ -537,6 +832,44 @@ def test_when_ratting_training_for_a_user_expect_204():
     assert response_get.json() == {"rate": 3.5}
 
 
+def test_when_ratting_training_expect_cached_training_invalidated():
+    etag = client.get(BASE_URI + "/2").headers["ETag"]
+    assert TRAINING_CACHE.get(2) is not None
+    response = client.put("/users/3/trainings/2", json={"rate": 1})
+    assert response.status_code == 204, response.json()
+    assert TRAINING_CACHE.get(2) is None
+    response = client.get(BASE_URI + "/2", headers={"If-None-Match": etag})
+    assert response.status_code == 201
+
+
+def test_when_ratting_training_in_sqlite_expect_upsert_statement():
+    with count_queries(engine) as statements:
+        response = client.put("/users/4/trainings/3", json={"rate": 2})
+    assert response.status_code == 204, response.json()
+    assert [
+        statement.split()[0] for statement in statements
+    ] == ["INSERT", "UPDATE"]
+
+
+def test_when_rating_while_training_is_read_expect_read_not_cached():
+    TRAINING_CACHE.invalidate(3)
+
+    def read_then_rate(session, training_id):
+        training = read_training(session, training_id)
+        response = client.put("/users/4/trainings/3", json={"rate": 4})
+        assert response.status_code == 204, response.json()
+        return training
+
+    with patch("trainings.main.read_training", side_effect=read_then_rate):
+        stale = client.get(BASE_URI + "/3")
+    response = client.get(
+        BASE_URI + "/3", headers={"If-None-Match": stale.headers["ETag"]}
+    )
+    assert response.status_code == 201
+    assert response.headers["ETag"] != stale.headers["ETag"]
+    assert response.json()["rating"] != stale.json()["rating"]
+
+
 def test_when_ratting_training_for_not_existing_user_expect_404():
     response = client.put("/users/999/trainings/1", json={"rate": 5})
     assert response.status_code == 404, response.json()
@@ -555,6 +888,25 @@ def test_when_getting_ratting_training_for_a_user_expect_rate():
     assert response.json() == {"rate": 4.5}
 
 
+def test_when_getting_ratting_expect_one_query():
+    with count_queries(engine) as statements:
+        response = client.get("/users/1/trainings/1/rating")
+    assert response.status_code == 200, response.json()
+    assert len(statements) == 1
+
+
+def test_when_add_favourite_training_for_nothing_expect_training_404():
+    response = client.post("/users/999/trainings", json={"training_id": 999})
+    assert response.status_code == 404, response.json()
+    assert response.json() == {"detail": "Training not found."}
+
+
+def test_when_ratting_nothing_expect_user_404():
+    response = client.get("/users/999/trainings/999/rating")
+    assert response.status_code == 404, response.json()
+    assert response.json() == {"detail": "User not found."}
+
+
 def test_when_user_did_not_rate_training_expect_404():
     response = client.get("/users/1/trainings/2/rating")
     assert response.status_code == 404, response.json()
@@ -598,6 +950,19 @@ def test_when_ratting_twice_expect_second_rating():
     response_second_get = client.get("/users/3/trainings/2/rating")
     assert response_second_get.status_code == 200, response_second_get.json()
     assert response_second_get.json() == {"rate": 5}
+    # Validate training rating only counts second rating
+    response_training = client.get(BASE_URI + "/2")
+    assert response_training.status_code == 201, response_training.json()
+    assert response_training.json()["rating"] == 5
+
+
+def test_when_handler_uses_database_expect_it_runs_in_threadpool():
+    for route in app.routes:
+        if isinstance(route, APIRoute) and any(
+            dependency.call is get_db
+            for dependency in route.dependant.dependencies
+        ):
+            assert not iscoroutinefunction(route.endpoint), route.path
 
 
 def test_when_checking_healthcheck_expect_uptime_greater_than_zero():
@@ -712,3 +1077,140 @@ def test_when_asking_cors_is_available_origin_apple_expect_200():
     method_override = {"origin": "apple"}
     response = client.options(BASE_URI, headers=HEADERS | method_override)
     assert response.status_code == 400
+
+
+@patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
+@patch("trainings.main.assert_can_create_training", MagicMock())
+def test_when_importing_trainings_expect_result_per_line():
+    generation = SEARCH_CACHE.get_generation()
+    lines = [
+        json.dumps(c.TRAINING_TO_BE_CREATED | {"title": "Bulk training."}),
+        "",
+        json.dumps(c.TRAINING_TO_BE_CREATED | {"type": "Awesome"}),
+    ]
+    response = client.post(
+        BULK_URI,
+        content="\n".join(lines),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 200
+    result = response.json()
+    assert (result["created"], result["failed"]) == (1, 1)
+    assert [item["status"] for item in result["items"]] == [201, 404]
+    assert result["items"][1] == {
+        "line": 3,
+        "status": 404,
+        "detail": "Could not save training. Type Awesome not found.",
+    }
+    created = client.get(BASE_URI + f"/{result['items'][0]['id']}")
+    assert created.json()["title"] == "Bulk training."
+    assert SEARCH_CACHE.get_generation() != generation
+
+
+@patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
+@patch(
+    "trainings.main.assert_can_create_training",
+    MagicMock(side_effect=HTTPException(status_code=403)),
+)
+def test_when_importing_trainings_without_permission_expect_error():
+    response = client.post(
+        BULK_URI,
+        content=json.dumps(c.TRAINING_TO_BE_CREATED),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    assert response.status_code == 403
+
+
+def test_when_exporting_trainings_expect_one_training_per_line():
+    response = client.get(EXPORT_URI, params={"training_type": "Arm"})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/x-ndjson"
+    trainings = [json.loads(line) for line in response.text.splitlines()]
+    training_ids = [training["id"] for training in trainings]
+    assert training_ids[:2] == [3, 4]
+    assert training_ids == sorted(training_ids)
+    assert {training["type"] for training in trainings} == {"Arm"}
+    assert trainings[0] == client.get(BASE_URI + "/3").json()
+
+
+def test_when_exporting_trainings_gzipped_expect_same_lines():
+    plain = client.get(EXPORT_URI)
+    response = client.get(EXPORT_URI, params={"gzip": True})
+    assert response.headers["content-encoding"] == "gzip"
+    assert response.text == plain.text
+
+
+def test_when_exporting_trainings_of_unknown_type_expect_error():
+    response = client.get(EXPORT_URI, params={"training_type": "Awesome"})
+    assert response.status_code == 400
+
+
+def export_with_session_spy(params) -> MagicMock:
+    session = TestingSessionLocal()
+    app.dependency_overrides[get_db] = lambda: session
+    try:
+        with patch.object(session, "close", wraps=session.close) as close_spy:
+            client.get(EXPORT_URI, params=params)
+    finally:
+        app.dependency_overrides[get_db] = override_get_db
+    return close_spy
+
+
+def test_when_export_fails_before_streaming_expect_session_closed():
+    close_spy = export_with_session_spy({"difficulty": "Fair"})
+    close_spy.assert_called_once()
+
+
+def test_when_export_ends_expect_session_closed():
+    close_spy = export_with_session_spy({"gzip": True})
+    close_spy.assert_called_once()
+
+
+def test_when_suggesting_titles_expect_matching_titles():
+    response = client.get(SUGGEST_URI, params={"prefix": "THE TO"})
+    assert response.status_code == 200
+    assert response.json() == {
+        "items": [{"id": 2, "title": "The tomato training."}]
+    }
+
+
+def test_when_suggesting_titles_with_blank_prefix_expect_none():
+    response = client.get(SUGGEST_URI, params={"prefix": " "})
+    assert response.json() == {"items": []}
+
+
+@patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
+@patch("trainings.main.assert_can_create_training", MagicMock())
+def test_when_creating_and_editing_training_expect_title_suggested():
+    client.get(SUGGEST_URI, params={"prefix": "x"})
+    response = client.post(
+        BASE_URI, json=c.TRAINING_TO_BE_CREATED | {"title": "Zebra jumps"}
+    )
+    training_id = response.json()["id"]
+    with count_queries(engine) as statements:
+        created = client.get(SUGGEST_URI, params={"prefix": "zebra"})
+    assert not statements
+    assert created.json()["items"] == [
+        {"id": training_id, "title": "Zebra jumps"}
+    ]
+    client.patch(BASE_URI + f"/{training_id}", json={"title": "Zulu jumps"})
+    assert client.get(SUGGEST_URI, params={"prefix": "zebra"}).json() == {
+        "items": []
+    }
+    assert client.get(SUGGEST_URI, params={"prefix": "zulu"}).json() == {
+        "items": [{"id": training_id, "title": "Zulu jumps"}]
+    }
+
+
+@patch("trainings.main.get_permissions", GET_PERMISSIONS_MOCK)
+@patch("trainings.main.assert_can_create_training", MagicMock())
+def test_when_importing_trainings_expect_titles_suggested():
+    client.post(
+        BULK_URI,
+        content=json.dumps(c.TRAINING_TO_BE_CREATED | {"title": "Yoga flow"}),
+        headers={"Content-Type": "application/x-ndjson"},
+    )
+    response = client.get(SUGGEST_URI, params={"prefix": "yoga"})
+    assert [item["title"] for item in response.json()["items"]] == [
+        "Yoga flow"
+    ]
@@ -0,0 +1,33 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from unittest.mock import MagicMock
+from fastapi import HTTPException
+from pytest import raises
+
+from trainings.pagination import decode_cursor, encode_cursor, get_page
+
+
+def test_when_decoding_encoded_cursor_expect_same_id():
+    assert decode_cursor(encode_cursor(42)) == 42
+
+
+def test_when_decoding_garbage_cursor_expect_error():
+    with raises(HTTPException) as error:
+        decode_cursor("banana")
+    assert error.value.status_code == 400
+
+
+def test_when_decoding_cursor_without_integer_id_expect_error():
+    with raises(HTTPException):
+        decode_cursor(encode_cursor("banana"))
+
+
+def test_when_rows_fit_in_limit_expect_no_next_cursor():
+    rows = [MagicMock(id=1), MagicMock(id=2)]
+    assert get_page(rows, 2) == (rows, None)
+
+
+def test_when_there_are_more_rows_than_limit_expect_next_cursor():
+    rows = [MagicMock(id=1), MagicMock(id=2), MagicMock(id=3)]
+    page, next_cursor = get_page(rows, 2)
+    assert page == rows[:2]
+    assert decode_cursor(next_cursor) == 2
@@ -0,0 +1,45 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from unittest.mock import MagicMock, call, patch, sentinel
+from sqlalchemy.dialects import postgresql
+
+from trainings.rating.dao import add, get_postgres_upsert, lock_training
+
+
+def test_when_building_postgres_upsert_expect_one_statement():
+    statement = str(
+        get_postgres_upsert(1, 2, 3.5).compile(dialect=postgresql.dialect())
+    )
+    assert statement.startswith("WITH previous AS")
+    assert "FOR UPDATE" in statement
+    assert "ON CONFLICT (user_id, training_id) DO UPDATE" in statement
+    assert "UPDATE training SET rating_sum" in statement
+    assert statement.endswith("RETURNING training.version")
+
+
+def test_when_locking_training_expect_select_for_update():
+    statement = str(
+        lock_training(2).compile(dialect=postgresql.dialect())
+    )
+    assert statement.startswith("SELECT training.id")
+    assert statement.endswith("FOR UPDATE")
+
+
+@patch("trainings.rating.dao.upsert_locally")
+@patch("trainings.rating.dao.get_postgres_upsert", return_value=sentinel)
+@patch("trainings.rating.dao.lock_training", return_value=sentinel.lock)
+def test_when_rating_in_postgres_expect_training_locked_before_upsert(
+    lock_training_spy: MagicMock,
+    get_postgres_upsert_spy: MagicMock,
+    upsert_locally_spy: MagicMock,
+):
+    session = MagicMock(**{"get_bind.return_value.dialect.name": "postgresql"})
+    session.scalar.return_value = 4
+    assert add(session, 1, 2, 3.5) == 4
+    lock_training_spy.assert_called_once_with(2)
+    get_postgres_upsert_spy.assert_called_once_with(1, 2, 3.5)
+    assert [
+        method_call for method_call in session.method_calls
+        if method_call[0] in ("execute", "scalar")
+    ] == [call.execute(sentinel.lock), call.scalar(sentinel)]
+    session.commit.assert_called_once()
+    upsert_locally_spy.assert_not_called()
@@ -0,0 +1,64 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from sqlalchemy.orm import Session
+
+from tests.util.data import get_session
+from trainings.database.models import Training, UserRatesTraining
+from trainings.rating.dao import add
+from trainings.rating.non_bread_queries import reconcile_aggregates
+
+
+def insert_trainings(session: Session) -> None:
+    with session as open_session:
+        open_session.add_all([
+            Training(id=1, type_id=1, difficulty_id=1),
+            Training(id=2, type_id=1, difficulty_id=1),
+        ])
+        open_session.commit()
+
+
+def get_aggregates(session: Session, training_id: int):
+    training = session.get(Training, training_id, populate_existing=True)
+    return (
+        training.rating_sum, training.rating_count, training.rating_average
+    )
+
+
+def test_when_reconciling_expect_aggregates_from_ratings():
+    with get_session(insert_trainings) as session:
+        session.add_all([
+            UserRatesTraining(user_id=1, training_id=1, rating=4.5),
+            UserRatesTraining(user_id=2, training_id=1, rating=3.5),
+        ])
+        session.commit()
+        assert reconcile_aggregates(session) == 1
+        assert get_aggregates(session, 1) == (8, 2, 4)
+        assert get_aggregates(session, 2) == (0, 0, 0)
+        assert session.get(Training, 1).version == 2
+        assert session.get(Training, 2).version == 1
+
+
+def test_when_aggregates_did_not_drift_expect_nothing_updated():
+    with get_session(insert_trainings) as session:
+        add(session, 1, 1, 2)
+        assert reconcile_aggregates(session) == 0
+
+
+def test_when_rating_twice_expect_aggregates_to_count_last_rating():
+    with get_session(insert_trainings) as session:
+        add(session, 1, 1, 2)
+        assert get_aggregates(session, 1) == (2, 1, 2)
+        add(session, 2, 1, 4)
+        assert get_aggregates(session, 1) == (6, 2, 3)
+        add(session, 1, 1, 5)
+        assert get_aggregates(session, 1) == (9, 2, 4.5)
+        assert session.get(Training, 1).version == 4
+
+
+def test_when_first_ratings_of_a_user_race_expect_rating_counted_once():
+    with get_session(insert_trainings) as session:
+        # The first rating was committed while the second one was waiting,
+        # before its aggregates were updated.
+        session.add(UserRatesTraining(user_id=1, training_id=1, rating=2))
+        session.commit()
+        assert add(session, 1, 1, 4) == 2
+        assert get_aggregates(session, 1) == (4, 1, 4)
@@ -0,0 +1,44 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import json
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from trainings.serialization import dump_fast, dump_model, get_encoder, orjson
+from trainings.trainings.dto import Exercise
+
+EXERCISE = Exercise(name="Plank", type="Abdomen", count=60)
+REQUIRES_ORJSON = pytest.mark.skipif(
+    orjson is None, reason="orjson is not installed"
+)
+
+
+def test_when_dumping_model_expect_json_without_nulls():
+    assert json.loads(dump_model(EXERCISE)) == {
+        "name": "Plank", "type": "Abdomen", "count": 60
+    }
+
+
+@REQUIRES_ORJSON
+def test_when_dumping_model_fast_expect_same_values():
+    assert json.loads(dump_fast(EXERCISE)) == json.loads(dump_model(EXERCISE))
+
+
+def test_when_fast_json_is_disabled_expect_pydantic_encoder():
+    assert get_encoder(MagicMock(fast_json=False)) is dump_model
+
+
+@REQUIRES_ORJSON
+def test_when_fast_json_is_enabled_expect_orjson_encoder():
+    assert get_encoder(MagicMock(fast_json=True)) is dump_fast
+
+
+@patch("trainings.serialization.orjson", None)
+def test_when_fast_json_is_enabled_without_orjson_expect_pydantic_encoder():
+    assert get_encoder(MagicMock(fast_json=True)) is dump_model
+
+
+@patch("trainings.serialization.orjson", None)
+def test_when_dumping_model_fast_without_orjson_expect_error():
+    with pytest.raises(RuntimeError, match="Install orjson"):
+        dump_fast(EXERCISE)
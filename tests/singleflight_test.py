@@ -0,0 +1,91 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import time
+from concurrent.futures import ThreadPoolExecutor
+from threading import Event
+from unittest.mock import MagicMock
+from pytest import raises
+
+from trainings.singleflight import SingleFlight
+
+
+def test_when_calls_are_concurrent_expect_one_call_shared():
+    single_flight = SingleFlight()
+    release = Event()
+
+    def slow_call():
+        release.wait(5)
+        return "result"
+
+    function = MagicMock(side_effect=slow_call)
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        futures = [
+            executor.submit(single_flight.do, "key", function)
+            for _ in range(4)
+        ]
+        while single_flight.coalesced < 3:
+            time.sleep(0.001)
+        release.set()
+        results = [future.result() for future in futures]
+    assert results == ["result"] * 4
+    function.assert_called_once()
+
+
+def test_when_calls_are_sequential_expect_each_one_called():
+    single_flight = SingleFlight()
+    function = MagicMock(return_value="result")
+    assert single_flight.do("key", function) == "result"
+    assert single_flight.do("key", function) == "result"
+    assert function.call_count == 2
+    assert single_flight.coalesced == 0
+
+
+def test_when_call_raises_expect_error_and_key_released():
+    single_flight = SingleFlight()
+    with raises(ValueError):
+        single_flight.do("key", MagicMock(side_effect=ValueError("Boom!")))
+    assert single_flight.do("key", MagicMock(return_value=1)) == 1
+
+
+def test_when_running_call_takes_longer_than_timeout_expect_own_call():
+    single_flight = SingleFlight()
+    started = Event()
+    release = Event()
+
+    def slow_call():
+        started.set()
+        release.wait(5)
+        return "leader"
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(single_flight.do, "key", slow_call)
+        started.wait(5)
+        result = single_flight.do(
+            "key", MagicMock(return_value="follower"), timeout=0.01
+        )
+        release.set()
+        assert leader.result() == "leader"
+    assert result == "follower"
+    assert single_flight.stats() == {"coalesced": 1, "timeouts": 1}
+
+
+def test_when_calls_are_coalesced_expect_callbacks_called_with_key():
+    on_coalesced = MagicMock()
+    on_timeout = MagicMock()
+    single_flight = SingleFlight(on_coalesced, on_timeout)
+    release = Event()
+
+    def slow_call():
+        release.wait(5)
+        return "result"
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [
+            executor.submit(single_flight.do, "key", slow_call)
+            for _ in range(2)
+        ]
+        while single_flight.coalesced < 1:
+            time.sleep(0.001)
+        release.set()
+        assert [future.result() for future in futures] == ["result"] * 2
+    on_coalesced.assert_called_once_with("key")
+    on_timeout.assert_not_called()
@@ -0,0 +1,111 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import json
+from unittest.mock import MagicMock, patch
+
+from sqlalchemy import func, select
+from sqlalchemy.exc import SQLAlchemyError
+
+import tests.util.constants as c
+from tests.util.config import get_config_stub
+from tests.util.data import get_session, init_reference_data
+from tests.util.query_counter import count_queries
+from trainings.database.models import Training, TrainingExercise
+from trainings.trainings.bulk import import_trainings, parse
+
+CONFIG = get_config_stub(bulk_chunk_size=500)
+UNKNOWN_EXERCISE = {
+    "name": "Jump", "type": "Cardio", "count": 15, "series": 3
+}
+
+
+def to_lines(*trainings) -> list[bytes]:
+    return [json.dumps(training).encode("utf-8") for training in trainings]
+
+
+def test_when_parsing_lines_expect_blank_skipped_and_invalid_failed():
+    lines = to_lines(c.TRAINING_TO_BE_CREATED) + [b"", b"{", b"[]"]
+    trainings, results = parse(lines)
+    assert [line for line, _ in trainings] == [1]
+    assert trainings[0][1].title == c.TRAINING_TO_BE_CREATED["title"]
+    assert [(result.line, result.status) for result in results] == [
+        (3, 422), (4, 422)
+    ]
+
+
+def test_when_importing_trainings_expect_result_per_line():
+    lines = to_lines(
+        c.TRAINING_TO_BE_CREATED,
+        c.TRAINING_TO_BE_CREATED | {"exercises": [UNKNOWN_EXERCISE]},
+        c.TRAINING_TO_BE_CREATED | {"title": "Second"},
+    )
+    with get_session(init_reference_data) as session:
+        result = import_trainings(session, lines, CONFIG)
+        titles = session.scalars(select(Training.title)).all()
+        exercises = session.scalar(
+            select(func.count()).select_from(TrainingExercise)
+        )
+    assert (result.created, result.failed) == (2, 1)
+    assert [(item.line, item.status, item.id) for item in result.items] == [
+        (1, 201, 1), (2, 404, None), (3, 201, 2)
+    ]
+    assert result.items[1].detail == \
+        "Could not save training. Exercise Jump None not found."
+    assert titles == [c.TRAINING_TO_BE_CREATED["title"], "Second"]
+    assert exercises == 4
+
+
+def test_when_importing_in_chunks_expect_one_exercises_insert_per_chunk():
+    lines = to_lines(*[c.TRAINING_TO_BE_CREATED] * 5)
+    config = get_config_stub(bulk_chunk_size=2)
+    with get_session(init_reference_data) as session:
+        with count_queries(session.get_bind()) as statements:
+            result = import_trainings(session, lines, config)
+        exercises = session.execute(
+            select(TrainingExercise.training_id, func.count())
+            .group_by(TrainingExercise.training_id)
+        ).all()
+    inserts = [
+        statement for statement in statements
+        if statement.startswith("INSERT INTO training_exercise")
+    ]
+    assert [item.id for item in result.items] == [1, 2, 3, 4, 5]
+    assert exercises == [(1, 2), (2, 2), (3, 2), (4, 2), (5, 2)]
+    assert len(inserts) == 3
+
+
+@patch("trainings.trainings.bulk.save_many", return_value=["id-a", None])
+def test_when_media_upload_fails_expect_only_that_line_failed(
+    save_many_mock: MagicMock,
+):
+    lines = to_lines(
+        c.TRAINING_TO_BE_CREATED | {"media": "a"},
+        c.TRAINING_TO_BE_CREATED | {"media": "b"},
+        c.TRAINING_TO_BE_CREATED,
+    )
+    with get_session(init_reference_data) as session:
+        result = import_trainings(session, lines, CONFIG)
+        medias = session.scalars(select(Training.media)).all()
+    trainer_id = c.TRAINING_TO_BE_CREATED["trainer_id"]
+    save_many_mock.assert_called_once_with(
+        [("a", trainer_id), ("b", trainer_id)], CONFIG
+    )
+    assert [(item.line, item.status) for item in result.items] == [
+        (1, 201), (2, 502), (3, 201)
+    ]
+    assert medias == ["id-a", None]
+
+
+def test_when_a_chunk_fails_expect_only_its_lines_failed():
+    lines = to_lines(*[c.TRAINING_TO_BE_CREATED] * 3)
+    with get_session(init_reference_data) as session:
+        with patch.object(
+            session, "execute", side_effect=[None, SQLAlchemyError(), None]
+        ):
+            result = import_trainings(
+                session, lines, get_config_stub(bulk_chunk_size=1)
+            )
+        training_ids = session.scalars(select(Training.id)).all()
+    assert len(training_ids) == 2
+    assert [(item.line, item.status) for item in result.items] == [
+        (1, 201), (2, 500), (3, 201)
+    ]
@@ -0,0 +1,152 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import json
+
+import pytest
+
+from tests.util.fake_redis import FakeRedis
+
+from trainings.cache import LocalBackend, RedisBackend
+from trainings.serialization import dump_fast, orjson
+from trainings.trainings.cache import (
+    SearchCache,
+    SearchPage,
+    TrainingCache,
+    normalize,
+    serialize_page,
+)
+from trainings.trainings.dto import (
+    TrainingFilters,
+    TrainingOut,
+    TrainingsWithPagination,
+)
+
+TRAINING = TrainingOut(
+    id=1,
+    trainer_id="trainer",
+    title="Title",
+    description="Description",
+    type="Cardio",
+    difficulty="Easy",
+    media=None,
+    rating=4,
+    blocked=False,
+    exercises=[],
+)
+
+
+def test_when_training_is_not_cached_expect_none():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    assert cache.get(1) is None
+
+
+def test_when_training_is_cached_expect_serialized_without_none():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    cached = cache.set(1, TRAINING, 3)
+    assert cache.get(1) == cached
+    assert cached.version == 3
+    assert json.loads(cached.body) == TRAINING.dict(exclude_none=True)
+
+
+@pytest.mark.skipif(orjson is None, reason="orjson is not installed")
+def test_when_encoder_is_given_expect_training_encoded_with_it():
+    cache = TrainingCache(LocalBackend(max_size=1024), encode=dump_fast)
+    cached = cache.set(1, TRAINING, 1)
+    assert cached.body == dump_fast(TRAINING)
+    assert cache.get(1) == cached
+
+
+def test_when_training_is_invalidated_expect_none():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    cache.set(1, TRAINING, 1)
+    cache.invalidate("1")
+    assert cache.get(1) is None
+
+
+def test_when_training_was_written_while_read_expect_read_not_cached():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    cache.set(1, TRAINING, 1)
+    cache.invalidate(1, 2)
+    cached = cache.set(1, TRAINING, 1)
+    assert cached.version == 1
+    assert cache.get(1) is None
+    assert cache.set(1, TRAINING, 2) == cache.get(1)
+
+
+def test_when_setting_older_version_than_cached_expect_newer_kept():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    cached = cache.set(1, TRAINING, 3)
+    cache.set(1, TRAINING.copy(update={"title": "Old"}), 2)
+    assert cache.get(1) == cached
+
+
+def test_when_backend_is_shared_expect_other_replica_sees_changes():
+    client = FakeRedis()
+    replica = TrainingCache(RedisBackend(client), ttl=60)
+    other_replica = TrainingCache(RedisBackend(client), ttl=60)
+    replica.set(1, TRAINING, 1)
+    assert other_replica.get(1) is not None
+    assert client.expirations == {"trainings:training:1": 60}
+    other_replica.invalidate(1)
+    assert replica.get(1) is None
+
+
+def test_when_filters_differ_only_in_empty_values_expect_same_key():
+    cache = SearchCache(LocalBackend(max_size=1024))
+    filters = TrainingFilters(offset=0, limit=10, type="Cardio")
+    with_empty_title = TrainingFilters(
+        offset=0, limit=10, type="Cardio", title=""
+    )
+    key = cache.get_key(filters, True)
+    assert key == cache.get_key(with_empty_title, True)
+    assert cache.get_key(filters, True) != cache.get_key(filters, False)
+
+
+def test_when_filters_have_cursor_expect_offset_ignored():
+    first = TrainingFilters(offset=0, limit=10, cursor="abc")
+    second = TrainingFilters(offset=20, limit=10, cursor="abc")
+    assert normalize(first, True) == normalize(second, True)
+    third = TrainingFilters(offset=20, limit=10)
+    assert normalize(first, True) != normalize(third, True)
+
+
+def test_when_search_page_is_cached_expect_it():
+    cache = SearchCache(LocalBackend(max_size=1024), ttl=30)
+    key = cache.get_key(TrainingFilters(offset=0, limit=10), True)
+    assert cache.get(key) is None
+    cache.set(key, SearchPage([1, 2], 5, "cursor"))
+    assert cache.get(key) == SearchPage([1, 2], 5, "cursor")
+
+
+def test_when_generation_is_bumped_expect_old_pages_not_found():
+    cache = SearchCache(LocalBackend(max_size=1024))
+    filters = TrainingFilters(offset=0, limit=10)
+    cache.set(cache.get_key(filters, True), SearchPage([1], 1, None))
+    cache.bump()
+    assert cache.get(cache.get_key(filters, True)) is None
+
+
+def test_when_backend_is_shared_expect_bump_seen_by_other_replica():
+    client = FakeRedis()
+    replica = SearchCache(RedisBackend(client))
+    other_replica = SearchCache(RedisBackend(client))
+    filters = TrainingFilters(offset=0, limit=10)
+    replica.set(replica.get_key(filters, True), SearchPage([1], 1, None))
+    assert other_replica.get(other_replica.get_key(filters, True))
+    other_replica.bump()
+    assert replica.get(replica.get_key(filters, True)) is None
+
+
+def test_when_serializing_page_expect_trainings_with_pagination():
+    cache = TrainingCache(LocalBackend(max_size=1024))
+    items = [cache.set(1, TRAINING, 1).body, cache.set(2, TRAINING, 1).body]
+    serialized = serialize_page(items, 0, 2, None, "cursor")
+    expected = TrainingsWithPagination(
+        items=[TRAINING, TRAINING], offset=0, limit=2, next_cursor="cursor"
+    )
+    assert json.loads(serialized) == expected.dict(exclude_none=True)
+
+
+def test_when_serializing_empty_page_expect_no_items():
+    assert json.loads(serialize_page([], 10, 5, 3, None)) == {
+        "items": [], "offset": 10, "limit": 5, "count": 3
+    }
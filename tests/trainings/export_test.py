@@ -0,0 +1,64 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+import gzip
+import json
+from unittest.mock import MagicMock, patch
+
+from tests.util.config import get_config_stub
+from tests.util.data import get_session
+from trainings.database.models import Training
+from trainings.trainings.export import compress, export, stream_records
+
+CONFIG = get_config_stub(export_batch_size=2)
+
+
+def test_when_streaming_records_expect_batches_with_all_exercises():
+    with get_session() as session:
+        batches = list(stream_records(session, [], 3))
+    assert [[record.id for record in batch] for batch in batches] == [
+        [1, 2, 3], [4]
+    ]
+    assert [len(record.exercises) for record in batches[0]] == [3, 1, 1]
+
+
+def test_when_streaming_records_with_criteria_expect_only_matches():
+    with get_session() as session:
+        batches = list(
+            stream_records(session, [Training.trainer_id == "tomato"], 10)
+        )
+    assert [[record.id for record in batch] for batch in batches] == [[2]]
+
+
+@patch("trainings.trainings.export.read_many")
+def test_when_exporting_without_media_expect_no_download(
+    read_many_spy: MagicMock,
+):
+    with get_session() as session:
+        chunks = list(export(session, [], CONFIG))
+    lines = b"".join(chunks).splitlines()
+    assert len(chunks) == 2
+    assert [json.loads(line)["id"] for line in lines] == [1, 2, 3, 4]
+    read_many_spy.assert_not_called()
+
+
+@patch(
+    "trainings.trainings.export.read_many",
+    side_effect=lambda names, *_: {name: "blob" for name in names},
+)
+def test_when_exporting_with_media_expect_medias_by_batch(
+    read_many_spy: MagicMock,
+):
+    with get_session() as session:
+        session.query(Training).filter(Training.id == 1)\
+            .update({"media": "a"})
+        session.commit()
+        lines = b"".join(
+            export(session, [], CONFIG, include_media=True)
+        ).splitlines()
+    assert json.loads(lines[0])["media"] == "blob"
+    assert "media" not in json.loads(lines[1])
+    assert read_many_spy.call_count == 2
+
+
+def test_when_compressing_chunks_expect_one_gzip_stream():
+    chunks = [b'{"id":1}\n', b"", b'{"id":2}\n']
+    assert gzip.decompress(b"".join(compress(chunks))) == b"".join(chunks)
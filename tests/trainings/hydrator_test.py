@@ -1,7 +1,33 @@
 # pylint: disable= missing-module-docstring, missing-function-docstring
 
 from unittest.mock import MagicMock, patch
-from trainings.trainings.hydrator import hydrate
+from trainings.trainings.hydrator import (
+    hydrate, hydrate_page, hydrate_records
+)
+from trainings.trainings.read_model import ExerciseRecord, TrainingRecord
+
+
+def get_record(training_id: int, media=None) -> TrainingRecord:
+    record = TrainingRecord(
+        (training_id, "trainer", "A", "B", "D", "C", media, False, 3.5, 1)
+    )
+    record.exercises.append(ExerciseRecord("Plank", "Abdomen", None, 60, 1))
+    return record
+
+
+def get_training_stub(**values) -> MagicMock:
+    return MagicMock(**{
+        "media": None,
+        "id": 1,
+        "trainer_id": 1,
+        "title": "A",
+        "description": "B",
+        "difficulty.name": "C",
+        "type.name": "D",
+        "blocked": True,
+        "exercises": [],
+        "rating_average": 0,
+    } | values)
 
 
 @patch("trainings.trainings.hydrator.read", return_value="blob")
@@ -19,7 +45,7 @@ def test_when_hydrating_training_with_media_expect_read_call(
         "type.name": "D",
         "blocked": True,
         "exercises": [],
-        "ratings": [],
+        "rating_average": 0,
     })
     training_out = hydrate(training_stub, config_dummy)
     assert training_out.media == "blob"
@@ -50,7 +76,7 @@ def test_when_hydrating_training_without_media_expect_no_read_call(
         "type.name": "D",
         "blocked": True,
         "exercises": [],
-        "ratings": [],
+        "rating_average": 0,
     })
     training_out = hydrate(training_stub, config_dummy)
     assert training_out.media is None
@@ -64,3 +90,67 @@ def test_when_hydrating_training_without_media_expect_no_read_call(
     assert training_out.blocked
     assert training_out.exercises == []
     save_spy.assert_not_called()
+
+
+@patch("trainings.trainings.hydrator.read")
+def test_when_hydrating_with_downloaded_medias_expect_no_read_call(
+    read_spy: MagicMock,
+):
+    training_stub = get_training_stub(media="firebase_file_name")
+    training_out = hydrate(
+        training_stub, MagicMock(), {"firebase_file_name": "blob"}
+    )
+    assert training_out.media == "blob"
+    read_spy.assert_not_called()
+
+
+@patch("trainings.trainings.hydrator.read")
+@patch(
+    "trainings.trainings.hydrator.read_many",
+    return_value={"first": "first blob", "second": "second blob"},
+)
+def test_when_hydrating_page_expect_medias_read_in_one_batch(
+    read_many_spy: MagicMock,
+    read_spy: MagicMock,
+):
+    config_dummy = MagicMock()
+    trainings = [
+        get_training_stub(id=1, media="first"),
+        get_training_stub(id=2, media=None),
+        get_training_stub(id=3, media="second"),
+    ]
+    dtos = hydrate_page(trainings, config_dummy)
+    assert [dto.id for dto in dtos] == [1, 2, 3]
+    assert [dto.media for dto in dtos] == ["first blob", None, "second blob"]
+    read_many_spy.assert_called_once_with(
+        ["first", "second"], config_dummy, None
+    )
+    read_spy.assert_not_called()
+
+
+@patch(
+    "trainings.trainings.hydrator.read_many",
+    return_value={"first": "first blob"},
+)
+def test_when_hydrating_records_expect_dtos_and_medias_in_one_batch(
+    read_many_spy: MagicMock,
+):
+    config_dummy = MagicMock()
+    dtos = hydrate_records(
+        [get_record(1, "first"), get_record(2)], config_dummy
+    )
+    assert [dto.media for dto in dtos] == ["first blob", None]
+    assert dtos[1].dict(exclude_none=True) == {
+        "id": 2,
+        "trainer_id": "trainer",
+        "title": "A",
+        "description": "B",
+        "type": "D",
+        "difficulty": "C",
+        "blocked": False,
+        "rating": 3,
+        "exercises": [
+            {"name": "Plank", "type": "Abdomen", "count": 60, "series": 1}
+        ],
+    }
+    read_many_spy.assert_called_once_with(["first"], config_dummy, None)
@@ -0,0 +1,55 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from sqlalchemy import func, select
+
+import tests.util.constants as c
+from tests.util.data import get_session
+
+from trainings.database.models import Training
+from trainings.trainings.read_model import (
+    load_records, read_page, to_records
+)
+
+
+def test_when_loading_records_expect_fields_and_exercises():
+    with get_session() as session:
+        records = load_records(session, [2, 1])
+    assert [record.id for record in records] == [1, 2]
+    first = records[0]
+    assert first.title == "The first training."
+    assert first.type == "Cardio"
+    assert first.difficulty == "Easy"
+    assert first.rating == 4
+    assert first.version == 2
+    assert [
+        (exercise.name, exercise.unit, exercise.count, exercise.series)
+        for exercise in first.exercises
+    ] == [
+        (exercise["name"], exercise.get("unit"), exercise["count"],
+         exercise.get("series"))
+        for exercise in c.FIRST_TRAINING["exercises"]
+    ]
+    assert len(records[1].exercises) == 1
+
+
+def test_when_page_has_count_column_expect_count():
+    count = select(func.count(Training.id)).where(Training.id > 1)\
+        .correlate(None).scalar_subquery().label("count")
+    with get_session() as session:
+        page = select(Training.id, count).where(Training.id > 2).subquery()
+        records, page_count = read_page(session, page)
+    assert [record.id for record in records] == [3, 4]
+    assert page_count == 3
+
+
+def test_when_training_has_no_exercises_expect_empty_exercises():
+    row = (5, "trainer", "T", "D", "Cardio", "Easy", None, False, 0, 1)
+    records = to_records([row + (None,) * 5])
+    assert len(records) == 1
+    assert records[0].exercises == []
+
+
+def test_when_records_are_built_expect_no_instance_dict():
+    with get_session() as session:
+        record = load_records(session, [1])[0]
+    assert not hasattr(record, "__dict__")
+    assert not hasattr(record.exercises[0], "__dict__")
@@ -0,0 +1,81 @@
+# pylint: disable= missing-module-docstring, missing-function-docstring
+from unittest.mock import patch
+
+from tests.util.data import get_session
+from trainings.trainings.titles import TitleIndex, normalize, read_titles
+
+
+def get_index(*titles: str) -> TitleIndex:
+    index = TitleIndex()
+    index.set_many(enumerate(titles, start=1))
+    return index
+
+
+def test_when_normalizing_title_expect_no_accents_case_or_spaces():
+    assert normalize("  Ábdominales Rápidos ") == "abdominales rapidos"
+
+
+def test_when_suggesting_expect_matches_sorted_by_title_then_id():
+    index = get_index("Run far", "Rowing", "running", "Run fast", "Walk")
+    assert index.suggest("run", 10) == [
+        (1, "Run far"), (4, "Run fast"), (3, "running")
+    ]
+
+
+def test_when_suggesting_expect_at_most_limit_matches():
+    index = get_index("Run far", "Run fast", "Running")
+    assert index.suggest("RUN", 2) == [(1, "Run far"), (2, "Run fast")]
+
+
+def test_when_suggesting_without_accents_expect_accented_titles():
+    index = get_index("Cardio ágil", "Cardio")
+    assert index.suggest("cardio a", 10) == [(1, "Cardio ágil")]
+
+
+def test_when_no_title_has_prefix_expect_no_matches():
+    assert not get_index("Run", "Walk").suggest("swim", 10)
+
+
+def test_when_setting_new_title_expect_previous_title_forgotten():
+    index = get_index("Run", "Walk")
+    index.set(1, "Swim")
+    assert not index.suggest("run", 10)
+    assert index.suggest("sw", 10) == [(1, "Swim")]
+
+
+def test_when_loading_expect_every_training_title():
+    index = TitleIndex()
+    assert index.is_stale()
+    with get_session() as session:
+        index.load(session)
+    assert not index.is_stale()
+    assert index.suggest("the to", 10) == [
+        (2, "The tomato training."),
+    ]
+    assert len(index.suggest("the", 10)) == 3
+
+
+@patch("trainings.trainings.titles.time.monotonic")
+def test_when_index_is_older_than_max_age_expect_stale(monotonic_stub):
+    index = TitleIndex(max_age=60)
+    monotonic_stub.return_value = 100
+    with get_session() as session:
+        index.load(session)
+    monotonic_stub.return_value = 150
+    assert not index.is_stale()
+    monotonic_stub.return_value = 161
+    assert index.is_stale()
+
+
+def test_when_reading_titles_by_id_expect_only_those():
+    with get_session() as session:
+        assert read_titles(session, [2]) == [(2, "The tomato training.")]
+
+
+def test_when_suggesting_from_many_titles_expect_first_matches():
+    index = get_index(*[f"Training {number:05}" for number in range(10000)])
+    assert index.suggest("training 0999", 3) == [
+        (9991, "Training 09990"),
+        (9992, "Training 09991"),
+        (9993, "Training 09992"),
+    ]
@@ -0,0 +1,7 @@
+"""Configuration stubs for tests."""
+from unittest.mock import MagicMock
+
+
+def get_config_stub(**values) -> MagicMock:
+    """Return configuration stub with values, serializing with pydantic."""
+    return MagicMock(**({"fast_json": False} | values))
@@ -1,11 +1,14 @@
 """Database initialization for tests."""
-from typing import List, Any
+from typing import Any, Callable, List
+from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
 from trainings.database.data import (
     get_training_difficulties, get_training_types, get_exercises
 )
 
+from trainings.rating.non_bread_queries import reconcile_aggregates
 from trainings.database.models import (
+    Base,
     Training,
     TrainingExercise,
     UserRatesTraining,
@@ -195,3 +198,20 @@ def init_test_db(session: Session) -> None:
         insert_users(open_session)
         insert_user_trainings(open_session)
         insert_user_ratings(open_session)
+        reconcile_aggregates(open_session)
+
+
+def init_reference_data(session: Session) -> None:
+    """Create training types, difficulties and exercises only."""
+    with session as open_session:
+        insert_training_types(open_session)
+        insert_training_difficulties(open_session)
+        insert_exercises(open_session)
+
+
+def get_session(init: Callable[[Session], None] = init_test_db) -> Session:
+    """Return a session of a new in-memory database, filled by init."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    init(Session(bind=engine))
+    return Session(bind=engine)
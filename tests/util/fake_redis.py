@@ -0,0 +1,28 @@
+"""In memory stand in for a redis client, for cache backend tests."""
+from typing import Dict, Optional
+
+
+class FakeRedis:
+    """Implement the few redis client methods cache backends use."""
+
+    def __init__(self):
+        self.values: Dict[str, bytes] = {}
+        self.expirations: Dict[str, Optional[int]] = {}
+
+    def get(self, name: str) -> Optional[bytes]:
+        """Return value stored in name."""
+        return self.values.get(name)
+
+    def set(self, name: str, value: bytes, ex: Optional[int] = None):
+        """Store value in name, remembering its expiration."""
+        self.values[name] = value
+        self.expirations[name] = ex
+
+    def delete(self, *names: str) -> int:
+        """Remove names, return how many existed."""
+        deleted = 0
+        for name in names:
+            if self.values.pop(name, None) is not None:
+                deleted += 1
+            self.expirations.pop(name, None)
+        return deleted
@@ -0,0 +1,20 @@
+"""Count SQL statements run by an engine."""
+from contextlib import contextmanager
+from typing import Iterator, List
+
+from sqlalchemy import Engine, event
+
+
+@contextmanager
+def count_queries(engine: Engine) -> Iterator[List[str]]:
+    """Collect statements executed by engine inside the context."""
+    statements: List[str] = []
+
+    def before_cursor_execute(*args):
+        statements.append(args[2])
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
@@ -1,27 +1,110 @@
 """Authorize users to perform actions."""
 import logging
-from typing import Dict
+from hashlib import sha256
+from typing import Any, Callable, Dict, Optional
 
+import jwt
 from fastapi import HTTPException, Header, status
-from httpx import Client
+from httpx import (
+    AsyncClient, Client, Limits, Response, Timeout, TransportError
+)
 
+from trainings.cache import LRUCache
 from trainings.config import AppConfig
+from trainings.singleflight import SingleFlight
 
 
-def get_permissions(
-    headers: Header,
-    http_client: Client,
-    config: AppConfig
-) -> Dict[str, str]:
-    """Get user details from token in request header."""
-    url = f"http://{config.auth.host}/auth/credentials"
+class CredentialsCache:
+    """Cache credentials by authorization header for a while.
+
+    Rejected credentials are cached for negative_ttl seconds, not at all
+    when it is 0. Concurrent lookups of the same header make one call to
+    the auth service.
+    """
+
+    def __init__(self, max_size: int, ttl: float, negative_ttl: float):
+        self.cache = LRUCache(max_size=max_size, ttl=ttl)
+        self.negative_ttl = negative_ttl
+        self.single_flight = SingleFlight()
+
+    def get(
+        self, auth_header: str, fetch: Callable[[], Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Return cached credentials, or fetch and cache them."""
+        key = sha256(auth_header.encode("utf-8")).hexdigest()
+        cached = self.cache.get(key)
+        if isinstance(cached, HTTPException):
+            raise HTTPException(
+                status_code=cached.status_code, detail=cached.detail
+            )
+        if cached is not None:
+            return cached
+        return self.single_flight.do(key, lambda: self.fetch(key, fetch))
+
+    def fetch(
+        self, key: str, fetch: Callable[[], Dict[str, str]]
+    ) -> Dict[str, str]:
+        """Fetch credentials and cache them, or cache why they failed."""
+        try:
+            credentials = fetch()
+        except HTTPException as error:
+            if self.negative_ttl and \
+                    error.status_code < status.HTTP_500_INTERNAL_SERVER_ERROR:
+                self.cache.set(key, error, ttl=self.negative_ttl)
+            raise
+        self.cache.set(key, credentials)
+        return credentials
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters and how many lookups were coalesced."""
+        return self.cache.stats() | {
+            "coalesced": self.single_flight.coalesced
+        }
+
+
+def get_limits(config: AppConfig) -> Limits:
+    """Return connection pool limits for the auth service client."""
+    return Limits(
+        max_connections=config.auth.pool_size,
+        max_keepalive_connections=config.auth.pool_size,
+    )
+
+
+def get_timeout(config: AppConfig) -> Timeout:
+    """Return timeouts for the auth service client."""
+    return Timeout(
+        config.auth.read_timeout, connect=config.auth.connect_timeout
+    )
+
+
+def create_http_client(config: AppConfig) -> Client:
+    """Create a client to reuse connections to the auth service."""
+    return Client(limits=get_limits(config), timeout=get_timeout(config))
+
+
+def create_async_http_client(config: AppConfig) -> AsyncClient:
+    """Create an async client to reuse connections to the auth service."""
+    return AsyncClient(limits=get_limits(config), timeout=get_timeout(config))
+
+
+def get_credentials_url(config: AppConfig) -> str:
+    """Return auth service URL to get credentials."""
+    return f"http://{config.auth.host}/auth/credentials"
+
+
+def get_authorization_header(headers: Header) -> str:
+    """Return authorization header or throw HTTP 403 error."""
     auth_header = headers.get("Authorization")
     if not auth_header:
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Authorization header MUST BE send."
         )
-    credentials = http_client.get(url, headers={"Authorization": auth_header})
+    return auth_header
+
+
+def get_credentials_data(credentials: Response) -> Dict[str, str]:
+    """Return user details from auth service response."""
     if credentials.status_code != status.HTTP_200_OK:
         logging.error(
             "Error getting token. Status code: %s, Error: %s",
@@ -42,6 +125,129 @@ def get_permissions(
         ) from json_exception
 
 
+def get_unavailable_error(error: TransportError) -> HTTPException:
+    """Return HTTP 503 error for when the auth service can't be reached."""
+    logging.error("Error calling auth service: %s", error)
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail="Authorization service unavailable."
+    )
+
+
+def get_permissions(
+    headers: Header,
+    http_client: Client,
+    config: AppConfig,
+    cache: Optional[CredentialsCache] = None,
+) -> Dict[str, str]:
+    """Get user details from token in request header."""
+    auth_header = get_authorization_header(headers)
+
+    def fetch() -> Dict[str, str]:
+        try:
+            credentials = http_client.get(
+                get_credentials_url(config),
+                headers={"Authorization": auth_header},
+            )
+        except TransportError as error:
+            raise get_unavailable_error(error) from error
+        return get_credentials_data(credentials)
+
+    if cache is None:
+        return fetch()
+    return cache.get(auth_header, fetch)
+
+
+async def get_permissions_async(
+    headers: Header,
+    http_client: AsyncClient,
+    config: AppConfig
+) -> Dict[str, str]:
+    """Get user details from token in request header, without blocking."""
+    auth_header = get_authorization_header(headers)
+    try:
+        credentials = await http_client.get(
+            get_credentials_url(config), headers={"Authorization": auth_header}
+        )
+    except TransportError as error:
+        raise get_unavailable_error(error) from error
+    return get_credentials_data(credentials)
+
+
+class TokenVerifier:
+    """Verify signed tokens locally instead of calling the auth service.
+
+    Keys come from the configured JWKS, a URL (keys are cached and fetched
+    again when a token has an unknown key id) or a file, or from a PEM
+    public key.
+    """
+
+    def __init__(self, config: AppConfig):
+        self.algorithms = [
+            name.strip() for name in config.auth.algorithms.split(",")
+        ]
+        self.audience = config.auth.audience or None
+        self.issuer = config.auth.issuer or None
+        self.role_claim = config.auth.role_claim
+        self.public_key = config.auth.public_key.replace(r"\n", "\n")
+        self.jwks_client: Optional[jwt.PyJWKClient] = None
+        self.jwks: Optional[jwt.PyJWKSet] = None
+        if config.auth.jwks.startswith(("http://", "https://")):
+            self.jwks_client = jwt.PyJWKClient(
+                config.auth.jwks, lifespan=config.auth.jwks_ttl
+            )
+        elif config.auth.jwks:
+            with open(config.auth.jwks, encoding="utf-8") as jwks_file:
+                self.jwks = jwt.PyJWKSet.from_json(jwks_file.read())
+
+    def get_key(self, token: str) -> Any:
+        """Return the key that signed token."""
+        if self.jwks_client is not None:
+            return self.jwks_client.get_signing_key_from_jwt(token).key
+        if self.jwks is not None:
+            key_id = jwt.get_unverified_header(token).get("kid")
+            if key_id is None and len(self.jwks.keys) == 1:
+                return self.jwks.keys[0].key
+            return self.jwks[key_id].key
+        return self.public_key
+
+    def verify(self, auth_header: str) -> Dict[str, str]:
+        """Return token claims with role, or throw HTTP 403 error."""
+        token = auth_header.removeprefix("Bearer ").strip()
+        try:
+            claims = jwt.decode(
+                token,
+                self.get_key(token),
+                algorithms=self.algorithms,
+                audience=self.audience,
+                issuer=self.issuer,
+            )
+        except jwt.PyJWKClientConnectionError as error:
+            logging.error("Error getting token keys: %s", error)
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Authorization service unavailable."
+            ) from error
+        except (jwt.PyJWTError, KeyError) as error:
+            logging.error("Invalid token: %s", error)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token."
+            ) from error
+        if self.role_claim not in claims:
+            logging.error("Token has no %s claim.", self.role_claim)
+            raise HTTPException(
+                status_code=status.HTTP_403_FORBIDDEN, detail="Invalid token."
+            )
+        return claims | {"role": claims[self.role_claim]}
+
+
+def verify_permissions(
+    headers: Header, verifier: TokenVerifier
+) -> Dict[str, str]:
+    """Get user details from the token in request header, locally."""
+    return verifier.verify(get_authorization_header(headers))
+
+
 def assert_can_create_training(permissions: Dict[str, str]) -> bool:
     """Raise HTTPException if user can't create training."""
     # When role accept trainer for value change this.
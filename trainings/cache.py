@@ -0,0 +1,193 @@
+"""Caches, in process or shared between replicas."""
+import logging
+import time
+from collections import OrderedDict
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional, Protocol, Tuple
+
+from trainings.config import AppConfig
+
+try:
+    import redis
+except ImportError:  # pragma: no cover
+    redis = None  # pylint: disable=invalid-name
+
+
+def count_one(_: Any) -> int:
+    """Size of an entry when the cache is bounded by number of entries."""
+    return 1
+
+
+class LRUCache:  # pylint: disable=too-many-instance-attributes
+    """Thread safe least recently used cache with optional time to live.
+
+    The cache holds at most max_size, measured by adding sizeof of every
+    value. By default each value weighs one, so max_size is an entry count.
+    A ttl of None or 0 means entries only leave the cache when evicted or
+    invalidated.
+    """
+
+    def __init__(
+        self,
+        max_size: int,
+        ttl: Optional[float] = None,
+        sizeof: Callable[[Any], int] = count_one,
+    ):
+        self.max_size = max_size
+        self.ttl = ttl or None
+        self.sizeof = sizeof
+        self.size = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: OrderedDict[
+            Hashable, Tuple[Any, int, Optional[float]]
+        ] = OrderedDict()
+        self._lock = Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return cached value or default when missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return default
+            value, _, expires_at = entry
+            if expires_at is not None and expires_at <= time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(
+        self, key: Hashable, value: Any, ttl: Optional[float] = None
+    ) -> None:
+        """Store value, evicting least recently used entries if needed.
+
+        A ttl overrides the cache time to live for this entry.
+        """
+        size = self.sizeof(value)
+        ttl = ttl or self.ttl
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            if size > self.max_size:
+                return
+            expires_at = time.monotonic() + ttl if ttl else None
+            self._entries[key] = (value, size, expires_at)
+            self.size += size
+            while self.size > self.max_size:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+
+    def invalidate(self, key: Hashable) -> bool:
+        """Remove key from the cache, return whether it was cached."""
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+
+    def clear(self) -> None:
+        """Remove every entry, counters are kept."""
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return cache counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "size": self.size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _remove(self, key: Hashable) -> None:
+        """Remove an entry, caller must hold the lock."""
+        _, size, _ = self._entries.pop(key)
+        self.size -= size
+
+
+class CacheBackend(Protocol):
+    """Storage for serialized values, keyed by string."""
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return value or None when missing or expired."""
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        """Store value for ttl seconds, forever when ttl is None or 0."""
+
+    def delete(self, key: str) -> None:
+        """Remove key."""
+
+
+class LocalBackend:
+    """Cache backend in process memory, bounded by bytes stored."""
+
+    def __init__(self, max_size: int):
+        self.cache = LRUCache(max_size=max_size, sizeof=len)
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return value or None when missing or expired."""
+        return self.cache.get(key)
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        """Store value for ttl seconds, forever when ttl is None or 0."""
+        self.cache.set(key, value, ttl=ttl)
+
+    def delete(self, key: str) -> None:
+        """Remove key."""
+        self.cache.invalidate(key)
+
+
+class RedisBackend:
+    """Cache backend shared between replicas, stored in redis.
+
+    Errors talking to redis are logged and treated as misses, so the
+    service keeps working from the database when redis is down.
+    """
+
+    def __init__(self, client: Any, prefix: str = "trainings:"):
+        self.client = client
+        self.prefix = prefix
+
+    def get(self, key: str) -> Optional[bytes]:
+        """Return value or None when missing or expired."""
+        try:
+            return self.client.get(self.prefix + key)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logging.error("Error reading %s from redis: %s", key, error)
+            return None
+
+    def set(self, key: str, value: bytes, ttl: Optional[float]) -> None:
+        """Store value for ttl seconds, forever when ttl is None or 0."""
+        try:
+            expiration = int(ttl) if ttl else None
+            self.client.set(self.prefix + key, value, ex=expiration)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logging.error("Error writing %s to redis: %s", key, error)
+
+    def delete(self, key: str) -> None:
+        """Remove key."""
+        try:
+            self.client.delete(self.prefix + key)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logging.error("Error deleting %s from redis: %s", key, error)
+
+
+def create_backend(config: AppConfig, max_size: int) -> CacheBackend:
+    """Return configured cache backend, max_size bounds local backends."""
+    if config.cache.backend == "redis":
+        if redis is None:
+            raise RuntimeError("Install redis to use the redis cache backend.")
+        return RedisBackend(redis.Redis.from_url(config.cache.redis_url))
+    return LocalBackend(max_size)
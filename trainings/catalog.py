@@ -0,0 +1,24 @@
+"""Responses built from reference data, serialized once per version."""
+from threading import Lock
+from typing import Callable, Optional, Tuple
+
+from trainings.database.reference import ReferenceData
+
+
+class Catalog:
+    """Keep a response body serialized, rebuilding it when data changes."""
+
+    def __init__(self, serialize: Callable[[ReferenceData], bytes]):
+        self.serialize = serialize
+        self._built: Optional[Tuple[str, bytes]] = None
+        self._lock = Lock()
+
+    def get(self, data: ReferenceData) -> bytes:
+        """Return body for data, serializing it if its version is new."""
+        built = self._built
+        if built is None or built[0] != data.version:
+            with self._lock:
+                built = self._built
+                if built is None or built[0] != data.version:
+                    built = self._built = (data.version, self.serialize(data))
+        return built[1]
@@ -7,6 +7,22 @@ class AppConfig:
     """Application configuration values from environment."""
 
     log_level = var("WARNING")
+    # Request handlers run in a threadpool of this size.
+    request_threads = var(40, converter=int)
+    # Seconds identical reads wait for the one running, 0 waits until done.
+    coalescing_timeout = var(5.0, converter=float)
+    # Seconds before types, difficulties and exercises are read again.
+    reference_max_age = var(300, converter=int)
+    # Seconds clients may reuse types and exercises responses.
+    catalog_max_age = var(300, converter=int)
+    # Serialize responses with orjson, when installed.
+    fast_json = bool_var(False)
+    # Trainings inserted per statement and transaction by bulk imports.
+    bulk_chunk_size = var(500, converter=int)
+    # Trainings fetched from the cursor and serialized at once by exports.
+    export_batch_size = var(500, converter=int)
+    # Seconds before the title index is built again, to see other replicas.
+    titles_max_age = var(300, converter=int)
 
     @config
     class DB:
@@ -20,6 +36,8 @@ class AppConfig:
         database = var("postgres")
         create_structures = bool_var(False)
         ssl = bool_var(True)
+        pool_size = var(20, converter=int)
+        max_overflow = var(20, converter=int)
 
     @config
     class AUTH:
@@ -27,6 +45,24 @@ class AppConfig:
 
         host = var("auth-service.fiufit.svc.cluster.local:8002")
         validate_credentials = bool_var(True)
+        # remote asks the auth service, local verifies token signatures.
+        mode = var("remote")
+        public_key = var("")
+        # JWKS URL or file path, used instead of public_key when set.
+        jwks = var("")
+        jwks_ttl = var(300, converter=int)
+        algorithms = var("RS256")
+        audience = var("")
+        issuer = var("")
+        role_claim = var("role")
+        pool_size = var(10, converter=int)
+        connect_timeout = var(1.0, converter=float)
+        read_timeout = var(5.0, converter=float)
+        # Seconds to cache credentials, 0 disables the cache.
+        cache_ttl = var(30, converter=int)
+        # Seconds to cache rejected credentials, 0 does not cache them.
+        cache_negative_ttl = var(5, converter=int)
+        cache_size = var(1000, converter=int)
 
     @config(prefix="FIREBASE")
     class Firebase:
@@ -50,7 +86,27 @@ class AppConfig:
             "firebase-adminsdk-zwduu%40taller2-fiufit.iam.gserviceaccount.com"
         )
         storage_bucket: str = var("taller2-fiufit.appspot.com")
+        media_workers: int = var(8, converter=int)
+        media_cache_size: int = var(64 * 1024 * 1024, converter=int)
+        media_cache_ttl: int = var(0, converter=int)
+
+    @config
+    class CACHE:
+        """Response caches configuration."""
+
+        # local keeps entries in each replica, redis shares them.
+        backend = var("local")
+        redis_url = var("redis://localhost:6379/0")
+        # Bytes of serialized trainings kept by the local backend.
+        training_size = var(64 * 1024 * 1024, converter=int)
+        # Seconds to cache a training, 0 keeps it until it changes.
+        training_ttl = var(300, converter=int)
+        # Bytes of search result ids kept by the local backend.
+        search_size = var(4 * 1024 * 1024, converter=int)
+        # Seconds to cache a search result, writes also invalidate it.
+        search_ttl = var(30, converter=int)
 
     db = group(DB)  # type: ignore
     auth = group(AUTH)  # type: ignore
     firebase = group(Firebase)
+    cache = group(CACHE)  # type: ignore
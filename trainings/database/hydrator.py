@@ -1,72 +1,85 @@
 """Hydrate database model objects from DTOs."""
 import logging
+from typing import Any, Dict, List, Tuple
 from fastapi import HTTPException, status
-from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm import Session
 
-from trainings.database.models import (
-    Difficulty,
-    Exercise,
-    Training,
-    TrainingExercise,
-    TrainingType,
-)
+from trainings.database.models import Training
+from trainings.database.reference import REFERENCE_DATA
 from trainings.trainings.dto import TrainingIn
 
 
-def hydrate(session: Session, training: TrainingIn) -> Training:
-    """Create a database model object from a HTTP API DTO."""
-    exercises = []
+def get_exercises(
+    session: Session, training: TrainingIn
+) -> List[Dict[str, Any]]:
+    """Return training exercise rows, resolving every exercise at once.
+
+    Throw HTTP 404 error listing all unknown exercises.
+    """
     logging.info("Building exercises for training...")
-    for training_exercise in training.exercises:
-        logging.debug(
-            "Building exercise %s", training_exercise.dict()
+    keys = [(exercise.name, exercise.unit) for exercise in training.exercises]
+    exercise_ids = REFERENCE_DATA.exercise_ids(session, keys)
+    unknown = list(dict.fromkeys(
+        f"{name} {unit}"
+        for (name, unit), exercise_id in zip(keys, exercise_ids)
+        if exercise_id is None
+    ))
+    if unknown:
+        detail = f"Could not save training. Exercise {unknown[0]} not found."
+        if len(unknown) > 1:
+            detail = "Could not save training. Exercises "\
+                f"{', '.join(unknown)} not found."
+        logging.warning(detail)
+        raise HTTPException(
+            detail=detail, status_code=status.HTTP_404_NOT_FOUND
         )
-        try:
-            exercises.append(
-                TrainingExercise(
-                    exercise=session.query(Exercise).filter(
-                        Exercise.name == training_exercise.name,
-                        Exercise.unit == training_exercise.unit
-                    ).one(),
-                    count=training_exercise.count,
-                    series=training_exercise.series
-                )
-            )
-        except NoResultFound as error:
-            detail = "Could not save training. Exercise "\
-                f"{training_exercise.name} {training_exercise.unit} not found."
-            logging.warning(detail)
-            raise HTTPException(
-                detail=detail, status_code=status.HTTP_404_NOT_FOUND
-            ) from error
+    return [
+        {
+            "exercise_id": exercise_id,
+            "count": exercise.count,
+            "series": exercise.series,
+        }
+        for exercise, exercise_id in zip(training.exercises, exercise_ids)
+    ]
+
+
+def get_rows(
+    session: Session, training: TrainingIn
+) -> Tuple[Dict[str, Any], List[Dict[str, Any]]]:
+    """Return training row and training exercise rows from a HTTP API DTO.
+
+    Throw HTTP 404 error when type, difficulty or exercises are unknown.
+    """
+    exercises = get_exercises(session, training)
     logging.info("Building training...")
-    try:
-        training_type = session.query(TrainingType).filter(
-            TrainingType.name == training.type
-        ).one()
-    except NoResultFound as error:
+    type_id = REFERENCE_DATA.type_id(session, training.type)
+    if type_id is None:
         detail = f"Could not save training. Type {training.type} not found."
         logging.warning(detail)
         raise HTTPException(
             detail=detail, status_code=status.HTTP_404_NOT_FOUND
-        ) from error
-    try:
-        training_difficulty = session.query(Difficulty).filter(
-            Difficulty.name == training.difficulty
-        ).one()
-    except NoResultFound as error:
+        )
+    difficulty_id = REFERENCE_DATA.difficulty_id(session, training.difficulty)
+    if difficulty_id is None:
         detail = "Could not save training. Difficulty "\
             f"{training.difficulty} not found."
         logging.warning(detail)
         raise HTTPException(
             detail=detail, status_code=status.HTTP_404_NOT_FOUND
-        ) from error
-    foreign_keys = {
-        "exercises": exercises,
-        "type": training_type,
-        "difficulty": training_difficulty,
-    }
-    fields = training.dict() | foreign_keys
-    logging.debug("Exercise built %s", fields)
-    return Training(**fields)
+        )
+    foreign_keys = {"type_id": type_id, "difficulty_id": difficulty_id}
+    fields = training.dict(exclude={"type", "difficulty", "exercises"})\
+        | foreign_keys
+    logging.debug("Training built %s", fields)
+    return fields, exercises
+
+
+def hydrate(
+    session: Session, training: TrainingIn
+) -> Tuple[Training, List[Dict[str, Any]]]:
+    """Create a database model object from a HTTP API DTO.
+
+    Training exercises are returned as rows, to insert them in bulk.
+    """
+    fields, exercises = get_rows(session, training)
+    return Training(**fields), exercises
@@ -0,0 +1,22 @@
+"""Loader options choosing how each query loads relationships.
+
+Many to one relationships are joined. Collections are selected with IN,
+so parent rows are not repeated once per child, or multiplied when a page
+is wrapped in a subquery for LIMIT and OFFSET.
+"""
+from sqlalchemy.orm import joinedload, raiseload, selectinload
+
+from trainings.database.models import Exercise, Training, TrainingExercise
+
+# Everything a training DTO shows, in two queries. Ratings are never
+# loaded, rating aggregates are kept in the training.
+TRAINING_DETAIL = (
+    joinedload(Training.type),
+    joinedload(Training.difficulty),
+    selectinload(Training.exercises)
+    .joinedload(TrainingExercise.exercise)
+    .joinedload(Exercise.type),
+    raiseload(Training.ratings),
+)
+
+EXERCISE_WITH_TYPE = (joinedload(Exercise.type),)
@@ -1,4 +1,8 @@
-"""Defines table structure for each table in the database."""
+"""Defines table structure for each table in the database.
+
+Relationships load lazily, queries choose how to load them with loader
+options, see trainings.database.loaders.
+"""
 from typing import List
 from sqlalchemy import Boolean, Column, Float, ForeignKey, String, Integer
 from sqlalchemy.orm import (
@@ -34,7 +38,7 @@ class Exercise(Base):
     unit = Column(String, nullable=True)  # Km, minute
 
     # Relationships
-    type: Mapped["TrainingType"] = relationship(lazy="joined")
+    type: Mapped["TrainingType"] = relationship()
 
 
 class TrainingExercise(Base):
@@ -48,10 +52,8 @@ class TrainingExercise(Base):
     series = Column(Integer)
 
     # Relationships
-    training: Mapped["Training"] = relationship(
-        lazy="joined", back_populates="exercises"
-    )
-    exercise: Mapped["Exercise"] = relationship(lazy="joined")
+    training: Mapped["Training"] = relationship(back_populates="exercises")
+    exercise: Mapped["Exercise"] = relationship()
 
 
 class Training(Base):
@@ -66,16 +68,23 @@ class Training(Base):
     difficulty_id: Mapped[int] = mapped_column(ForeignKey("difficulty.id"))
     media = Column(String)
     blocked: Mapped[bool] = mapped_column(default=False)
+    # Aggregates of user_rates_training, maintained when rating.
+    rating_sum: Mapped[float] = mapped_column(default=0, server_default="0")
+    rating_count: Mapped[int] = mapped_column(default=0, server_default="0")
+    rating_average: Mapped[float] = mapped_column(
+        default=0, server_default="0"
+    )
+    # Incremented by every update, to tell clients if the training changed.
+    version: Mapped[int] = mapped_column(default=1, server_default="1")
 
     # Relationships
-    type: Mapped["TrainingType"] = relationship(lazy="joined")
-    difficulty: Mapped["Difficulty"] = relationship(lazy="joined")
+    type: Mapped["TrainingType"] = relationship()
+    difficulty: Mapped["Difficulty"] = relationship()
     exercises: Mapped[List["TrainingExercise"]] = relationship(
-        lazy="joined", back_populates="training"
+        back_populates="training", order_by="TrainingExercise.id"
     )
     ratings: Mapped[List["UserRatesTraining"]] = relationship(
-        lazy="immediate",
-        back_populates="training",
+        back_populates="training"
     )
 
 
@@ -97,7 +106,9 @@ class Users(Base):
     is_blocked = Column(Boolean)
 
     # Relationships
-    trainings: Mapped[List["UserTraining"]] = relationship(lazy="joined")
+    trainings: Mapped[List["UserTraining"]] = relationship(
+        back_populates="user"
+    )
 
 
 class UserTraining(Base):
@@ -112,10 +123,8 @@ class UserTraining(Base):
     )
 
     # Relationships
-    user: Mapped["Users"] = relationship(
-        lazy="joined", back_populates="trainings"
-    )
-    training: Mapped["Training"] = relationship(lazy="joined")
+    user: Mapped["Users"] = relationship(back_populates="trainings")
+    training: Mapped["Training"] = relationship()
 
 
 class UserRatesTraining(Base):
@@ -130,6 +139,4 @@ class UserRatesTraining(Base):
     )
     rating = Column(Float)
 
-    training: Mapped["Training"] = relationship(
-        lazy="joined", back_populates="ratings"
-    )
+    training: Mapped["Training"] = relationship(back_populates="ratings")
@@ -0,0 +1,160 @@
+"""In-process registry of reference data: types, difficulties, exercises."""
+import logging
+import time
+from hashlib import sha1
+from threading import Lock
+from typing import (
+    Callable, Dict, List, NamedTuple, Optional, Tuple, TypeVar
+)
+
+from sqlalchemy.orm import Session
+
+from trainings.database.loaders import EXERCISE_WITH_TYPE
+from trainings.database.models import Difficulty, Exercise, TrainingType
+
+T = TypeVar("T")
+
+
+class ReferenceData(NamedTuple):
+    """Snapshot of reference tables, names mapped to ids sorted by id.
+
+    exercise_rows has name, type name and unit of each exercise.
+    """
+
+    version: str
+    types: Dict[str, int]
+    difficulties: Dict[str, int]
+    exercises: Dict[Tuple[str, Optional[str]], int]
+    exercise_rows: List[Tuple[str, str, Optional[str]]]
+
+
+def load(session: Session) -> ReferenceData:
+    """Read reference tables into a snapshot."""
+    logging.info("Loading reference data...")
+    types = {
+        str(training_type.name): training_type.id
+        for training_type in session.query(TrainingType)
+        .order_by(TrainingType.id)
+    }
+    difficulties = {
+        str(difficulty.name): difficulty.id
+        for difficulty in session.query(Difficulty).order_by(Difficulty.id)
+    }
+    exercises = {}
+    exercise_rows = []
+    query = session.query(Exercise).options(*EXERCISE_WITH_TYPE)\
+        .order_by(Exercise.id)
+    for exercise in query:
+        exercises[(str(exercise.name), exercise.unit)] = exercise.id
+        exercise_rows.append(
+            (str(exercise.name), str(exercise.type.name), exercise.unit)
+        )
+    version = sha1(
+        repr((types, difficulties, exercises, exercise_rows)).encode("utf-8")
+    ).hexdigest()
+    return ReferenceData(
+        version, types, difficulties, exercises, exercise_rows
+    )
+
+
+class ReferenceDataRegistry:
+    """Keep reference data in memory, loading it from the database once.
+
+    A lookup that misses reloads the snapshot when it is older than
+    refresh_interval seconds, so rows added after loading are found without
+    letting unknown names query the database on every request. With a
+    max_age, the snapshot is also reloaded when older than max_age seconds.
+    Requests finding the same snapshot stale load it once between them.
+    """
+
+    def __init__(
+        self, refresh_interval: float = 60, max_age: Optional[float] = None
+    ):
+        self.refresh_interval = refresh_interval
+        self.max_age = max_age
+        self._data: Optional[ReferenceData] = None
+        self._loaded_at = 0.0
+        self._lock = Lock()
+
+    def get(self, session: Session) -> ReferenceData:
+        """Return reference data, loading it if needed."""
+        return self._get(session)[0]
+
+    def refresh(self, session: Session) -> ReferenceData:
+        """Load reference data from the database."""
+        return self._load(session)[0]
+
+    def invalidate(self) -> None:
+        """Forget loaded data, next lookup loads it again."""
+        self._data = None
+
+    def type_id(self, session: Session, name: str) -> Optional[int]:
+        """Return training type id by name."""
+        return self._lookup(session, lambda data: data.types.get(name))
+
+    def difficulty_id(self, session: Session, name: str) -> Optional[int]:
+        """Return difficulty id by name."""
+        return self._lookup(session, lambda data: data.difficulties.get(name))
+
+    def exercise_id(
+        self, session: Session, name: str, unit: Optional[str]
+    ) -> Optional[int]:
+        """Return exercise id by name and unit."""
+        return self._lookup(
+            session, lambda data: data.exercises.get((name, unit))
+        )
+
+    def exercise_ids(
+        self, session: Session, keys: List[Tuple[str, Optional[str]]]
+    ) -> List[Optional[int]]:
+        """Return exercise ids by name and unit, None for unknown ones."""
+        data, loaded_at = self._get(session)
+        ids = [data.exercises.get(key) for key in keys]
+        if None in ids and self._is_old(loaded_at):
+            data = self._load(session, stale_at=loaded_at)[0]
+            ids = [data.exercises.get(key) for key in keys]
+        return ids
+
+    def _get(self, session: Session) -> Tuple[ReferenceData, float]:
+        """Return reference data and when it was loaded, loading if needed."""
+        loaded_at = self._loaded_at
+        data = self._data
+        if data is None or (
+            self.max_age and time.monotonic() - loaded_at > self.max_age
+        ):
+            return self._load(session, stale_at=loaded_at)
+        return data, loaded_at
+
+    def _load(
+        self, session: Session, stale_at: Optional[float] = None
+    ) -> Tuple[ReferenceData, float]:
+        """Load reference data, return it and when it was loaded.
+
+        With stale_at, the load time of the data found stale, data that
+        another thread loaded while waiting for the lock is returned
+        instead of loading it again.
+        """
+        with self._lock:
+            if stale_at is None or self._data is None \
+                    or self._loaded_at == stale_at:
+                self._data = load(session)
+                self._loaded_at = time.monotonic()
+                logging.info("Reference data version %s.", self._data.version)
+            return self._data, self._loaded_at
+
+    def _is_old(self, loaded_at: float) -> bool:
+        """Return whether data can be reloaded when a lookup misses."""
+        return time.monotonic() - loaded_at >= self.refresh_interval
+
+    def _lookup(
+        self, session: Session, getter: Callable[[ReferenceData], T]
+    ) -> Optional[T]:
+        """Look a value up, reloading once if data is old enough."""
+        data, loaded_at = self._get(session)
+        value = getter(data)
+        if value is None and self._is_old(loaded_at):
+            value = getter(self._load(session, stale_at=loaded_at)[0])
+        return value
+
+
+REFERENCE_DATA = ReferenceDataRegistry()
@@ -1,5 +1,5 @@
 """Handles database connection."""
-from sqlalchemy import URL
+from sqlalchemy import URL, Engine, create_engine
 
 from trainings.config import AppConfig
 
@@ -14,3 +14,14 @@ def get_database_url(config: AppConfig) -> URL:
         port=config.db.port,
         database=config.db.database,
     )
+
+
+def get_engine(config: AppConfig) -> Engine:
+    """Return a database engine."""
+    return create_engine(
+        get_database_url(config),
+        connect_args={"sslmode": "require" if config.db.ssl else "disable"},
+        pool_pre_ping=True,
+        pool_size=config.db.pool_size,
+        max_overflow=config.db.max_overflow,
+    )
@@ -0,0 +1,28 @@
+"""Entity tags for conditional GET requests."""
+from typing import Optional
+
+from fastapi import Response, status
+
+
+def make_etag(*parts: object) -> str:
+    """Return a strong entity tag made of parts."""
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Return whether If-None-Match header value matches etag.
+
+    Tags are compared ignoring the weak prefix, as RFC 9110 asks for
+    If-None-Match.
+    """
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or etag in [tag.removeprefix("W/") for tag in tags]
+
+
+def not_modified(etag: str) -> Response:
+    """Return an empty 304 response for etag."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag}
+    )
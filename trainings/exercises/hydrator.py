@@ -1,18 +1,14 @@
-"""Hydrate DTOs from database objects."""
-from typing import List
-from trainings.database.models import Exercise
+"""Hydrate DTOs from reference data."""
+from trainings.database.reference import ReferenceData
 from trainings.exercises.dto import Exercise as ExerciseDto, ExercisesOut
 
 
-def hydrate(exercises: List[Exercise]) -> ExercisesOut:
-    """Create an HTTP DTO from a database model object."""
-    exercises_out = ExercisesOut(items=[])
-    for exercise in exercises:
-        exercises_out.items.append(
-            ExerciseDto(
-                name=exercise.name,
-                type=exercise.type.name,
-                unit=exercise.unit,
-            )
-        )
-    return exercises_out
+def serialize(data: ReferenceData) -> bytes:
+    """Return exercises DTO from reference data, as JSON without nulls."""
+    exercises_out = ExercisesOut(
+        items=[
+            ExerciseDto(name=name, type=exercise_type, unit=unit)
+            for name, exercise_type, unit in data.exercise_rows
+        ]
+    )
+    return exercises_out.json(exclude_none=True).encode("utf-8")
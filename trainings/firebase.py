@@ -2,11 +2,13 @@
 import logging
 import random
 import string
-from typing import Any, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from firebase_admin import initialize_app, storage, get_app
 from firebase_admin.credentials import Certificate
 from google.cloud.exceptions import NotFound
 
+from trainings.cache import LRUCache
 from trainings.config import AppConfig
 
 
@@ -65,6 +67,34 @@ def save(media: str, trainer_id: str, config: AppConfig) -> str:
     return file_name
 
 
+def save_many(
+    medias: List[Tuple[str, str]], config: AppConfig
+) -> List[Optional[str]]:
+    """Save several (media, trainer id) in firebase concurrently.
+
+    Return media ids in the same order, None for medias that failed.
+    """
+    if not medias:
+        return []
+    initialize(config)
+    workers = min(config.firebase.media_workers, len(medias))
+    logging.info(
+        "Uploading %s medias with %s workers...", len(medias), workers
+    )
+
+    def save_or_none(media: str, trainer_id: str) -> Optional[str]:
+        try:
+            return save(media, trainer_id, config)
+        except Exception as error:  # pylint: disable=broad-exception-caught
+            logging.error(
+                "Could not save media of trainer %s: %s", trainer_id, error
+            )
+            return None
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(executor.map(lambda item: save_or_none(*item), medias))
+
+
 def read(name: str, config: AppConfig) -> Optional[str]:
     """Read file from firebase."""
     initialize(config)
@@ -77,3 +107,40 @@ def read(name: str, config: AppConfig) -> Optional[str]:
         logging.error("Blob of media named %s not found. Error: %s", name, e)
         media = None
     return media
+
+
+def read_many(
+    names: Iterable[str],
+    config: AppConfig,
+    cache: Optional[LRUCache] = None,
+) -> Dict[str, Optional[str]]:
+    """Read several files from firebase concurrently, keyed by name.
+
+    Names found in cache are not downloaded, downloaded medias are cached.
+    """
+    medias: Dict[str, Optional[str]] = {}
+    names_to_download = []
+    for name in dict.fromkeys(names):
+        media = cache.get(name) if cache is not None else None
+        if media is None:
+            names_to_download.append(name)
+        else:
+            medias[name] = media
+    if not names_to_download:
+        return medias
+    initialize(config)
+    workers = min(config.firebase.media_workers, len(names_to_download))
+    logging.info(
+        "Downloading %s medias with %s workers...",
+        len(names_to_download),
+        workers,
+    )
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        downloaded = executor.map(
+            lambda name: read(name, config), names_to_download
+        )
+        for name, media in zip(names_to_download, downloaded):
+            medias[name] = media
+            if cache is not None and media is not None:
+                cache.set(name, media)
+    return medias
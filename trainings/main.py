@@ -1,65 +1,103 @@
 """Requests handlers."""
 import time
 import logging
+from typing import Callable, List
 
-from fastapi import Depends, FastAPI, HTTPException, Request, status
+from anyio.to_thread import current_default_thread_limiter
+from fastapi import (
+    Body, Depends, FastAPI, Header, HTTPException, Request, Response, status
+)
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from fastapi.applications import get_swagger_ui_html
+from starlette.background import BackgroundTask
 from environ import to_config
 from newrelic.agent import (
     record_custom_metric as record_metric,
     register_application,
 )
-from sqlalchemy import create_engine
 from sqlalchemy.orm import Session
-from sqlalchemy.exc import IntegrityError
-from httpx import Client
-
-from trainings.authorization import assert_can_create_training, get_permissions
+from sqlalchemy.exc import IntegrityError, SQLAlchemyError
+
+from trainings.authorization import (
+    CredentialsCache,
+    TokenVerifier,
+    assert_can_create_training,
+    create_http_client,
+    get_permissions,
+    verify_permissions,
+)
+from trainings.cache import LRUCache, create_backend
+from trainings.catalog import Catalog
 from trainings.config import AppConfig
-from trainings.database.url import get_database_url
+from trainings.database.url import get_engine
 from trainings.database.models import Base
 from trainings.database.hydrator import hydrate as hydrate_model
 from trainings.database.data import init_db
+from trainings.database.reference import REFERENCE_DATA
+from trainings.etag import make_etag, matches, not_modified
 from trainings.request.helper import (
+    assert_user_and_training_exist,
+    assert_user_exists,
     read_training,
-    read_user,
     read_rating,
 )
 from trainings.healthcheck import HealthCheckDto
+from trainings.serialization import get_encoder
+from trainings.singleflight import SingleFlight
+from trainings.pagination import get_page
+from trainings.trainings.bulk import import_trainings as import_lines
 from trainings.trainings.dto import (
+    BulkImportResult,
     TrainingIn,
     TrainingOut,
     TrainingPatch,
     TrainingsWithPagination,
     TrainingFilters,
+    TitleSuggestion,
+    TitleSuggestions,
 )
-from trainings.trainings.dao import browse, add, edit
-from trainings.trainings.non_bread_queries import (
-    get_count as get_training_count
+from trainings.trainings.cache import (
+    CachedTraining,
+    SearchCache,
+    SearchPage,
+    TrainingCache,
+    serialize_page,
 )
-from trainings.trainings.helper import get_columns_and_values
-from trainings.trainings.hydrator import hydrate as hydrate_dto
+from trainings.trainings.dao import add, edit, read_version
+from trainings.trainings.export import compress, export
+from trainings.trainings.non_bread_queries import search
+from trainings.trainings.helper import get_columns_and_values, get_criteria
+from trainings.trainings.hydrator import (
+    hydrate as hydrate_dto,
+    hydrate_page,
+    hydrate_records,
+)
+from trainings.trainings.read_model import TrainingRecord, load_records
+from trainings.trainings.titles import TitleIndex, read_titles
 from trainings.training_types.dto import TrainingTypesOut
-from trainings.training_types.dao import browse as browse_types
-from trainings.training_types.hydrator import hydrate as hydrate_training_types
+from trainings.training_types.hydrator import (
+    serialize as serialize_training_types
+)
 from trainings.exercises.dto import ExercisesOut
-from trainings.exercises.dao import browse as browse_exercises
-from trainings.exercises.hydrator import hydrate as hydrate_exercises
+from trainings.exercises.hydrator import serialize as serialize_exercises
 from trainings.firebase import save
 from trainings.user_trainings.dto import UserTrainingIn
 from trainings.user_trainings.dao import (
     add as add_user_training,
-    browse as browse_user_trainings,
     delete as delete_user_training,
 )
 from trainings.user_trainings.non_bread_queries import (
-    get_count as get_favourite_trainings_count
+    search as search_user_trainings
 )
 from trainings.rating.dto import TrainingRating
 from trainings.rating.dao import add as add_rating
 
 BASE_URI = "/trainings"
+BULK_URI = BASE_URI + "/bulk"
+EXPORT_URI = BASE_URI + "/export"
+SUGGEST_URI = BASE_URI + "/titles/suggest"
+MAX_SUGGESTIONS = 50
 TYPES_URI = BASE_URI + "/types/"
 EXERCISES_URI = BASE_URI + "/exercises/"
 USER_TRAININGS_URI = "/users/{user_id}/trainings"
@@ -70,6 +108,41 @@ CONFIGURATION = to_config(AppConfig)
 START = time.time()
 NR_APP = register_application()
 COUNTER = {"count": 1}
+MEDIA_CACHE = LRUCache(
+    max_size=CONFIGURATION.firebase.media_cache_size,
+    ttl=CONFIGURATION.firebase.media_cache_ttl,
+    sizeof=len,
+)
+TRAINING_CACHE = TrainingCache(
+    create_backend(CONFIGURATION, CONFIGURATION.cache.training_size),
+    ttl=CONFIGURATION.cache.training_ttl,
+    encode=get_encoder(CONFIGURATION),
+)
+SEARCH_CACHE = SearchCache(
+    create_backend(CONFIGURATION, CONFIGURATION.cache.search_size),
+    ttl=CONFIGURATION.cache.search_ttl,
+)
+READS = SingleFlight(
+    on_coalesced=lambda _: record_metric(
+        'Custom/reads/coalesced', COUNTER, NR_APP
+    ),
+    on_timeout=lambda _: record_metric(
+        'Custom/reads/coalescing-timeout', COUNTER, NR_APP
+    ),
+)
+REFERENCE_DATA.max_age = CONFIGURATION.reference_max_age
+TITLE_INDEX = TitleIndex(max_age=CONFIGURATION.titles_max_age)
+TYPES_CATALOG = Catalog(serialize_training_types)
+EXERCISES_CATALOG = Catalog(serialize_exercises)
+CATALOG_CACHE_CONTROL = f"public, max-age={CONFIGURATION.catalog_max_age}"
+AUTH_CLIENT = create_http_client(CONFIGURATION)
+CREDENTIALS_CACHE = CredentialsCache(
+    max_size=CONFIGURATION.auth.cache_size,
+    ttl=CONFIGURATION.auth.cache_ttl,
+    negative_ttl=CONFIGURATION.auth.cache_negative_ttl,
+) if CONFIGURATION.auth.cache_ttl else None
+TOKEN_VERIFIER = TokenVerifier(CONFIGURATION)\
+    if CONFIGURATION.auth.mode == "local" else None
 
 app = FastAPI(
     debug=CONFIGURATION.log_level.upper() == "DEBUG",
@@ -102,11 +175,7 @@ app.add_middleware(
 
 logging.basicConfig(encoding="utf-8", level=CONFIGURATION.log_level.upper())
 
-ENGINE = create_engine(
-    get_database_url(CONFIGURATION),
-    connect_args={"sslmode": "require" if CONFIGURATION.db.ssl else "disable"},
-    pool_pre_ping=True,
-)
+ENGINE = get_engine(CONFIGURATION)
 
 
 def get_db() -> Session:
@@ -119,22 +188,118 @@ if CONFIGURATION.db.create_structures:
     init_db(get_db())
 
 
+@app.on_event("startup")
+async def set_request_threads() -> None:
+    """Size the threadpool running request handlers and blocking calls."""
+    current_default_thread_limiter().total_tokens = \
+        CONFIGURATION.request_threads
+
+
+@app.on_event("startup")
+def load_reference_data() -> None:
+    """Load training types, difficulties and exercises in memory."""
+    try:
+        with get_db() as session:
+            data = REFERENCE_DATA.refresh(session)
+        TYPES_CATALOG.get(data)
+        EXERCISES_CATALOG.get(data)
+    except SQLAlchemyError as error:
+        logging.error("Could not load reference data: %s", error)
+
+
+@app.on_event("startup")
+def load_title_index() -> None:
+    """Index training titles to suggest them by prefix."""
+    try:
+        with get_db() as session:
+            TITLE_INDEX.load(session)
+    except SQLAlchemyError as error:
+        logging.error("Could not index training titles: %s", error)
+
+
+@app.on_event("shutdown")
+def close_http_clients() -> None:
+    """Close connections to other services."""
+    AUTH_CLIENT.close()
+
+
+def get_serialized_trainings(
+    ids: List[int], load: Callable[[List[int]], List[TrainingRecord]]
+) -> List[bytes]:
+    """Return serialized trainings by id, loading those not in cache."""
+    cached = {training_id: TRAINING_CACHE.get(training_id)
+              for training_id in ids}
+    missing = [training_id for training_id in ids
+               if cached[training_id] is None]
+    if missing:
+        logging.info("Building DTOs for %s trainings...", len(missing))
+        records = load(missing)
+        dtos = hydrate_records(records, CONFIGURATION, MEDIA_CACHE)
+        for record, dto in zip(records, dtos):
+            cached[dto.id] = TRAINING_CACHE.set(dto.id, dto, record.version)
+    return [cached[training_id].body for training_id in ids
+            if cached[training_id] is not None]
+
+
+def serialize_trainings(records: List[TrainingRecord]) -> List[bytes]:
+    """Return loaded trainings serialized, building those not in cache."""
+    return get_serialized_trainings(
+        [record.id for record in records],
+        lambda missing: [
+            record for record in records if record.id in missing
+        ],
+    )
+
+
+def search_serialized(
+    session: Session, filters: TrainingFilters, include_count: bool, key: str
+) -> bytes:
+    """Return page of trainings matching filters, serialized.
+
+    Pages are cached by key, trainings are cached by id.
+    """
+    page = SEARCH_CACHE.get(key)
+    with session as open_session:
+        if page is None:
+            record_metric('Custom/trainings/cache-miss', COUNTER, NR_APP)
+            rows, count = search(open_session, filters, include_count)
+            trainings, next_cursor = get_page(rows, filters.limit)
+            page = SearchPage(
+                [training.id for training in trainings], count, next_cursor
+            )
+            SEARCH_CACHE.set(key, page)
+            items = serialize_trainings(trainings)
+        else:
+            items = get_serialized_trainings(
+                page.ids, lambda missing: load_records(open_session, missing)
+            )
+    return serialize_page(
+        items, filters.offset, filters.limit, page.count, page.next_cursor
+    )
+
+
 # pylint: disable=too-many-arguments
 @app.get(
     BASE_URI,
     response_model=TrainingsWithPagination,
     response_model_exclude_none=True,
 )
-async def get_trainings(
+def get_trainings(
     trainer_id: str | None = None,
     training_type: str | None = None,
     difficulty: str | None = None,
     title: str | None = None,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
+    include_count: bool = True,
     session: Session = Depends(get_db)
 ) -> TrainingsWithPagination:
-    """Get trainings matching a filtering criteria."""
+    """Get trainings matching a filtering criteria.
+
+    Pages are selected by offset, or by the next_cursor of a previous page.
+    Clients that do not need the total count can skip it with include_count.
+    """
     record_metric('Custom/trainings/get', COUNTER, NR_APP)
     filters = TrainingFilters(
         trainer_id=trainer_id,
@@ -143,22 +308,101 @@ async def get_trainings(
         title=title,
         offset=offset,
         limit=limit,
+        cursor=cursor,
     )
     logging.info("Searching for trainings matching (%s)...", filters.dict())
+    key = SEARCH_CACHE.get_key(filters, include_count)
+    serialized = READS.do(
+        ("search", key),
+        lambda: search_serialized(session, filters, include_count, key),
+        CONFIGURATION.coalescing_timeout,
+    )
+    return Response(serialized, media_type="application/json")
+
+
+@app.get(EXPORT_URI, response_class=StreamingResponse)
+def export_trainings(
+    *,
+    trainer_id: str | None = None,
+    training_type: str | None = None,
+    difficulty: str | None = None,
+    title: str | None = None,
+    include_media: bool = False,
+    gzip: bool = False,
+    session: Session = Depends(get_db),
+) -> StreamingResponse:
+    """Stream every training matching filters as NDJSON, sorted by id.
+
+    Trainings are read from a server side cursor in batches, so memory does
+    not grow with the catalog. With gzip the stream is gzip encoded. The
+    session is closed once the response ends, even if it never started.
+    """
+    record_metric('Custom/trainings-export/get', COUNTER, NR_APP)
+    filters = TrainingFilters(
+        offset=0,
+        limit=0,
+        trainer_id=trainer_id,
+        type=training_type,
+        difficulty=difficulty,
+        title=title,
+    )
+    logging.info("Exporting trainings matching (%s)...", filters.dict())
+    try:
+        criteria = get_criteria(session, filters)
+    except HTTPException:
+        session.close()
+        raise
+    chunks = export(
+        session, criteria, CONFIGURATION, include_media, MEDIA_CACHE
+    )
+    headers = {"Content-Encoding": "gzip"} if gzip else None
+    return StreamingResponse(
+        compress(chunks) if gzip else chunks,
+        media_type="application/x-ndjson",
+        headers=headers,
+        background=BackgroundTask(session.close),
+    )
+
+
+@app.get(SUGGEST_URI, response_model=TitleSuggestions)
+def suggest_titles(
+    prefix: str,
+    limit: int = 10,
+    session: Session = Depends(get_db),
+) -> TitleSuggestions:
+    """Get training titles starting with prefix, ignoring case and accents.
+
+    Titles come from an in-memory index, the database is only read when the
+    index is built.
+    """
+    record_metric('Custom/trainings-titles-suggest/get', COUNTER, NR_APP)
+    if TITLE_INDEX.is_stale():
+        def load() -> None:
+            with session as open_session:
+                TITLE_INDEX.load(open_session)
+
+        READS.do(("titles",), load, CONFIGURATION.coalescing_timeout)
+    if not prefix.strip():
+        return TitleSuggestions(items=[])
+    return TitleSuggestions(items=[
+        TitleSuggestion(id=training_id, title=title)
+        for training_id, title in TITLE_INDEX.suggest(
+            prefix, max(min(limit, MAX_SUGGESTIONS), 0)
+        )
+    ])
+
+
+def read_serialized(session: Session, training_id: int) -> CachedTraining:
+    """Read a training from the database and cache it serialized."""
+    record_metric('Custom/trainings-id/cache-miss', COUNTER, NR_APP)
     with session as open_session:
-        trainings = browse(open_session, filters)
-        count = get_training_count(open_session, filters)
-    dtos = []
-    logging.info("Building DTOs...")
-    for training in trainings:
-        dtos.append(hydrate_dto(training, CONFIGURATION))
-    response = TrainingsWithPagination(
-        items=dtos,
-        offset=filters.offset,
-        limit=filters.limit,
-        count=count,
+        training = read_training(open_session, training_id)
+    logging.info("Building DTO...")
+    return TRAINING_CACHE.set(
+        training_id,
+        hydrate_page([training], CONFIGURATION, MEDIA_CACHE)[0],
+        training.version,
     )
-    return response
 
 
 @app.get(
@@ -167,23 +411,46 @@ async def get_trainings(
     response_model_exclude_none=True,
     status_code=201,
 )
-async def get_training(
+def get_training(
     training_id: int,
+    if_none_match: str | None = Header(default=None),
     session: Session = Depends(get_db)
 ) -> TrainingOut:
-    """Get one training."""
+    """Get one training, from cache when it did not change.
+
+    When If-None-Match has the training ETag, answer 304 without building
+    the training.
+    """
     record_metric('Custom/trainings-id/get', COUNTER, NR_APP)
-    with session as open_session:
-        training = read_training(open_session, training_id)
-    logging.info("Building DTO...")
-    return hydrate_dto(training, CONFIGURATION)
+    cached = TRAINING_CACHE.get(training_id)
+    if cached is None and if_none_match:
+        with session as open_session:
+            version = read_version(open_session, training_id)
+        etag = make_etag(training_id, version)
+        if version is not None and matches(if_none_match, etag):
+            return not_modified(etag)
+    if cached is None:
+        cached = READS.do(
+            ("training", training_id),
+            lambda: read_serialized(session, training_id),
+            CONFIGURATION.coalescing_timeout,
+        )
+    etag = make_etag(training_id, cached.version)
+    if matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(
+        cached.body,
+        status_code=201,
+        media_type="application/json",
+        headers={"ETag": etag},
+    )
 
 
 @app.patch(
     BASE_URI + "/{training_id}",
     status_code=204,
 )
-async def modify_training(
+def modify_training(
     training_id: int,
     body: TrainingPatch,
     session: Session = Depends(get_db),
@@ -203,10 +470,30 @@ async def modify_training(
                 training.trainer_id,
                 CONFIGURATION
             )
+            if training.media:
+                MEDIA_CACHE.invalidate(training.media)
         logging.info(
             "Updating values (%s) of %s.", columns_and_values, training_id
         )
-        edit(open_session, training_id, columns_and_values)
+        version = edit(open_session, training_id, columns_and_values)
+    TRAINING_CACHE.invalidate(training_id, version)
+    SEARCH_CACHE.bump()
+    if "title" in columns_and_values:
+        TITLE_INDEX.set(training_id, columns_and_values["title"])
+
+
+def authorize_creation(request: Request) -> None:
+    """Throw HTTP error unless request comes from a user creating trainings."""
+    if not CONFIGURATION.auth.validate_credentials:
+        return
+    logging.info("Validating permissions. Headers: %s", request.headers)
+    if TOKEN_VERIFIER:
+        permissions = verify_permissions(request.headers, TOKEN_VERIFIER)
+    else:
+        permissions = get_permissions(
+            request.headers, AUTH_CLIENT, CONFIGURATION, CREDENTIALS_CACHE
+        )
+    assert_can_create_training(permissions)
 
 
 @app.post(
@@ -214,16 +501,13 @@ async def modify_training(
     response_model=TrainingOut,
     response_model_exclude_none=True,
 )
-async def create_training(
+def create_training(
     request: Request,
     training_to_create: TrainingIn,
     session: Session = Depends(get_db)
 ) -> TrainingOut:
     """Create a training."""
-    if CONFIGURATION.auth.validate_credentials:
-        logging.info("Validating permissions. Headers: %s", request.headers)
-        permissions = get_permissions(request.headers, Client(), CONFIGURATION)
-        assert_can_create_training(permissions)
+    authorize_creation(request)
     if training_to_create.media:
         logging.info("Saving media...")
         training_to_create.media = save(
@@ -235,21 +519,65 @@ async def create_training(
     record_metric('Custom/trainings/post', COUNTER, NR_APP)
     with session as open_session:
         created_training = add(
-            open_session, hydrate_model(open_session, training_to_create)
+            open_session, *hydrate_model(open_session, training_to_create)
         )
+    SEARCH_CACHE.bump()
+    TITLE_INDEX.set(created_training.id, created_training.title)
     return hydrate_dto(created_training, CONFIGURATION)
 
 
+@app.post(
+    BULK_URI,
+    response_model=BulkImportResult,
+    response_model_exclude_none=True,
+)
+def import_trainings(
+    request: Request,
+    body: bytes = Body(media_type="application/x-ndjson"),
+    session: Session = Depends(get_db),
+) -> BulkImportResult:
+    """Create trainings from NDJSON, one training per line.
+
+    Every line gets a result with its status, failed lines do not stop the
+    import.
+    """
+    authorize_creation(request)
+    record_metric('Custom/trainings-bulk/post', COUNTER, NR_APP)
+    with session as open_session:
+        result = import_lines(open_session, body.splitlines(), CONFIGURATION)
+        if result.created:
+            TITLE_INDEX.set_many(read_titles(open_session, [
+                item.id for item in result.items if item.id is not None
+            ]))
+    if result.created:
+        SEARCH_CACHE.bump()
+    return result
+
+
+def get_catalog(
+    catalog: Catalog, if_none_match: str | None, session: Session
+) -> Response:
+    """Return serialized catalog, or 304 if reference data did not change."""
+    with session as open_session:
+        data = REFERENCE_DATA.get(open_session)
+    etag = make_etag(data.version)
+    if matches(if_none_match, etag):
+        return not_modified(etag)
+    return Response(
+        catalog.get(data),
+        media_type="application/json",
+        headers={"ETag": etag, "Cache-Control": CATALOG_CACHE_CONTROL},
+    )
+
+
 @app.get(TYPES_URI, response_model=TrainingTypesOut)
-async def get_types(session: Session = Depends(get_db)) -> TrainingTypesOut:
-    """Get training types."""
+def get_types(
+    if_none_match: str | None = Header(default=None),
+    session: Session = Depends(get_db),
+) -> TrainingTypesOut:
+    """Get training types, serialized once per reference data version."""
     record_metric('Custom/trainings-types/get', COUNTER, NR_APP)
-    logging.info("Searching for training types...")
-    training_types = []
-    with session as open_session:
-        training_types = browse_types(open_session)
-    logging.info("Building DTOs...")
-    return hydrate_training_types(training_types)
+    return get_catalog(TYPES_CATALOG, if_none_match, session)
 
 
 @app.get(
@@ -257,19 +585,17 @@ async def get_types(session: Session = Depends(get_db)) -> TrainingTypesOut:
     response_model=ExercisesOut,
     response_model_exclude_none=True,
 )
-async def get_exercises(session: Session = Depends(get_db)) -> ExercisesOut:
-    """Get training exercises."""
+def get_exercises(
+    if_none_match: str | None = Header(default=None),
+    session: Session = Depends(get_db),
+) -> ExercisesOut:
+    """Get training exercises, serialized once per reference data version."""
     record_metric('Custom/trainings-exercises/get', COUNTER, NR_APP)
-    logging.info("Searching for exercises...")
-    exercises = []
-    with session as open_session:
-        exercises = browse_exercises(open_session)
-    logging.info("Building DTOs...")
-    return hydrate_exercises(exercises)
+    return get_catalog(EXERCISES_CATALOG, if_none_match, session)
 
 
 @app.post(USER_TRAININGS_URI, status_code=204)
-async def save_training_for_user(
+def save_training_for_user(
     user_id: str,
     training: UserTrainingIn,
     session: Session = Depends(get_db),
@@ -280,8 +606,9 @@ async def save_training_for_user(
     )
     record_metric('Custom/users-id-trainings/post', COUNTER, NR_APP)
     with session as open_session:
-        read_training(open_session, training.training_id)
-        read_user(open_session, user_id)
+        assert_user_and_training_exist(
+            open_session, user_id, training.training_id, training_first=True
+        )
         try:
             add_user_training(open_session, user_id, training.training_id)
         except IntegrityError as exc:
@@ -292,7 +619,7 @@ async def save_training_for_user(
 
 
 @app.delete(USER_TRAINING_URI, status_code=204)
-async def delete_training_for_user(
+def delete_training_for_user(
     user_id: str,
     training_id: int,
     session: Session = Depends(get_db),
@@ -301,13 +628,14 @@ async def delete_training_for_user(
     logging.info("Deleting training %s for user %s...", training_id, user_id)
     record_metric('Custom/users-id-trainings-id/delete', COUNTER, NR_APP)
     with session as open_session:
-        read_training(open_session, training_id)
-        read_user(open_session, user_id)
+        assert_user_and_training_exist(
+            open_session, user_id, training_id, training_first=True
+        )
         delete_user_training(open_session, user_id, training_id)
 
 
 @app.put(USER_TRAINING_URI, status_code=204)
-async def rate_training(
+def rate_training(
     user_id: str,
     training_id: str,
     rating: TrainingRating,
@@ -319,16 +647,23 @@ async def rate_training(
     )
     record_metric('Custom/users-id-trainings-id/put', COUNTER, NR_APP)
     with session as open_session:
-        read_user(open_session, user_id)
-        read_training(open_session, training_id)
-        add_rating(open_session, user_id, training_id, rating.rate)
+        try:
+            version = add_rating(
+                open_session, user_id, training_id, rating.rate
+            )
+        except IntegrityError:
+            logging.info("Could not rate, checking user and training...")
+            open_session.rollback()
+            assert_user_and_training_exist(open_session, user_id, training_id)
+            raise
+    TRAINING_CACHE.invalidate(training_id, version)
 
 
 @app.get(
     USER_TRAINING_URI + "/rating",
     response_model=TrainingRating,
 )
-async def get_user_rate_for_training(
+def get_user_rate_for_training(
     user_id: str,
     training_id: str,
     session: Session = Depends(get_db),
@@ -337,8 +672,6 @@ async def get_user_rate_for_training(
     logging.info("Getting training %s rate by user %s", user_id, training_id)
     record_metric('Custom/users-id-trainings-id-rating/get', COUNTER, NR_APP)
     with session as open_session:
-        read_user(open_session, user_id)
-        read_training(open_session, training_id)
         rating = read_rating(open_session, user_id, training_id)
     return TrainingRating(rate=rating.rating)
 
@@ -348,31 +681,26 @@ async def get_user_rate_for_training(
     response_model=TrainingsWithPagination,
     response_model_exclude_none=True,
 )
-async def get_favourite_training_for_user(
+def get_favourite_training_for_user(
     user_id: str,
     offset: int = 0,
     limit: int = 10,
+    cursor: str | None = None,
     session: Session = Depends(get_db),
 ) -> TrainingsWithPagination:
     """Return a user favourite trainings."""
     logging.info("Getting trainings for user %s...", user_id)
     record_metric('Custom/users-id-trainings/get', COUNTER, NR_APP)
+    filters = TrainingFilters(offset=offset, limit=limit, cursor=cursor)
     with session as open_session:
-        read_user(open_session, user_id)
-        # The following returns a Users database model with it's favourite
-        # trainings.
-        user = browse_user_trainings(open_session, user_id, offset, limit)
-        count = get_favourite_trainings_count(open_session, user_id)
-    dtos = []
-    logging.info("Building DTOs...")
-    for user_trainings in user.trainings:
-        logging.debug("Building DTO of %s...", user_trainings.__dict__)
-        dtos.append(hydrate_dto(user_trainings.training, CONFIGURATION))
-    return TrainingsWithPagination(
-        items=dtos,
-        offset=offset,
-        limit=limit,
-        count=count,
+        assert_user_exists(open_session, user_id)
+        rows, count = search_user_trainings(open_session, user_id, filters)
+    trainings, next_cursor = get_page(rows, limit)
+    return Response(
+        serialize_page(
+            serialize_trainings(trainings), offset, limit, count, next_cursor
+        ),
+        media_type="application/json",
     )
 
 
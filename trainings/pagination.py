@@ -0,0 +1,43 @@
+"""Keyset pagination with opaque cursors."""
+import json
+import logging
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from binascii import Error as DecodingError
+from typing import List, Optional, Tuple, TypeVar
+
+from fastapi import HTTPException, status
+
+T = TypeVar("T")
+
+
+def encode_cursor(last_id: int) -> str:
+    """Return an opaque cursor pointing after last_id."""
+    payload = json.dumps({"id": last_id}).encode("utf-8")
+    return urlsafe_b64encode(payload).decode("ascii")
+
+
+def decode_cursor(cursor: str) -> int:
+    """Return the id a cursor points after, or throw HTTP 400 error."""
+    try:
+        last_id = json.loads(urlsafe_b64decode(cursor.encode("ascii")))["id"]
+    except (DecodingError, UnicodeError, ValueError, TypeError, KeyError) as e:
+        logging.warning("Invalid cursor %s: %s", cursor, e)
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        ) from e
+    if not isinstance(last_id, int):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor."
+        )
+    return last_id
+
+
+def get_page(rows: List[T], limit: int) -> Tuple[List[T], Optional[str]]:
+    """Split rows fetched with limit + 1 into page and next page cursor.
+
+    Rows must be sorted by id and have an id attribute.
+    """
+    if len(rows) <= limit:
+        return rows, None
+    page = rows[:limit]
+    return page, encode_cursor(page[-1].id) if page else None
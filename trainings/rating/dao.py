@@ -1,6 +1,13 @@
 """DAO for training ratings by a user."""
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import (
+    ScalarSelect, Select, Update, case, func, select, update
+)
+from sqlalchemy.dialects.postgresql import insert as postgres_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.orm import Session
-from trainings.database.models import UserRatesTraining
+from trainings.database.models import Training, UserRatesTraining
 
 
 def read(
@@ -13,20 +20,125 @@ def read(
     ).one()
 
 
-def add(
-    session: Session, user_id: int, training_id: int, rating: float
-) -> None:
-    """Rate a training."""
-    query = session.query(UserRatesTraining).where(
+def update_aggregates(
+    training_id: int, rating_delta: Any, count_delta: Any
+) -> Update:
+    """Return statement adding deltas to training rating aggregates.
+
+    Training version is incremented too, and returned.
+    """
+    return update(Training).where(Training.id == training_id).values(
+        rating_sum=Training.rating_sum + rating_delta,
+        rating_count=Training.rating_count + count_delta,
+        rating_average=(Training.rating_sum + rating_delta)
+        / (Training.rating_count + count_delta),
+        version=Training.version + 1,
+    ).returning(Training.version)
+
+
+def get_rating_aggregates(training_id: Any) -> Tuple[ScalarSelect, ...]:
+    """Return sum and count of user ratings of a training.
+
+    training_id may be a value or a column to correlate with.
+    """
+    rating_sum = select(func.coalesce(func.sum(UserRatesTraining.rating), 0))\
+        .where(UserRatesTraining.training_id == training_id)\
+        .scalar_subquery()
+    rating_count = select(func.count(UserRatesTraining.rating))\
+        .where(UserRatesTraining.training_id == training_id)\
+        .scalar_subquery()
+    return rating_sum, rating_count
+
+
+def recompute_aggregates(training_id: int) -> Update:
+    """Return statement recomputing training rating aggregates from ratings.
+
+    Training version is incremented too, and returned.
+    """
+    rating_sum, rating_count = get_rating_aggregates(training_id)
+    return update(Training).where(Training.id == training_id).values(
+        rating_sum=rating_sum,
+        rating_count=rating_count,
+        rating_average=case(
+            (rating_count > 0, rating_sum / rating_count), else_=0
+        ),
+        version=Training.version + 1,
+    ).returning(Training.version)
+
+
+def lock_training(training_id: int) -> Select:
+    """Return statement locking a training row until the transaction ends."""
+    return select(Training.id).where(Training.id == training_id)\
+        .with_for_update()
+
+
+def get_postgres_upsert(
+    user_id: int, training_id: int, rating: float
+) -> Update:
+    """Return one statement that rates a training and updates aggregates.
+
+    The previous rating is read in the same statement to compute the
+    deltas. Run it after lock_training, in a new statement, so ratings of
+    the training committed while waiting for the lock are in its snapshot.
+    """
+    previous = select(UserRatesTraining.rating).where(
         UserRatesTraining.user_id == user_id,
         UserRatesTraining.training_id == training_id,
+    ).with_for_update().cte("previous")
+    rated = postgres_insert(UserRatesTraining).values(
+        user_id=user_id, training_id=training_id, rating=rating
+    ).on_conflict_do_update(
+        index_elements=[
+            UserRatesTraining.user_id, UserRatesTraining.training_id
+        ],
+        set_={"rating": rating},
+    ).returning(UserRatesTraining.rating).cte("rated")
+    previous_rating = select(previous.c.rating).scalar_subquery()
+    previous_count = select(func.count()).select_from(previous)\
+        .scalar_subquery()
+    return update_aggregates(
+        training_id,
+        func.coalesce(rating - previous_rating, rating),
+        1 - previous_count,
+    ).add_cte(previous, rated)
+
+
+def upsert_locally(
+    session: Session, user_id: int, training_id: int, rating: float
+) -> Optional[int]:
+    """Rate a training and update aggregates in SQLite, for local runs.
+
+    The upsert takes the database write lock, so aggregates recomputed
+    after it in the same transaction include every committed rating.
+    Return the new training version.
+    """
+    session.execute(
+        sqlite_insert(UserRatesTraining)
+        .values(user_id=user_id, training_id=training_id, rating=rating)
+        .on_conflict_do_update(
+            index_elements=["user_id", "training_id"],
+            set_={"rating": rating},
+        )
     )
-    if query.first():
-        query.update(values={"rating": rating})
-    else:
-        session.add(
-            UserRatesTraining(
-                user_id=user_id, training_id=training_id, rating=rating
-            )
+    return session.scalar(recompute_aggregates(training_id))
+
+
+def add(
+    session: Session, user_id: int, training_id: int, rating: float
+) -> Optional[int]:
+    """Rate a training, updating training rating aggregates.
+
+    Ratings of the same training are serialized by locking the training
+    first, so concurrent first ratings by a user are counted once.
+    Return the new training version.
+    Raises IntegrityError when user or training do not exist.
+    """
+    if session.get_bind().dialect.name == "postgresql":
+        session.execute(lock_training(training_id))
+        version = session.scalar(
+            get_postgres_upsert(user_id, training_id, rating)
         )
+    else:
+        version = upsert_locally(session, user_id, training_id, rating)
     session.commit()
+    return version
@@ -0,0 +1,35 @@
+"""Helper queries for training ratings."""
+import logging
+
+from sqlalchemy import case, or_
+from sqlalchemy.orm import Session
+from trainings.database.models import Training
+from trainings.rating.dao import get_rating_aggregates
+
+
+def reconcile_aggregates(session: Session) -> int:
+    """Recompute rating aggregates of trainings from user ratings.
+
+    Only trainings whose aggregates drifted are updated, and their version
+    incremented. Return how many were updated.
+    """
+    logging.info("Running rating aggregates update query...")
+    rating_sum, rating_count = get_rating_aggregates(Training.id)
+    updated = session.query(Training).filter(
+        or_(
+            Training.rating_sum != rating_sum,
+            Training.rating_count != rating_count,
+        )
+    ).update(
+        values={
+            Training.version: Training.version + 1,
+            Training.rating_sum: rating_sum,
+            Training.rating_count: rating_count,
+            Training.rating_average: case(
+                (rating_count > 0, rating_sum / rating_count), else_=0
+            ),
+        },
+        synchronize_session=False,
+    )
+    session.commit()
+    return updated
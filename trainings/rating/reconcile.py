@@ -0,0 +1,25 @@
+"""Recompute training rating aggregates.
+
+Run with: python -m trainings.rating.reconcile
+"""
+import logging
+
+from environ import to_config
+from sqlalchemy.orm import Session
+
+from trainings.config import AppConfig
+from trainings.database.url import get_engine
+from trainings.rating.non_bread_queries import reconcile_aggregates
+
+
+def main() -> None:
+    """Recompute rating aggregates of trainings that drifted."""
+    config = to_config(AppConfig)
+    logging.basicConfig(encoding="utf-8", level=config.log_level.upper())
+    with Session(bind=get_engine(config)) as session:
+        updated = reconcile_aggregates(session)
+    logging.warning("Reconciled rating aggregates of %s trainings.", updated)
+
+
+if __name__ == "__main__":
+    main()
@@ -2,6 +2,7 @@
 import logging
 
 from fastapi import HTTPException, status
+from sqlalchemy import exists, select
 from sqlalchemy.orm.exc import NoResultFound
 from sqlalchemy.orm import Session
 
@@ -33,14 +34,63 @@ def read_training(open_session: Session, training_id: int) -> Training:
         ) from error
 
 
+def assert_user_exists(open_session: Session, user_id: int) -> None:
+    """Throw HTTP 404 error if user does not exist, without loading it."""
+    logging.info("Checking that userId %s exists...", user_id)
+    if not open_session.scalar(select(exists().where(Users.id == user_id))):
+        raise HTTPException(
+            detail="User not found.", status_code=status.HTTP_404_NOT_FOUND
+        )
+
+
+def assert_user_and_training_exist(
+    open_session: Session,
+    user_id: int,
+    training_id: int,
+    training_first: bool = False,
+) -> None:
+    """Throw HTTP 404 error if user or training do not exist.
+
+    Both are checked in one query without loading them. When both are
+    missing the user error is thrown, unless training_first is set.
+    """
+    logging.info(
+        "Checking that userId %s and trainingId %s exist...",
+        user_id,
+        training_id,
+    )
+    user_exists, training_exists = open_session.execute(
+        select(
+            exists().where(Users.id == user_id),
+            exists().where(Training.id == training_id),
+        )
+    ).one()
+    user_error = HTTPException(
+        detail="User not found.", status_code=status.HTTP_404_NOT_FOUND
+    )
+    training_error = HTTPException(
+        detail="Training not found.", status_code=status.HTTP_404_NOT_FOUND
+    )
+    errors = [(user_exists, user_error), (training_exists, training_error)]
+    if training_first:
+        errors.reverse()
+    for found, error in errors:
+        if not found:
+            raise error
+
+
 def read_rating(
     open_session: Session, user_id: int, training_id: int
 ) -> Training:
-    """Get rating of a training by a user or throw HTTP 404 error."""
+    """Get rating of a training by a user or throw HTTP 404 error.
+
+    User and training are only checked when the rating is not found.
+    """
     try:
         logging.info("Searching for rating...")
         return rating_dao_read(open_session, user_id, training_id)
     except NoResultFound as error:
+        assert_user_and_training_exist(open_session, user_id, training_id)
         raise HTTPException(
             detail="Rating not found.", status_code=status.HTTP_404_NOT_FOUND
         ) from error
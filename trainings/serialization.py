@@ -0,0 +1,34 @@
+"""Serialize trusted DTOs to JSON bytes."""
+from typing import Callable
+
+from pydantic import BaseModel  # pylint: disable=no-name-in-module
+
+from trainings.config import AppConfig
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # pylint: disable=invalid-name
+
+Encoder = Callable[[BaseModel], bytes]
+
+
+def dump_model(model: BaseModel) -> bytes:
+    """Return model as JSON without nulls, using pydantic."""
+    return model.json(exclude_none=True).encode("utf-8")
+
+
+def dump_fast(model: BaseModel) -> bytes:
+    """Return model as JSON without nulls, using orjson."""
+    if orjson is None:
+        raise RuntimeError("Install orjson to serialize with it.")
+    return orjson.dumps(  # pylint: disable=no-member
+        model.dict(exclude_none=True)
+    )
+
+
+def get_encoder(config: AppConfig) -> Encoder:
+    """Return orjson encoder when enabled and installed, else pydantic's."""
+    if config.fast_json and orjson is not None:
+        return dump_fast
+    return dump_model
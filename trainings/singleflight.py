@@ -0,0 +1,80 @@
+"""Collapse concurrent calls for the same key into one."""
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class SingleFlight:
+    """Run one call per key at a time, concurrent callers share its result.
+
+    Callers arriving while a call for their key is running wait for it and
+    get its result or its exception, coalesced counts them. Callers that
+    wait longer than their timeout make the call themselves, timeouts counts
+    them. on_coalesced and on_timeout are called with the key, for metrics.
+    """
+
+    def __init__(
+        self,
+        on_coalesced: Optional[Callable[[Hashable], None]] = None,
+        on_timeout: Optional[Callable[[Hashable], None]] = None,
+    ):
+        self.coalesced = 0
+        self.timeouts = 0
+        self.on_coalesced = on_coalesced
+        self.on_timeout = on_timeout
+        self._calls: Dict[Hashable, Future] = {}
+        self._lock = Lock()
+
+    def do(
+        self,
+        key: Hashable,
+        function: Callable[[], Any],
+        timeout: Optional[float] = None,
+    ) -> Any:
+        """Return function result, sharing it with concurrent callers.
+
+        A timeout of None or 0 waits for the running call without limit.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = self._calls[key] = Future()
+                is_leader = True
+            else:
+                self.coalesced += 1
+                is_leader = False
+        if not is_leader:
+            return self._wait(key, call, function, timeout or None)
+        try:
+            result = function()
+        except BaseException as error:
+            call.set_exception(error)
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+        call.set_result(result)
+        return result
+
+    def stats(self) -> Dict[str, int]:
+        """Return how many calls were coalesced and how many timed out."""
+        return {"coalesced": self.coalesced, "timeouts": self.timeouts}
+
+    def _wait(
+        self,
+        key: Hashable,
+        call: Future,
+        function: Callable[[], Any],
+        timeout: Optional[float],
+    ) -> Any:
+        """Wait for the running call, or call function after timeout."""
+        if self.on_coalesced is not None:
+            self.on_coalesced(key)
+        try:
+            return call.result(timeout)
+        except FutureTimeoutError:
+            with self._lock:
+                self.timeouts += 1
+            if self.on_timeout is not None:
+                self.on_timeout(key)
+            return function()
@@ -1,12 +1,8 @@
-"""Hydrate DTOs from database objects."""
-from typing import List
-from trainings.database.models import TrainingType
+"""Hydrate DTOs from reference data."""
+from trainings.database.reference import ReferenceData
 from trainings.training_types.dto import TrainingTypesOut
 
 
-def hydrate(training_types: List[TrainingType]) -> TrainingTypesOut:
-    """Create an HTTP DTO from a database model object."""
-    training_types_out = TrainingTypesOut(items=[])
-    for training_type in training_types:
-        training_types_out.items.append(training_type.name)
-    return training_types_out
+def serialize(data: ReferenceData) -> bytes:
+    """Return training types DTO from reference data, as JSON."""
+    return TrainingTypesOut(items=list(data.types)).json().encode("utf-8")
@@ -0,0 +1,208 @@
+"""Create many trainings at once from NDJSON, one TrainingIn per line.
+
+Run with: python -m trainings.trainings.bulk [file], reading standard input
+when no file is given. Results are printed as JSON.
+"""
+import argparse
+import json
+import logging
+import sys
+from typing import Any, Dict, Iterable, List, NamedTuple, Tuple
+
+from environ import to_config
+from fastapi import HTTPException, status
+from pydantic import ValidationError
+from sqlalchemy import insert
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm import Session
+
+from trainings.cache import create_backend
+from trainings.config import AppConfig
+from trainings.database.hydrator import get_rows
+from trainings.database.models import Training, TrainingExercise
+from trainings.database.url import get_engine
+from trainings.firebase import save_many
+from trainings.trainings.cache import SearchCache
+from trainings.trainings.dto import (
+    BulkImportResult,
+    BulkItemResult,
+    TrainingIn,
+)
+
+
+class PendingTraining(NamedTuple):
+    """Training rows ready to insert, with the line they came from."""
+
+    line: int
+    training: Dict[str, Any]
+    exercises: List[Dict[str, Any]]
+
+
+def failed(line: int, status_code: int, detail: Any) -> BulkItemResult:
+    """Return result of a line that was not imported."""
+    logging.warning("Could not import line %s: %s", line, detail)
+    return BulkItemResult(line=line, status=status_code, detail=str(detail))
+
+
+def parse(
+    lines: Iterable[bytes | str],
+) -> Tuple[List[Tuple[int, TrainingIn]], List[BulkItemResult]]:
+    """Return trainings by line number, and results of invalid lines.
+
+    Lines are numbered from 1, blank lines are skipped.
+    """
+    trainings = []
+    results = []
+    for line, text in enumerate(lines, start=1):
+        if not text.strip():
+            continue
+        try:
+            trainings.append((line, TrainingIn.parse_obj(json.loads(text))))
+        except (ValueError, ValidationError) as error:
+            results.append(
+                failed(line, status.HTTP_422_UNPROCESSABLE_ENTITY, error)
+            )
+    return trainings, results
+
+
+def resolve(
+    session: Session, trainings: List[Tuple[int, TrainingIn]]
+) -> Tuple[List[PendingTraining], List[BulkItemResult]]:
+    """Return rows of trainings, and results of those with unknown names.
+
+    Names are resolved in memory through the reference data registry.
+    """
+    pending = []
+    results = []
+    for line, training in trainings:
+        try:
+            pending.append(PendingTraining(line, *get_rows(session, training)))
+        except HTTPException as error:
+            results.append(failed(line, error.status_code, error.detail))
+    return pending, results
+
+
+def save_medias(
+    pending: List[PendingTraining], config: AppConfig
+) -> Tuple[List[PendingTraining], List[BulkItemResult]]:
+    """Upload medias concurrently, replacing them by their ids.
+
+    Return trainings ready to insert, and results of failed uploads.
+    """
+    with_media = [item for item in pending if item.training["media"]]
+    media_ids = save_many(
+        [
+            (item.training["media"], item.training["trainer_id"])
+            for item in with_media
+        ],
+        config,
+    )
+    failed_lines = set()
+    results = []
+    for item, media_id in zip(with_media, media_ids):
+        if media_id is None:
+            failed_lines.add(item.line)
+            results.append(failed(
+                item.line,
+                status.HTTP_502_BAD_GATEWAY,
+                "Could not save training media.",
+            ))
+        else:
+            item.training["media"] = media_id
+    return [
+        item for item in pending if item.line not in failed_lines
+    ], results
+
+
+def insert_chunk(
+    session: Session, chunk: List[PendingTraining]
+) -> List[BulkItemResult]:
+    """Insert trainings and their exercises in one transaction.
+
+    Trainings are inserted by one multi-row statement returning their ids,
+    exercises by another one.
+    """
+    try:
+        training_ids = session.scalars(
+            insert(Training).returning(
+                Training.id, sort_by_parameter_order=True
+            ),
+            [item.training for item in chunk],
+        ).all()
+        exercises = [
+            exercise | {"training_id": training_id}
+            for item, training_id in zip(chunk, training_ids)
+            for exercise in item.exercises
+        ]
+        if exercises:
+            session.execute(insert(TrainingExercise), exercises)
+        session.commit()
+    except SQLAlchemyError as error:
+        logging.error("Could not insert %s trainings: %s", len(chunk), error)
+        session.rollback()
+        return [
+            failed(
+                item.line,
+                status.HTTP_500_INTERNAL_SERVER_ERROR,
+                "Could not save training.",
+            )
+            for item in chunk
+        ]
+    return [
+        BulkItemResult(
+            line=item.line, status=status.HTTP_201_CREATED, id=training_id
+        )
+        for item, training_id in zip(chunk, training_ids)
+    ]
+
+
+def import_trainings(
+    session: Session, lines: Iterable[bytes | str], config: AppConfig
+) -> BulkImportResult:
+    """Create trainings from NDJSON lines, reporting a result per line.
+
+    Lines that fail do not stop the import. Trainings are inserted in
+    chunks of config.bulk_chunk_size, each chunk in its own transaction.
+    """
+    trainings, results = parse(lines)
+    logging.info("Importing %s trainings...", len(trainings))
+    pending, unresolved = resolve(session, trainings)
+    pending, unsaved = save_medias(pending, config)
+    results += unresolved + unsaved
+    chunk_size = max(config.bulk_chunk_size, 1)
+    for start in range(0, len(pending), chunk_size):
+        results += insert_chunk(session, pending[start:start + chunk_size])
+    created = sum(
+        1 for result in results if result.status == status.HTTP_201_CREATED
+    )
+    logging.info("Imported %s trainings.", created)
+    return BulkImportResult(
+        created=created,
+        failed=len(results) - created,
+        items=sorted(results, key=lambda result: result.line),
+    )
+
+
+def main() -> None:
+    """Import trainings from an NDJSON file into the database."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument(
+        "file",
+        nargs="?",
+        type=argparse.FileType("rb"),
+        default=sys.stdin.buffer,
+        help="NDJSON file, one training per line",
+    )
+    arguments = parser.parse_args()
+    config = to_config(AppConfig)
+    logging.basicConfig(encoding="utf-8", level=config.log_level.upper())
+    with Session(bind=get_engine(config)) as session:
+        result = import_trainings(session, arguments.file, config)
+    if result.created:
+        SearchCache(create_backend(config, 0)).bump()
+    sys.stdout.write(result.json(exclude_none=True) + "\n")
+    sys.exit(1 if result.failed else 0)
+
+
+if __name__ == "__main__":
+    main()
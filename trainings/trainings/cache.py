@@ -0,0 +1,186 @@
+"""Cache serialized trainings by id, and searches by filters."""
+import json
+from hashlib import sha1
+from threading import Lock
+from typing import List, NamedTuple, Optional
+from uuid import uuid4
+
+from trainings.cache import CacheBackend
+from trainings.serialization import Encoder, dump_model
+from trainings.trainings.dto import TrainingFilters, TrainingOut
+
+GENERATION_KEY = "search:generation"
+
+
+def get_key(training_id: int | str) -> str:
+    """Return cache key for a training."""
+    return f"training:{training_id}"
+
+
+class CachedTraining(NamedTuple):
+    """Serialized training and the version it was built from."""
+
+    version: int
+    body: bytes
+
+
+class TrainingCache:
+    """Keep TrainingOut serialized as JSON, ready to be sent.
+
+    Writes to a training must call invalidate with the version they
+    committed, so the next read builds it again from the database. The
+    version is kept as a marker, and set never replaces an entry or marker
+    by an older version: a read that started before the write cannot cache
+    what it read. Trainings are serialized with encode.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: Optional[float] = None,
+        encode: Encoder = dump_model,
+    ):
+        self.backend = backend
+        self.ttl = ttl or None
+        self.encode = encode
+        self._lock = Lock()
+
+    def read(self, training_id: int | str) -> Optional[CachedTraining]:
+        """Return cached entry, with an empty body for markers."""
+        serialized = self.backend.get(get_key(training_id))
+        if serialized is None:
+            return None
+        version, body = serialized.split(b"\n", 1)
+        return CachedTraining(int(version), body)
+
+    def get(self, training_id: int | str) -> Optional[CachedTraining]:
+        """Return serialized training or None when not cached."""
+        cached = self.read(training_id)
+        return cached if cached and cached.body else None
+
+    def store(self, training_id: int | str, cached: CachedTraining) -> None:
+        """Cache entry unless an entry of a newer version is cached.
+
+        Checking and storing is atomic in this replica only, replicas
+        sharing a backend may still race within that window.
+        """
+        with self._lock:
+            current = self.read(training_id)
+            if current and current.version > cached.version:
+                return
+            self.backend.set(
+                get_key(training_id),
+                str(cached.version).encode("ascii") + b"\n" + cached.body,
+                self.ttl,
+            )
+
+    def set(
+        self, training_id: int | str, training: TrainingOut, version: int
+    ) -> CachedTraining:
+        """Serialize and cache training, return serialized training.
+
+        Nothing is cached when training was written after version.
+        """
+        cached = CachedTraining(version, self.encode(training))
+        self.store(training_id, cached)
+        return cached
+
+    def invalidate(
+        self, training_id: int | str, version: Optional[int] = None
+    ) -> None:
+        """Forget training, call it after every write with its new version.
+
+        Without version the training is deleted, and older reads may cache
+        it again.
+        """
+        if version is None:
+            self.backend.delete(get_key(training_id))
+        else:
+            self.store(training_id, CachedTraining(version, b""))
+
+
+class SearchPage(NamedTuple):
+    """Ids of the trainings in a search result page."""
+
+    ids: List[int]
+    count: Optional[int]
+    next_cursor: Optional[str]
+
+
+def normalize(filters: TrainingFilters, include_count: bool) -> str:
+    """Return filters as text, equal for filters selecting the same page.
+
+    Empty values do not filter, and offset is ignored when using a cursor.
+    """
+    values = {
+        name: value if value != "" else None
+        for name, value in filters.dict().items()
+    }
+    if values["cursor"]:
+        values["offset"] = 0
+    values["include_count"] = include_count
+    return json.dumps(values, sort_keys=True)
+
+
+class SearchCache:
+    """Keep ids and count of search result pages for ttl seconds.
+
+    Entries are keyed by normalized filters and a generation, writes to
+    trainings call bump to start a new generation so older entries are
+    never read again. Trainings themselves are kept in TrainingCache.
+    """
+
+    def __init__(self, backend: CacheBackend, ttl: Optional[float] = None):
+        self.backend = backend
+        self.ttl = ttl or None
+
+    def get_generation(self) -> str:
+        """Return current generation, starting one if there is none."""
+        generation = self.backend.get(GENERATION_KEY)
+        if generation is None:
+            return self.bump()
+        return generation.decode("utf-8")
+
+    def bump(self) -> str:
+        """Start a new generation, call it after every training write."""
+        generation = uuid4().hex
+        self.backend.set(GENERATION_KEY, generation.encode("utf-8"), None)
+        return generation
+
+    def get_key(self, filters: TrainingFilters, include_count: bool) -> str:
+        """Return cache key for filters in the current generation."""
+        digest = sha1(
+            normalize(filters, include_count).encode("utf-8")
+        ).hexdigest()
+        return f"search:{self.get_generation()}:{digest}"
+
+    def get(self, key: str) -> Optional[SearchPage]:
+        """Return cached page or None when not cached."""
+        serialized = self.backend.get(key)
+        if serialized is None:
+            return None
+        return SearchPage(*json.loads(serialized))
+
+    def set(self, key: str, page: SearchPage) -> None:
+        """Cache page."""
+        self.backend.set(key, json.dumps(page).encode("utf-8"), self.ttl)
+
+
+def serialize_page(
+    items: List[bytes],
+    offset: int,
+    limit: int,
+    count: Optional[int],
+    next_cursor: Optional[str],
+) -> bytes:
+    """Return TrainingsWithPagination JSON made of serialized trainings."""
+    pagination = {
+        "offset": offset,
+        "limit": limit,
+        "count": count,
+        "next_cursor": next_cursor,
+    }
+    fields = json.dumps({
+        name: value for name, value in pagination.items() if value is not None
+    }).encode("utf-8")
+    return b'{"items":[' + b",".join(items) + b"]," + fields[1:]
@@ -1,40 +1,57 @@
 """DAO with B.R.E.A.D. functions for trainings."""
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List, Optional
 
+from sqlalchemy import insert, select, update
 from sqlalchemy.orm import Session
-from trainings.database.models import Training
-from trainings.trainings.dto import TrainingFilters
-from trainings.trainings.helper import get_criteria
-
-
-def browse(session: Session, filters: TrainingFilters):
-    """Return all trainings matching filters."""
-    logging.info("Running query...")
-    return session.query(Training).filter(*get_criteria(session, filters))\
-        .offset(filters.offset).limit(filters.limit).all()
+from trainings.database.loaders import TRAINING_DETAIL
+from trainings.database.models import Training, TrainingExercise
 
 
 def read(session: Session, training_id: int) -> Training:
-    """Return one training filtering by fields."""
-    return session.query(Training).filter(
+    """Return one training filtering by fields, with what its DTO shows."""
+    return session.query(Training).options(*TRAINING_DETAIL).filter(
         Training.id == training_id,
     ).one()
 
 
-def edit(session: Session, training_id: int, fields_to_update: Dict[str, Any]):
-    """Update fields in a training."""
+def edit(
+    session: Session, training_id: int, fields_to_update: Dict[str, Any]
+) -> Optional[int]:
+    """Update fields in a training, returning its incremented version."""
     logging.info("Running update query...")
-    session.query(Training)\
-        .filter(Training.id == training_id)\
-        .update(values=fields_to_update)
+    version = session.scalar(
+        update(Training)
+        .where(Training.id == training_id)
+        .values(fields_to_update | {"version": Training.version + 1})
+        .returning(Training.version)
+    )
     session.commit()
+    return version
+
+
+def read_version(session: Session, training_id: int) -> Optional[int]:
+    """Return training version, or None if the training does not exist."""
+    return session.scalar(
+        select(Training.version).where(Training.id == training_id)
+    )
 
 
-def add(session: Session, training: Training) -> Training:
-    """Create a training."""
+def add(
+    session: Session,
+    training: Training,
+    exercises: Optional[List[Dict[str, Any]]] = None,
+) -> Training:
+    """Create a training, inserting its exercises rows in bulk."""
     logging.info("Saving training...")
     session.add(training)
+    session.flush()
+    training_id = training.id
+    if exercises:
+        logging.info("Saving %s training exercises...", len(exercises))
+        rows = [
+            exercise | {"training_id": training_id} for exercise in exercises
+        ]
+        session.execute(insert(TrainingExercise), rows)
     session.commit()
-    session.refresh(training)
-    return training
+    return read(session, training_id)
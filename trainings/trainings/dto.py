@@ -41,6 +41,7 @@ class TrainingsWithPagination(BaseModel):
     offset: Optional[int]
     limit: Optional[int]
     count: Optional[int]
+    next_cursor: Optional[str]
 
 
 class TrainingFilters(BaseModel):
@@ -48,6 +49,7 @@ class TrainingFilters(BaseModel):
 
     offset: int
     limit: int
+    cursor: Optional[str]
     trainer_id: Optional[str]
     type: Optional[str]
     difficulty: Optional[str]
@@ -62,3 +64,33 @@ class TrainingPatch(BaseModel):
     difficulty: Optional[str]
     media: Optional[str]
     blocked: Optional[bool]
+
+
+class BulkItemResult(BaseModel):
+    """Result of importing one NDJSON line."""
+
+    line: int
+    status: int
+    id: Optional[int]
+    detail: Optional[str]
+
+
+class BulkImportResult(BaseModel):
+    """Results of a bulk import, one item per NDJSON line."""
+
+    created: int
+    failed: int
+    items: List[BulkItemResult]
+
+
+class TitleSuggestion(BaseModel):
+    """Training title matching a prefix."""
+
+    id: int
+    title: str
+
+
+class TitleSuggestions(BaseModel):
+    """Training titles matching a prefix."""
+
+    items: List[TitleSuggestion]
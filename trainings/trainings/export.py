@@ -0,0 +1,131 @@
+"""Export trainings as NDJSON, one TrainingOut per line sorted by id.
+
+Run with: python -m trainings.trainings.export [filters] > trainings.ndjson
+"""
+import argparse
+import logging
+import sys
+import zlib
+from typing import Iterable, Iterator, List, Optional
+
+from environ import to_config
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from trainings.cache import LRUCache
+from trainings.config import AppConfig
+from trainings.database.models import Training
+from trainings.database.url import get_engine
+from trainings.firebase import read_many
+from trainings.serialization import get_encoder
+from trainings.trainings.dto import TrainingFilters
+from trainings.trainings.helper import get_criteria
+from trainings.trainings.hydrator import hydrate_record
+from trainings.trainings.read_model import (
+    TrainingRecord,
+    iter_records,
+    select_records,
+)
+
+
+def stream_records(
+    session: Session, criteria: List, batch_size: int
+) -> Iterator[List[TrainingRecord]]:
+    """Yield batches of records matching criteria, sorted by id.
+
+    Rows are read with a server side cursor, batch_size trainings at a time.
+    """
+    page = select(Training.id).where(*criteria).subquery()
+    rows = session.execute(
+        select_records(page), execution_options={"yield_per": batch_size}
+    )
+    batch: List[TrainingRecord] = []
+    for record in iter_records(rows):
+        batch.append(record)
+        if len(batch) == batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def export(
+    session: Session,
+    criteria: List,
+    config: AppConfig,
+    include_media: bool = False,
+    cache: Optional[LRUCache] = None,
+) -> Iterator[bytes]:
+    """Yield NDJSON chunks of trainings matching criteria.
+
+    Memory is bounded by config.export_batch_size trainings. Medias are
+    only downloaded with include_media, each batch concurrently.
+    """
+    encode = get_encoder(config)
+    exported = 0
+    for batch in stream_records(
+        session, criteria, max(config.export_batch_size, 1)
+    ):
+        medias = read_many(
+            [record.media for record in batch if record.media],
+            config,
+            cache,
+        ) if include_media else {}
+        yield b"".join(
+            encode(hydrate_record(record, medias)) + b"\n"
+            for record in batch
+        )
+        exported += len(batch)
+    logging.info("Exported %s trainings.", exported)
+
+
+def compress(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Yield chunks compressed as one gzip stream."""
+    compressor = zlib.compressobj(wbits=16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def main() -> None:
+    """Export trainings from the database as NDJSON."""
+    parser = argparse.ArgumentParser(description=main.__doc__)
+    parser.add_argument("--trainer-id")
+    parser.add_argument("--type")
+    parser.add_argument("--difficulty")
+    parser.add_argument("--title", help="title prefix")
+    parser.add_argument(
+        "--media", action="store_true", help="download training medias"
+    )
+    parser.add_argument(
+        "--gzip", action="store_true", help="compress output with gzip"
+    )
+    parser.add_argument(
+        "--output",
+        type=argparse.FileType("wb"),
+        default=sys.stdout.buffer,
+        help="file to write, standard output when missing",
+    )
+    arguments = parser.parse_args()
+    config = to_config(AppConfig)
+    logging.basicConfig(encoding="utf-8", level=config.log_level.upper())
+    filters = TrainingFilters(
+        offset=0,
+        limit=0,
+        trainer_id=arguments.trainer_id,
+        type=arguments.type,
+        difficulty=arguments.difficulty,
+        title=arguments.title,
+    )
+    with Session(bind=get_engine(config)) as session:
+        chunks = export(
+            session, get_criteria(session, filters), config, arguments.media
+        )
+        for chunk in compress(chunks) if arguments.gzip else chunks:
+            arguments.output.write(chunk)
+
+
+if __name__ == "__main__":
+    main()
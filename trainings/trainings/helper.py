@@ -3,10 +3,11 @@ import logging
 from typing import Any, Dict, List
 
 from fastapi import HTTPException
-from sqlalchemy.orm.exc import NoResultFound
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Query, Session
 
-from trainings.database.models import Difficulty, Training, TrainingType
+from trainings.database.models import Training
+from trainings.database.reference import REFERENCE_DATA
+from trainings.pagination import decode_cursor
 from trainings.trainings.dto import TrainingFilters, TrainingPatch
 
 
@@ -19,32 +20,41 @@ def get_criteria(session: Session, filters: TrainingFilters) -> List:
     if filters.title:
         criteria.append(Training.title.like(filters.title + "%"))
     if filters.type:
-        try:
-            criteria.append(
-                Training.type == session.query(TrainingType).filter(
-                    TrainingType.name == filters.type,
-                ).one()
-            )
-        except NoResultFound as error:
+        type_id = REFERENCE_DATA.type_id(session, filters.type)
+        if type_id is None:
             detail = f"Could not save training. Type {filters.type} not found."
             logging.warning(detail)
-            raise HTTPException(detail=detail, status_code=400) from error
+            raise HTTPException(detail=detail, status_code=400)
+        criteria.append(Training.type_id == type_id)
     if filters.difficulty:
-        try:
-            criteria.append(
-                Training.difficulty == session.query(Difficulty).filter(
-                    Difficulty.name == filters.difficulty,
-                ).one()
-            )
-        except NoResultFound as error:
+        difficulty_id = REFERENCE_DATA.difficulty_id(
+            session, filters.difficulty
+        )
+        if difficulty_id is None:
             detail = "Could not save training. "\
                 + f"Difficulty {filters.difficulty} not found."
             logging.warning(detail)
-            raise HTTPException(detail=detail, status_code=400) from error
+            raise HTTPException(detail=detail, status_code=400)
+        criteria.append(Training.difficulty_id == difficulty_id)
     logging.debug("Search criteria: %s", criteria)
     return criteria
 
 
+def get_page_query(query: Query, filters: TrainingFilters) -> Query:
+    """Sort query by training id and select the page asked in filters.
+
+    When filters have a cursor, trainings after it are selected instead of
+    skipping offset trainings. One more training than limit is selected, to
+    know if there is a next page.
+    """
+    query = query.order_by(Training.id)
+    if filters.cursor:
+        query = query.filter(Training.id > decode_cursor(filters.cursor))
+    else:
+        query = query.offset(filters.offset)
+    return query.limit(filters.limit + 1)
+
+
 def get_columns_and_values(patch_values: TrainingPatch) -> Dict[str, Any]:
     """Translate body of patch method into update query columns and values."""
     columns_and_values = {
@@ -1,21 +1,31 @@
 """Hydrate DTOs from database objects."""
 import logging
-from statistics import mean
+from typing import Dict, List, Optional
+from trainings.cache import LRUCache
 from trainings.config import AppConfig
 from trainings.database.models import Training
-from trainings.firebase import read
+from trainings.firebase import read, read_many
 from trainings.trainings.dto import (Exercise, TrainingOut)
+from trainings.trainings.read_model import TrainingRecord
 
 
-def hydrate(training: Training, config: AppConfig) -> TrainingOut:
-    """Create an HTTP DTO from a model object."""
+def hydrate(
+    training: Training,
+    config: AppConfig,
+    medias: Optional[Dict[str, Optional[str]]] = None,
+) -> TrainingOut:
+    """Create an HTTP DTO from a model object.
+
+    When medias were already downloaded, pass them by name to avoid reading
+    from firebase again.
+    """
     logging.debug("Creating DTO for %s", training)
     media = None
     if training.media:
-        media = read(str(training.media), config)
-    rating = 0
-    if training.ratings:
-        rating = mean(map(lambda rate: rate.rating, training.ratings))
+        if medias is not None and training.media in medias:
+            media = medias[str(training.media)]
+        else:
+            media = read(str(training.media), config)
     dto = TrainingOut(
         id=int(training.id),
         trainer_id=str(training.trainer_id),
@@ -25,7 +35,7 @@ def hydrate(training: Training, config: AppConfig) -> TrainingOut:
         type=str(training.type.name),
         media=media,
         blocked=bool(training.blocked),
-        rating=rating,
+        rating=training.rating_average or 0,
         exercises=[],
     )
     logging.info("Creating DTO for training exercises...")
@@ -41,3 +51,63 @@ def hydrate(training: Training, config: AppConfig) -> TrainingOut:
             )
         )
     return dto
+
+
+def hydrate_page(
+    trainings: List[Training],
+    config: AppConfig,
+    cache: Optional[LRUCache] = None,
+) -> List[TrainingOut]:
+    """Create HTTP DTOs for a page, downloading all medias concurrently."""
+    logging.info("Downloading medias for %s trainings...", len(trainings))
+    medias = read_many(
+        [str(training.media) for training in trainings if training.media],
+        config,
+        cache,
+    )
+    logging.info("Building DTOs...")
+    return [hydrate(training, config, medias) for training in trainings]
+
+
+def hydrate_record(
+    record: TrainingRecord, medias: Dict[str, Optional[str]]
+) -> TrainingOut:
+    """Create an HTTP DTO from a record, with medias already downloaded.
+
+    Records come from the database, so DTOs are built without validation.
+    """
+    return TrainingOut.construct(
+        id=record.id,
+        trainer_id=record.trainer_id,
+        title=record.title,
+        description=record.description,
+        difficulty=record.difficulty,
+        type=record.type,
+        media=medias.get(record.media) if record.media else None,
+        blocked=bool(record.blocked),
+        rating=int(record.rating or 0),
+        exercises=[
+            Exercise.construct(
+                name=exercise.name,
+                type=exercise.type,
+                unit=exercise.unit,
+                count=exercise.count,
+                series=exercise.series,
+            )
+            for exercise in record.exercises
+        ],
+    )
+
+
+def hydrate_records(
+    records: List[TrainingRecord],
+    config: AppConfig,
+    cache: Optional[LRUCache] = None,
+) -> List[TrainingOut]:
+    """Create HTTP DTOs for records, downloading all medias concurrently."""
+    logging.info("Downloading medias for %s trainings...", len(records))
+    medias = read_many(
+        [record.media for record in records if record.media], config, cache
+    )
+    logging.info("Building DTOs...")
+    return [hydrate_record(record, medias) for record in records]
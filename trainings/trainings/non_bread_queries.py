@@ -1,14 +1,41 @@
 """Helper queries for trainings."""
 import logging
+from typing import List, Optional, Tuple
 
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 from trainings.database.models import Training
 from trainings.trainings.dto import TrainingFilters
-from trainings.trainings.helper import get_criteria
+from trainings.trainings.helper import get_criteria, get_page_query
+from trainings.trainings.read_model import TrainingRecord, read_page
 
 
-def get_count(session: Session, filters: TrainingFilters) -> int:
-    """Return how many trainings match filters."""
-    logging.info("Running count query...")
-    return session.query(Training).filter(*get_criteria(session, filters))\
-        .count()
+def search(
+    session: Session, filters: TrainingFilters, include_count: bool = True
+) -> Tuple[List[TrainingRecord], Optional[int]]:
+    """Return the page of trainings matching filters and how many match.
+
+    Page and count come from the same query, count is None when not
+    included. See get_page_query for the page and read_model for records.
+    """
+    criteria = get_criteria(session, filters)
+    columns = [Training.id]
+    if include_count:
+        columns.append(
+            select(func.count(Training.id)).where(*criteria)
+            .correlate(None).scalar_subquery().label("count")
+        )
+    page = get_page_query(
+        session.query(*columns).filter(*criteria), filters
+    ).subquery()
+    logging.info("Running query...")
+    records, count = read_page(session, page)
+    if not include_count:
+        return records, None
+    if records:
+        return records, count
+    if filters.cursor or filters.offset:
+        logging.info("Page is empty, running count query...")
+        return [], session.query(func.count(Training.id))\
+            .filter(*criteria).scalar()
+    return [], 0
@@ -0,0 +1,144 @@
+"""Read trainings for lists as plain records, without ORM instances.
+
+Trainings and their exercises come from one flat query selecting only the
+columns lists need. Rows are grouped into records sorted by training id.
+"""
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from sqlalchemy import Select, Subquery, select
+from sqlalchemy.orm import Session, aliased
+
+from trainings.database.models import (
+    Difficulty,
+    Exercise,
+    Training,
+    TrainingExercise,
+    TrainingType,
+)
+
+ExerciseType = aliased(TrainingType)
+
+
+class ExerciseRecord:
+    """Exercise within a training."""
+
+    __slots__ = ("name", "type", "unit", "count", "series")
+
+    def __init__(
+        self,
+        name: str,
+        exercise_type: str,
+        unit: Optional[str],
+        count: int,
+        series: Optional[int],
+    ):
+        self.name = name
+        self.type = exercise_type
+        self.unit = unit
+        self.count = count
+        self.series = series
+
+
+class TrainingRecord:  # pylint: disable=too-many-instance-attributes
+    """Training with the fields lists show."""
+
+    __slots__ = (
+        "id",
+        "trainer_id",
+        "title",
+        "description",
+        "type",
+        "difficulty",
+        "media",
+        "blocked",
+        "rating",
+        "version",
+        "exercises",
+    )
+
+    def __init__(self, row: Tuple):
+        (
+            self.id,
+            self.trainer_id,
+            self.title,
+            self.description,
+            self.type,
+            self.difficulty,
+            self.media,
+            self.blocked,
+            self.rating,
+            self.version,
+        ) = row[:10]
+        self.exercises: List[ExerciseRecord] = []
+
+
+def select_records(page: Subquery) -> Select:
+    """Return query of trainings in page, one row per training exercise.
+
+    page must have an id column, and may have a count column that is
+    selected last.
+    """
+    columns = [
+        Training.id,
+        Training.trainer_id,
+        Training.title,
+        Training.description,
+        TrainingType.name,
+        Difficulty.name,
+        Training.media,
+        Training.blocked,
+        Training.rating_average,
+        Training.version,
+        Exercise.name,
+        ExerciseType.name,
+        Exercise.unit,
+        TrainingExercise.count,
+        TrainingExercise.series,
+    ]
+    if "count" in page.c:
+        columns.append(page.c.count)
+    exercises = TrainingExercise.training_id == Training.id
+    return (
+        select(*columns)
+        .join_from(page, Training, Training.id == page.c.id)
+        .join(TrainingType, TrainingType.id == Training.type_id)
+        .join(Difficulty, Difficulty.id == Training.difficulty_id)
+        .outerjoin(TrainingExercise, exercises)
+        .outerjoin(Exercise, Exercise.id == TrainingExercise.exercise_id)
+        .outerjoin(ExerciseType, ExerciseType.id == Exercise.type_id)
+        .order_by(Training.id, TrainingExercise.id)
+    )
+
+
+def iter_records(rows: Iterable[Tuple]) -> Iterator[TrainingRecord]:
+    """Group rows sorted by training id into records, as rows arrive."""
+    record = None
+    for row in rows:
+        if record is None or record.id != row[0]:
+            if record is not None:
+                yield record
+            record = TrainingRecord(row)
+        if row[10] is not None:
+            record.exercises.append(ExerciseRecord(*row[10:15]))
+    if record is not None:
+        yield record
+
+
+def to_records(rows: List[Tuple]) -> List[TrainingRecord]:
+    """Group rows sorted by training id into records."""
+    return list(iter_records(rows))
+
+
+def read_page(
+    session: Session, page: Subquery
+) -> Tuple[List[TrainingRecord], Optional[int]]:
+    """Return records of trainings in page, and page count column if any."""
+    rows = session.execute(select_records(page)).all()
+    count = rows[0][15] if rows and "count" in page.c else None
+    return to_records(rows), count
+
+
+def load_records(session: Session, ids: List[int]) -> List[TrainingRecord]:
+    """Return records of trainings with the given ids, sorted by id."""
+    page = select(Training.id).where(Training.id.in_(ids)).subquery()
+    return read_page(session, page)[0]
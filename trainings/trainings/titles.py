@@ -0,0 +1,100 @@
+"""Suggest training titles by prefix from an in-memory sorted index."""
+import logging
+import time
+import unicodedata
+from bisect import bisect_left, insort
+from threading import Lock
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from trainings.database.models import Training
+
+
+def normalize(title: str) -> str:
+    """Return title without accents, case or surrounding spaces."""
+    decomposed = unicodedata.normalize("NFKD", title.strip())
+    return "".join(
+        character for character in decomposed
+        if not unicodedata.combining(character)
+    ).casefold()
+
+
+def read_titles(
+    session: Session, training_ids: Optional[List[int]] = None
+) -> List[Tuple[int, str]]:
+    """Return (id, title) of trainings, of every training without ids."""
+    query = select(Training.id, Training.title)
+    if training_ids is not None:
+        query = query.where(Training.id.in_(training_ids))
+    return [(row.id, row.title) for row in session.execute(query)]
+
+
+class TitleIndex:
+    """Keep (normalized title, training id) sorted to find titles by prefix.
+
+    The index is built from the database on first use, and again when older
+    than max_age seconds so writes made by other replicas show up. Writes
+    in this replica call set to update it right away.
+    """
+
+    def __init__(self, max_age: Optional[float] = None):
+        self.max_age = max_age
+        self._entries: List[Tuple[str, int]] = []
+        self._titles: Dict[int, str] = {}
+        self._loaded_at: Optional[float] = None
+        self._lock = Lock()
+
+    def load(self, session: Session) -> None:
+        """Build the index from every training title."""
+        titles = dict(read_titles(session))
+        entries = sorted(
+            (normalize(title), training_id)
+            for training_id, title in titles.items() if title
+        )
+        with self._lock:
+            self._titles = titles
+            self._entries = entries
+            self._loaded_at = time.monotonic()
+        logging.info("Indexed %s training titles.", len(entries))
+
+    def is_stale(self) -> bool:
+        """Return whether the index must be built before searching."""
+        return self._loaded_at is None or bool(
+            self.max_age and time.monotonic() - self._loaded_at > self.max_age
+        )
+
+    def set(self, training_id: int, title: Optional[str]) -> None:
+        """Add a training title, replacing its previous title if any."""
+        with self._lock:
+            previous = self._titles.pop(training_id, None)
+            if previous:
+                entry = (normalize(previous), training_id)
+                position = bisect_left(self._entries, entry)
+                if self._entries[position:position + 1] == [entry]:
+                    del self._entries[position]
+            if title:
+                self._titles[training_id] = title
+                insort(self._entries, (normalize(title), training_id))
+
+    def set_many(self, titles: Iterable[Tuple[int, str]]) -> None:
+        """Add several (training id, title)."""
+        for training_id, title in titles:
+            self.set(training_id, title)
+
+    def suggest(self, prefix: str, limit: int) -> List[Tuple[int, str]]:
+        """Return up to limit (training id, title) whose title has prefix.
+
+        Matches are sorted by normalized title, then by training id.
+        """
+        normalized = normalize(prefix)
+        with self._lock:
+            position = bisect_left(self._entries, (normalized, -1))
+            matches = []
+            for index in range(position, len(self._entries)):
+                title, training_id = self._entries[index]
+                if len(matches) == limit or not title.startswith(normalized):
+                    break
+                matches.append((training_id, self._titles[training_id]))
+        return matches
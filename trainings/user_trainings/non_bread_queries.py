@@ -1,7 +1,13 @@
 """Helper queries for users's favourite trainings."""
 import logging
+from typing import List, Tuple
+
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
-from trainings.database.models import UserTraining
+from trainings.database.models import Training, UserTraining
+from trainings.trainings.dto import TrainingFilters
+from trainings.trainings.helper import get_page_query
+from trainings.trainings.read_model import TrainingRecord, read_page
 
 
 def get_count(session: Session, user_id: str) -> int:
@@ -10,3 +16,29 @@ def get_count(session: Session, user_id: str) -> int:
     return session.query(UserTraining).filter(
         UserTraining.user_id == user_id
     ).count()
+
+
+def search(
+    session: Session, user_id: str, filters: TrainingFilters
+) -> Tuple[List[TrainingRecord], int]:
+    """Return the page of favourite trainings and how many a user has.
+
+    Page and count come from the same query, see get_page_query for the page
+    and read_model for records.
+    """
+    logging.info("Running query with count...")
+    count = select(func.count(UserTraining.training_id))\
+        .where(UserTraining.user_id == user_id)\
+        .correlate(None).scalar_subquery().label("count")
+    page = get_page_query(
+        session.query(Training.id, count)
+        .join(UserTraining, UserTraining.training_id == Training.id)
+        .filter(UserTraining.user_id == user_id),
+        filters,
+    ).subquery()
+    records, page_count = read_page(session, page)
+    if records:
+        return records, page_count
+    if filters.cursor or filters.offset:
+        return [], get_count(session, user_id)
+    return [], 0